@@ -0,0 +1,180 @@
+import os
+import sqlite3
+import subprocess
+import time
+from typing import Any, List, Optional, Tuple
+
+from common import file_hash
+
+HISTORY_DB = os.path.join("benchmarks", "history.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded_at REAL NOT NULL,
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    size INTEGER,
+    input_hash TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    git_commit TEXT,
+    median REAL NOT NULL,
+    min REAL NOT NULL,
+    p95 REAL NOT NULL,
+    samples INTEGER NOT NULL
+)
+"""
+
+
+def connect(path: str = HISTORY_DB) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute(SCHEMA)
+    return conn
+
+
+def git_commit() -> Optional[str]:
+    """Current HEAD, suffixed with `-dirty` when the tree has local edits."""
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "diff", "--quiet", "HEAD"]).returncode != 0
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{head}-dirty" if dirty else head
+
+
+def record_run(
+    year: int,
+    day: int,
+    part: int,
+    input_hash: str,
+    source_path: str,
+    median: float,
+    minimum: Optional[float] = None,
+    p95: Optional[float] = None,
+    samples: int = 1,
+    kind: str = "time",
+    size: Optional[int] = None,
+    path: str = HISTORY_DB,
+) -> None:
+    """Appends one timing measurement to the history store."""
+    with connect(path) as conn:
+        conn.execute(
+            "INSERT INTO runs (recorded_at, year, day, part, kind, size, input_hash,"
+            " source_hash, git_commit, median, min, p95, samples)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                time.time(),
+                year,
+                day,
+                part,
+                kind,
+                size,
+                input_hash,
+                file_hash(source_path),
+                git_commit(),
+                median,
+                median if minimum is None else minimum,
+                median if p95 is None else p95,
+                samples,
+            ),
+        )
+
+
+def compare(
+    threshold: float = 0.10,
+    baseline: Optional[str] = None,
+    path: str = HISTORY_DB,
+) -> List[Tuple[Any, ...]]:
+    """
+    Compares the latest median of every (year, day, part, kind, size, input) with
+    its baseline: the newest run recorded at `baseline` commit, or by default the
+    newest run from any earlier commit.
+
+    Returns rows of (year, day, part, kind, size, base_median, latest_median,
+    ratio, regressed).
+    """
+    with connect(path) as conn:
+        rows = conn.execute(
+            "SELECT year, day, part, kind, size, input_hash, git_commit, median"
+            " FROM runs ORDER BY id"
+        ).fetchall()
+
+    series: dict[tuple, list[tuple[Optional[str], float]]] = {}
+    for year, day, part, kind, size, input_hash, commit, median in rows:
+        key = (year, day, part, kind, size, input_hash)
+        series.setdefault(key, []).append((commit, median))
+
+    out = []
+    for (year, day, part, kind, size, _), runs in sorted(
+        series.items(), key=lambda kv: (kv[0][:4], kv[0][4] or 0)
+    ):
+        latest_commit, latest = runs[-1]
+        if baseline is not None:
+            base_runs = [m for c, m in runs if c is not None and c.startswith(baseline)]
+        else:
+            base_runs = [m for c, m in runs if c != latest_commit]
+        if not base_runs:
+            continue
+        base = base_runs[-1]
+        ratio = latest / base if base > 0 else float("inf")
+        out.append(
+            (year, day, part, kind, size, base, latest, ratio, ratio > 1 + threshold)
+        )
+    return out
+
+
+def print_compare(
+    threshold: float = 0.10, baseline: Optional[str] = None, path: str = HISTORY_DB
+) -> int:
+    """Prints the comparison table and returns the number of regressions."""
+    rows = compare(threshold, baseline, path)
+    if not rows:
+        print("No baseline runs to compare against.")
+        return 0
+
+    print("Year | Day | Part | Kind  |    Size | Baseline (s) |   Latest (s) | Change")
+    for year, day, part, kind, size, base, latest, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        size_str = "-" if size is None else str(size)
+        print(
+            f"{year} | {day:3} | {part:4} | {kind:5} | {size_str:>7} | "
+            f"{base:12.6f} | {latest:12.6f} | {ratio - 1:+7.1%}{flag}"
+        )
+
+    regressions = sum(1 for row in rows if row[-1])
+    print(f"\n{regressions} regression(s) above {threshold:.0%}")
+    return regressions
+
+
+def test_compare_flags_regressions(tmp_path, monkeypatch):
+    db = str(tmp_path / "history.sqlite")
+    source = tmp_path / "day01.py"
+    source.write_text("x = 1\n")
+    commits = iter(["aaa", "aaa", "bbb", "bbb", "ccc"])
+    monkeypatch.setitem(globals(), "git_commit", lambda: next(commits))
+
+    def record(part, median, size=None):
+        record_run(2015, 1, part, "input", str(source), median, size=size, path=db)
+
+    record(1, 1.0)  # aaa
+    record(2, 1.0)  # aaa
+    record(1, 1.05)  # bbb: within the threshold
+    record(2, 2.0)  # bbb: twice as slow
+    record(1, 0.5, size=100)  # ccc: a new series with nothing to compare to
+
+    rows = compare(threshold=0.10, path=db)
+    assert [(r[2], r[5], r[6], r[8]) for r in rows] == [
+        (1, 1.0, 1.05, False),
+        (2, 1.0, 2.0, True),
+    ]
+    assert print_compare(path=db) == 1
+    assert [r[6] for r in compare(baseline="aaa", path=db)] == [1.05, 2.0]
+    assert compare(baseline="zzz", path=db) == []
@@ -0,0 +1,312 @@
+import copy
+import html
+import json
+import os
+import platform
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.history import git_commit, record_run
+from common import file_hash, read_input
+from registry import load_problem, registry
+from supervisor import run_limited
+
+REPORT_JSON = os.path.join("benchmarks", "report.json")
+REPORT_HTML = os.path.join("benchmarks", "report.html")
+PHASES = ("input", "parse", "solve")
+
+
+@dataclass
+class BenchResult:
+    year: int
+    day: int
+    part: int
+    source: str  # "real" puzzle input or "generated"
+    size: Optional[int] = None
+    # best seconds per phase: "input" is reading the file or generating it
+    phases: Dict[str, float] = field(default_factory=dict)
+    result: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+    @property
+    def label(self) -> str:
+        return f"{self.year} day {self.day:02d} part {self.part}"
+
+
+def _best_of(fn, repeat: int, max_repeat_time: float = 1.0) -> Tuple[Any, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = fn()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        if elapsed > max_repeat_time:
+            break
+    return value, best
+
+
+def _bench_job(
+    year: int, day: int, part: int, size: Optional[int], seed: int, repeat: int
+) -> Tuple[Dict[str, float], str]:
+    """Times each phase of one (day, part, input); runs in a supervised child."""
+    problem = load_problem(year, day)
+    solution = getattr(problem, f"solution{part}")
+    if size is None:
+        path = os.path.join("inputs", str(year), f"day{day:02d}.in")
+        raw, t_input = _best_of(lambda: read_input(path), repeat)
+    else:
+        raw, t_input = _best_of(lambda: problem.generate_input(size, seed), 1)
+    data, t_parse = _best_of(lambda: problem.parse(raw), repeat)
+
+    t_solve = float("inf")
+    for _ in range(repeat):
+        fresh = copy.deepcopy(data)
+        start = time.perf_counter()
+        result = solution(fresh)
+        elapsed = time.perf_counter() - start
+        t_solve = min(t_solve, elapsed)
+        if elapsed > 1.0:
+            break
+    return {"input": t_input, "parse": t_parse, "solve": t_solve}, repr(result)
+
+
+def bench_size(entry, part: int) -> Optional[int]:
+    """`BENCH_SIZE`, else the largest `SCALE_SIZES` entry, for generated inputs."""
+    sizes = entry.metadata.get("BENCH_SIZE", entry.metadata.get("SCALE_SIZES"))
+    if isinstance(sizes, dict):
+        sizes = sizes.get(part)
+    if isinstance(sizes, int):
+        return sizes
+    return max(sizes) if sizes else None
+
+
+def collect_jobs(
+    year: Optional[int] = None,
+) -> Tuple[List[Tuple[int, int, int, Optional[int]]], List[Tuple[int, int, int]]]:
+    """
+    (year, day, part, size) for every real input on disk and every generator,
+    plus the (year, day, part) generators that have no size to bench at.
+    """
+    jobs, unsized = [], []
+    for y, d in registry.days(year):
+        entry = registry.get(y, d)
+        real = os.path.exists(os.path.join("inputs", str(y), f"day{d:02d}.in"))
+        for part in entry.parts:
+            if real:
+                jobs.append((y, d, part, None))
+            if not entry.has("generate_input"):
+                continue
+            size = bench_size(entry, part)
+            if size:
+                jobs.append((y, d, part, size))
+            else:
+                unsized.append((y, d, part))
+    return jobs, unsized
+
+
+def run_suite(
+    year: Optional[int] = None,
+    repeat: int = 3,
+    seed: int = 0,
+    timeout: Optional[float] = None,
+) -> List[BenchResult]:
+    """
+    Benchmarks every job one at a time, each in its own supervised child so a
+    slow or crashing day is cut off at `timeout` without losing the rest.
+    Solve times are also recorded in the benchmark history as kind "bench".
+    """
+    jobs, unsized = collect_jobs(year)
+    results = []
+    for y, d, part in unsized:
+        res = BenchResult(y, d, part, "generated")
+        res.error = f"no BENCH_SIZE or SCALE_SIZES for part {part}"
+        print(f"{res.label} {res.source:>9} | SKIPPED {res.error}", flush=True)
+        results.append(res)
+    for y, d, part, size in jobs:
+        res = BenchResult(y, d, part, "real" if size is None else "generated", size)
+        outcome = run_limited(
+            lambda: _bench_job(y, d, part, size, seed, repeat), timeout=timeout
+        )
+        if outcome.error:
+            res.error = outcome.telemetry()
+            print(f"{res.label} {res.source:>9} | ERROR {res.error}", flush=True)
+        else:
+            res.phases, res.result = outcome.result
+            print(f"{res.label} {res.source:>9} | {res.total:.6f}s", flush=True)
+            if size is None:
+                input_hash = file_hash(os.path.join("inputs", str(y), f"day{d:02d}.in"))
+            else:
+                input_hash = f"bench:{size}:seed{seed}"
+            record_run(
+                y,
+                d,
+                part,
+                input_hash,
+                registry.get(y, d).path,
+                res.phases["solve"],
+                kind="bench",
+                size=size,
+            )
+        results.append(res)
+    return results
+
+
+def print_table(results: List[BenchResult]) -> None:
+    """Slowest first, with each phase and the row's share of the total time."""
+    ok = sorted((r for r in results if not r.error), key=lambda r: -r.total)
+    grand = sum(r.total for r in ok) or 1.0
+    print(
+        "\nYear | Day | Part | Input     |    Size |  Input (s) |  Parse (s) "
+        "|  Solve (s) |  Total (s) | Share"
+    )
+    for r in ok:
+        size = "-" if r.size is None else str(r.size)
+        cells = " | ".join(f"{r.phases[p]:10.6f}" for p in PHASES)
+        print(
+            f"{r.year} | {r.day:3} | {r.part:4} | {r.source:9} | {size:>7} | "
+            f"{cells} | {r.total:10.6f} | {r.total / grand:5.1%}"
+        )
+    for r in results:
+        if r.error:
+            print(f"{r.label} {r.source}: {r.error}")
+    print(f"\n{len(ok)} benchmarks, {len(results) - len(ok)} failed, {grand:.3f}s")
+
+
+def write_json(results: List[BenchResult], path: str = REPORT_JSON) -> None:
+    report = {
+        "commit": git_commit(),
+        "created": time.time(),
+        "python": platform.python_version(),
+        "results": [{**asdict(r), "total": r.total} for r in results],
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Advent of Code benchmarks</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+td, th {{ padding: 2px 8px; text-align: right; border-bottom: 1px solid #ddd; }}
+td.bar {{ width: 400px; text-align: left; }}
+.bar span {{ display: inline-block; height: 12px; }}
+.input {{ background: #9ecae1; }} .parse {{ background: #fdae6b; }}
+.solve {{ background: #e6550d; }} .error {{ color: #b00; text-align: left; }}
+</style></head><body>
+<h1>Advent of Code benchmarks</h1>
+<p>commit {commit}, Python {python}, {count} benchmarks, {grand:.3f}s in total.
+Bars: <span class="input">&nbsp;input&nbsp;</span>
+<span class="parse">&nbsp;parse&nbsp;</span>
+<span class="solve">&nbsp;solve&nbsp;</span>, scaled to the slowest row.</p>
+<table>
+<tr><th>Year</th><th>Day</th><th>Part</th><th>Input</th><th>Size</th>
+<th>Input (s)</th><th>Parse (s)</th><th>Solve (s)</th><th>Total (s)</th><th></th></tr>
+{rows}
+</table></body></html>
+"""
+
+
+def write_html(results: List[BenchResult], path: str = REPORT_HTML) -> None:
+    ok = sorted((r for r in results if not r.error), key=lambda r: -r.total)
+    slowest = ok[0].total if ok and ok[0].total else 1.0
+    rows = []
+    for r in ok + [r for r in results if r.error]:
+        cells = [r.year, r.day, r.part, r.source, "-" if r.size is None else r.size]
+        row = "".join(f"<td>{html.escape(str(c))}</td>" for c in cells)
+        if r.error:
+            row += f'<td colspan="5" class="error">{html.escape(r.error)}</td>'
+        else:
+            row += "".join(f"<td>{r.phases[p]:.6f}</td>" for p in PHASES)
+            row += f"<td>{r.total:.6f}</td>"
+            bars = "".join(
+                f'<span class="{p}" style="width:{400 * r.phases[p] / slowest:.1f}px"'
+                f' title="{p} {r.phases[p]:.6f}s"></span>'
+                for p in PHASES
+            )
+            row += f'<td class="bar">{bars}</td>'
+        rows.append(f"<tr>{row}</tr>")
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        f.write(
+            _HTML.format(
+                commit=html.escape(git_commit() or "unknown"),
+                python=platform.python_version(),
+                count=len(results),
+                grand=sum(r.total for r in ok),
+                rows="\n".join(rows),
+            )
+        )
+
+
+def main_bench(
+    year: Optional[int] = None,
+    repeat: int = 3,
+    seed: int = 0,
+    timeout: Optional[float] = None,
+    json_path: str = REPORT_JSON,
+    html_path: str = REPORT_HTML,
+) -> int:
+    """Runs the suite, prints the table, writes both reports; returns failures."""
+    results = run_suite(year, repeat=repeat, seed=seed, timeout=timeout)
+    print_table(results)
+    write_json(results, json_path)
+    write_html(results, html_path)
+    print(f"Wrote {json_path} and {html_path}")
+    return sum(1 for r in results if r.error)
+
+
+def _entry(path, source: str):
+    from registry import scan_module
+
+    path.write_text(source)
+    return scan_module(2015, 1, str(path))
+
+
+def test_bench_size(tmp_path):
+    entry = _entry(tmp_path / "day01.py", "SCALE_SIZES = [10, 1000, 100]\n")
+    assert bench_size(entry, 1) == bench_size(entry, 2) == 1000
+    entry = _entry(tmp_path / "day02.py", "SCALE_SIZES = {1: [10, 20], 2: [5]}\n")
+    assert (bench_size(entry, 1), bench_size(entry, 2)) == (20, 5)
+    entry = _entry(tmp_path / "day03.py", "SCALE_SIZES = [10]\nBENCH_SIZE = 7\n")
+    assert bench_size(entry, 1) == 7
+    assert bench_size(_entry(tmp_path / "day04.py", "x = 1\n"), 1) is None
+
+
+def test_unsized_generators_are_reported(tmp_path, monkeypatch, capsys):
+    from registry import Registry
+    from supervisor import RunOutcome
+
+    year_dir = tmp_path / "solutions" / "2015"
+    year_dir.mkdir(parents=True)
+    (year_dir / "day01.py").write_text(
+        "SCALE_SIZES = {1: [10]}\n"
+        "def generate_input(size, seed):\n    return ''\n"
+        "def solution1(data):\n    return 1\n"
+        "def solution2(data):\n    return 2\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    index = Registry(str(tmp_path / "solutions"), str(tmp_path / "index.json"))
+    monkeypatch.setitem(globals(), "registry", index)
+    jobs, unsized = collect_jobs()
+    assert jobs == [(2015, 1, 1, 10)]
+    assert unsized == [(2015, 1, 2)]
+
+    timings = {phase: 0.0 for phase in PHASES}
+    monkeypatch.setitem(
+        globals(), "run_limited", lambda *_, **__: RunOutcome(result=(timings, "1"))
+    )
+    monkeypatch.setitem(globals(), "record_run", lambda *_, **__: None)
+    results = run_suite()
+    assert [(r.part, r.error) for r in results] == [
+        (2, "no BENCH_SIZE or SCALE_SIZES for part 2"),
+        (1, None),
+    ]
+    assert "2015 day 01 part 2 generated | SKIPPED" in capsys.readouterr().out
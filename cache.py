@@ -0,0 +1,307 @@
+import ast
+import contextlib
+import hashlib
+import inspect
+import os
+import pickle
+import shutil
+import tempfile
+from types import CodeType, FunctionType, ModuleType
+from typing import Any, Callable, Optional, Set, Tuple
+
+import common
+from common import file_hash, read_input
+
+CACHE_DIR = ".cache"
+PARSED_DIR = os.path.join(CACHE_DIR, "parsed")
+ANSWERS_DIR = os.path.join(CACHE_DIR, "answers")
+MAX_ANSWERS = 256
+MAX_ANSWER_BYTES = 8 << 20
+
+
+def _code_names(code: CodeType) -> Set[str]:
+    # global names used by `code` and by the lambdas/comprehensions inside it
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _from_common(obj: Any) -> bool:
+    return obj is common or getattr(obj, "__module__", None) == common.__name__
+
+
+def common_source_hash() -> str:
+    """Hash of common.py, part of every key whose code reaches into it."""
+    return file_hash(common.__file__)
+
+
+def function_source_hash(fn: FunctionType) -> str:
+    """
+    Hashes the source of `fn` plus every function of the same module it refers
+    to by name, so editing a helper such as `parse_instructions` invalidates
+    entries keyed on `parse` too. When any of them uses `common` (`Grid`,
+    `read_lines`, ...), the whole of common.py is hashed in as well, since
+    those objects depend on further private helpers there.
+    """
+    h = hashlib.sha256()
+    seen = set()
+    stack = [fn]
+    uses_common = False
+    while stack:
+        f = stack.pop()
+        if f.__name__ in seen:
+            continue
+        seen.add(f.__name__)
+        h.update(inspect.getsource(f).encode())
+        for name in sorted(_code_names(f.__code__)):
+            ref = f.__globals__.get(name)
+            if isinstance(ref, FunctionType) and ref.__module__ == fn.__module__:
+                stack.append(ref)
+            elif _from_common(ref):
+                uses_common = True
+    if uses_common:
+        h.update(common_source_hash().encode())
+    return h.hexdigest()
+
+
+def _atomic_write(path: str, write) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _is_ndarray(obj: Any) -> bool:
+    # avoid importing numpy for modules that never produce arrays
+    return type(obj).__module__ == "numpy" and type(obj).__name__ == "ndarray"
+
+
+def load_parsed(
+    problem: ModuleType, input_path: str, use_cache: bool = True, stream: bool = False
+) -> Any:
+    """
+    Parsed puzzle input for `problem`. With `stream`, modules that define
+    `parse_stream(path)` get to read the file lazily (a line or character
+    iterator that the solution consumes exactly once); otherwise this is
+    `parse(raw)`, from the on-disk cache unless `use_cache` is off.
+    """
+    if stream and hasattr(problem, "parse_stream"):
+        return problem.parse_stream(input_path)
+    if use_cache:
+        return cached_parse(problem, input_path)
+    return problem.parse(read_input(input_path))
+
+
+def cached_parse(
+    problem: ModuleType,
+    input_path: str,
+    raw: Optional[str] = None,
+    cache_dir: str = PARSED_DIR,
+) -> Any:
+    """
+    Returns `problem.parse(raw)` from the on-disk cache when both the input file
+    and the source of `parse` are unchanged, otherwise parses and stores it.
+    Array results are stored as .npy, everything else is pickled.
+    """
+    module_dir = os.path.join(cache_dir, problem.__name__)
+    parse_hash = function_source_hash(problem.parse)
+    base = os.path.join(module_dir, parse_hash, file_hash(input_path))
+
+    if os.path.exists(base + ".npy"):
+        import numpy as np
+
+        return np.load(base + ".npy", allow_pickle=False)
+    if os.path.exists(base + ".pkl"):
+        with open(base + ".pkl", "rb") as f:
+            return pickle.load(f)
+
+    data = problem.parse(read_input(input_path) if raw is None else raw)
+
+    # entries written by an older `parse` can never be hit again
+    if os.path.isdir(module_dir):
+        for stale in os.listdir(module_dir):
+            if stale != parse_hash:
+                shutil.rmtree(os.path.join(module_dir, stale), ignore_errors=True)
+
+    if _is_ndarray(data) and data.dtype != object:
+        import numpy as np
+
+        _atomic_write(base + ".npy", lambda f: np.save(f, data, allow_pickle=False))
+    else:
+        _atomic_write(
+            base + ".pkl", lambda f: pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+        )
+    return data
+
+
+def module_source_hash(source_path: str) -> str:
+    """
+    Hashes a solution file plus, when it imports from `common`, the whole of
+    common.py: the names it imports depend on private helpers there too. The
+    imports are read from the file's AST, so the module is never imported.
+    """
+    with open(source_path, "rb") as f:
+        source = f.read()
+    h = hashlib.sha256(source)
+    for node in ast.walk(ast.parse(source, filename=source_path)):
+        if isinstance(node, ast.ImportFrom):
+            imported = [node.module]
+        elif isinstance(node, ast.Import):
+            imported = [alias.name for alias in node.names]
+        else:
+            continue
+        if common.__name__ in imported:
+            h.update(common_source_hash().encode())
+            break
+    return h.hexdigest()
+
+
+def answer_key(source_path: str, input_path: str, part: int) -> str:
+    return f"{module_source_hash(source_path)[:32]}-{file_hash(input_path)[:32]}-{part}"
+
+
+def _evict(cache_dir: str, max_entries: int, max_bytes: int) -> None:
+    """Drops least recently used answers until both limits hold."""
+    entries = []
+    for name in os.listdir(cache_dir):
+        try:
+            st = os.stat(os.path.join(cache_dir, name))
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime_ns, st.st_size, name))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    while entries and (len(entries) > max_entries or total > max_bytes):
+        _, size, name = entries.pop(0)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(os.path.join(cache_dir, name))
+        total -= size
+
+
+def cached_answer(
+    source_path: str,
+    input_path: str,
+    part: int,
+    compute: Callable[[], Any],
+    use_cache: bool = True,
+    cache_dir: str = ANSWERS_DIR,
+    max_entries: int = MAX_ANSWERS,
+    max_bytes: int = MAX_ANSWER_BYTES,
+) -> Tuple[Any, bool]:
+    """
+    Returns `(answer, hit)`. The answer is stored under the input file hash, the
+    solution source (see `module_source_hash`) and the part, so `compute` only
+    runs when one of those changed. Hits refresh the entry's mtime, which is
+    what eviction orders on.
+    """
+    if not use_cache:
+        return compute(), False
+
+    path = os.path.join(cache_dir, answer_key(source_path, input_path, part) + ".pkl")
+    try:
+        with open(path, "rb") as f:
+            answer = pickle.load(f)
+        os.utime(path)
+        return answer, True
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    answer = compute()
+    _atomic_write(path, lambda f: pickle.dump(answer, f, pickle.HIGHEST_PROTOCOL))
+    _evict(cache_dir, max_entries, max_bytes)
+    return answer, False
+
+
+def _write_module(path, source: str) -> ModuleType:
+    import importlib.util
+
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_parse_hash_follows_common(tmp_path, monkeypatch):
+    fake_common = tmp_path / "common_copy.py"
+    fake_common.write_text("# version 1\n")
+    monkeypatch.setattr(common, "__file__", str(fake_common))
+
+    uses = _write_module(
+        tmp_path / "uses_common.py",
+        "from common import read_lines\n"
+        "def parse(raw):\n"
+        "    return [len(x) for x in raw.split()]\n"
+        "def parse_lines(path):\n"
+        "    return list(read_lines(path))\n",
+    )
+    plain = function_source_hash(uses.parse)
+    via_common = function_source_hash(uses.parse_lines)
+
+    fake_common.write_text("# version 2\n")
+    assert function_source_hash(uses.parse_lines) != via_common
+    # a parser that never touches common keeps its key
+    assert function_source_hash(uses.parse) == plain
+
+
+def test_parse_hash_follows_helpers(tmp_path):
+    old = _write_module(
+        tmp_path / "helpers_v1.py",
+        "def helper(x):\n    return x\ndef parse(raw):\n    return helper(raw)\n",
+    )
+    new = _write_module(
+        tmp_path / "helpers_v2.py",
+        "def helper(x):\n    return x * 2\ndef parse(raw):\n    return helper(raw)\n",
+    )
+    assert function_source_hash(old.parse) != function_source_hash(new.parse)
+
+
+def test_answer_cache_hit_and_invalidation(tmp_path, monkeypatch):
+    fake_common = tmp_path / "common_copy.py"
+    fake_common.write_text("# version 1\n")
+    monkeypatch.setattr(common, "__file__", str(fake_common))
+    solution = tmp_path / "day01.py"
+    solution.write_text("from common import read_input\n")
+    data = tmp_path / "day01.in"
+    data.write_text("1 2 3\n")
+    calls = []
+
+    def ask():
+        return cached_answer(
+            str(solution),
+            str(data),
+            1,
+            lambda: calls.append(1) or len(calls),
+            cache_dir=str(tmp_path / "answers"),
+        )
+
+    assert ask() == (1, False)
+    assert ask() == (1, True)
+    solution.write_text("from common import read_input  # edited\n")
+    assert ask() == (2, False)
+    fake_common.write_text("# version 2\n")
+    assert ask() == (3, False)
+    data.write_text("4 5 6\n")
+    assert ask() == (4, False)
+    assert ask() == (4, True)
+
+
+def test_answer_cache_disabled(tmp_path):
+    solution = tmp_path / "day01.py"
+    solution.write_text("x = 1\n")
+    data = tmp_path / "day01.in"
+    data.write_text("1\n")
+    cache_dir = tmp_path / "answers"
+    for expected in ("a", "b"):
+        answer = cached_answer(
+            str(solution), str(data), 1, lambda: expected, False, str(cache_dir)
+        )
+        assert answer == (expected, False)
+    assert not cache_dir.exists()
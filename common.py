@@ -1,58 +1,792 @@
+import atexit
+import copy
+import hashlib
+import heapq
 import logging
+import logging.handlers
+import math
+import mmap
 import os
+import queue
+import struct
 import time
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass
 from itertools import chain
-from typing import Any, Callable, List, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+if TYPE_CHECKING:
+    import numpy as np
 
-def setup_logging(level: int = logging.INFO) -> logging.Logger:
-    os.makedirs("logs", exist_ok=True)
-    logger = logging.getLogger("common_logger")
-    logger.setLevel(level)
+LOG_NAME = "aoc"
+LOG_FILE = os.path.join("logs", "application.log")
+# per-module level overrides, e.g. AOC_LOG="DEBUG" or "2025.day07=DEBUG,day04=ERROR"
+LOG_ENV = "AOC_LOG"
+LOG_FORMAT = (
+    "%(asctime)s - %(levelname)s - "
+    "File: %(filename)s - Function: %(funcName)s - Line: %(lineno)d - "
+    "Message: %(message)s"
+)
+
+_log_overrides: Dict[str, int] = {}
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _InlineQueue:
+    """
+    Stand-in for the log queue in a forked child, where the listener thread
+    does not exist: records go straight to the handlers.
+    """
+
+    def __init__(self, handlers: Sequence[logging.Handler]):
+        self.handlers = handlers
+
+    def put_nowait(self, record: logging.LogRecord) -> None:
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queues records as they are. The stock `prepare` formats the message in
+    the logging thread (so records can be pickled); this queue never leaves
+    the process, so formatting is left to the listener's handlers. Arguments
+    are therefore rendered when the record is written, not when it is logged.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _log_level(value: str) -> int:
+    level = logging.getLevelName(value.strip().upper())
+    if not isinstance(level, int):
+        raise ValueError(f"unknown log level {value!r}")
+    return level
 
-    ch = logging.StreamHandler()
-    ch.setLevel(level)
 
-    fh = logging.FileHandler("logs/application.log")
-    fh.setLevel(level)
+def _parse_log_levels(spec: Optional[str]) -> Dict[str, int]:
+    levels = {}
+    for item in filter(None, (spec or "").split(",")):
+        key, _, value = item.rpartition("=")
+        levels[key.strip()] = _log_level(value)
+    return levels
 
-    formatter = logging.Formatter(
-        "%(asctime)s - %(levelname)s - "
-        "File: %(filename)s - Function: %(funcName)s - Line: %(lineno)d - "
-        "Message: %(message)s"
+
+def set_log_levels(spec: Optional[str]) -> None:
+    """
+    Applies level overrides such as "DEBUG" (every module) or
+    "2025.day07=DEBUG,common=ERROR" (a module whose name ends with the key).
+    Overrides win over the level a module passes to `setup_logging`.
+    """
+    _log_overrides.update(_parse_log_levels(spec))
+    for name, logger in logging.root.manager.loggerDict.items():
+        if name.startswith(f"{LOG_NAME}.") and isinstance(logger, logging.Logger):
+            level = _override_for(name)
+            if level is not None:
+                logger.setLevel(level)
+
+
+def _override_for(name: str) -> Optional[int]:
+    for key, level in _log_overrides.items():
+        if key and (name == f"{LOG_NAME}.{key}" or name.endswith(f".{key}")):
+            return level
+    return _log_overrides.get("")
+
+
+def _configure_root() -> logging.Logger:
+    """
+    Configures the shared `aoc` logger once per process: records are queued by
+    the calling thread and formatted and written by a background listener, so
+    solutions never wait on the terminal or the log file.
+    """
+    global _log_listener
+    root = logging.getLogger(LOG_NAME)
+    if _log_listener is not None:
+        return root
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    ch = logging.StreamHandler()
+    os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+    fh = logging.FileHandler(LOG_FILE, delay=True)
+    for handler in (ch, fh):
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    root.addHandler(queue_handler)
+    root.propagate = False
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, ch, fh, respect_handler_level=True
     )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    def inline_after_fork() -> None:
+        queue_handler.queue = _InlineQueue((ch, fh))
+
+    os.register_at_fork(after_in_child=inline_after_fork)
+    # explicit `set_log_levels` calls (main.py --log) win over the environment
+    for key, level in _parse_log_levels(os.environ.get(LOG_ENV)).items():
+        _log_overrides.setdefault(key, level)
+    return root
 
-    ch.setFormatter(formatter)
-    fh.setFormatter(formatter)
 
-    logger.addHandler(ch)
-    logger.addHandler(fh)
+def setup_logging(
+    level: int = logging.INFO, name: Optional[str] = None
+) -> logging.Logger:
+    """
+    Returns the logger for module `name` (usually `__name__`) at `level`, or
+    the shared `aoc` logger without a name. Safe to call on every import: the
+    handlers are set up once, and AOC_LOG / `set_log_levels` overrides apply.
 
+    Log with %-style arguments (`logger.debug("at %s", pos)`) so disabled
+    records are never formatted, and guard inner loops with a hoisted
+    `logger.isEnabledFor(...)` check.
+    """
+    root = _configure_root()
+    logger = logging.getLogger(f"{LOG_NAME}.{name}") if name else root
+    override = _override_for(logger.name) if name else _log_overrides.get("")
+    logger.setLevel(level if override is None else override)
     return logger
 
 
+@contextmanager
+def log_listener_stopped() -> Iterator[None]:
+    """
+    Stops the background log listener for the duration of a `fork()`: a child
+    forked while other threads run may deadlock on a lock one of them held.
+    Only the original process restarts it (a forked child logs inline), and
+    records logged meanwhile wait in the queue until then.
+    """
+    listener = _log_listener
+    if listener is None:
+        yield
+        return
+    pid = os.getpid()
+    listener.stop()
+    try:
+        yield
+    finally:
+        if os.getpid() == pid:
+            listener.start()
+
+
 def read_input(path: str) -> str:
     """Reads content from a specified file."""
     with open(path, "r") as f:
         return f.read()
 
 
-def run_tests(problem: Any) -> None:
-    """Runs tests defined in the problem object and asserts expected outcomes."""
-    if not hasattr(problem, "tests"):
-        print("No tests defined.")
-        return
+def read_lines(path: str) -> Iterator[str]:
+    """Yields the lines of a file one at a time, without trailing newlines."""
+    with open(path, "r") as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+@contextmanager
+def open_mmap(path: str) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Maps a file read-only; yields b"" for empty files, which cannot be mapped."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def read_chars(path: str, chunk_size: int = 1 << 16) -> Iterator[str]:
+    """Yields an ASCII file character by character, one mapped chunk at a time."""
+    with open_mmap(path) as mm:
+        for start in range(0, len(mm), chunk_size):
+            yield from mm[start : start + chunk_size].decode()
+
+
+def file_hash(path: str) -> str:
+    """Returns the SHA-256 hex digest of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# (row, col) steps to the 4 orthogonal or all 8 neighbours of a cell
+GRID_DIRECTIONS = {
+    4: [(-1, 0), (0, -1), (0, 1), (1, 0)],
+    8: [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)],
+}
+
+
+def neighbour_counts(mask: "np.ndarray", diagonal: bool = True) -> "np.ndarray":
+    """
+    For every cell of a 2-D boolean `mask`, how many of its 8 neighbours (4
+    with `diagonal=False`) are set; cells beyond the edge count as unset.
+    """
+    return Stencil(mask, diagonal=diagonal).counts()
+
+
+class Grid:
+    """
+    Rectangular character grid stored as a 2-D `uint8` array, one byte per
+    cell. numpy is imported on first use, so days without grids never pay for
+    it. Grids loaded from bytes or a file are read-only views; `copy()` first
+    to modify one.
+    """
+
+    __slots__ = ("cells",)
+
+    def __init__(self, cells: "np.ndarray"):
+        self.cells = cells
+
+    @classmethod
+    def from_bytes(cls, raw: Union[bytes, bytearray, mmap.mmap, str]) -> "Grid":
+        """
+        Views newline-separated rows of equal length without copying them
+        (a `str` is encoded first). Trailing newlines and CRLF are accepted.
+        """
+        import numpy as np
+
+        if isinstance(raw, str):
+            raw = raw.encode()
+        end = len(raw)
+        while end and raw[end - 1] in b"\r\n":
+            end -= 1
+        if end == 0:
+            return cls(np.zeros((0, 0), dtype=np.uint8))
+
+        buf = np.frombuffer(raw, dtype=np.uint8, count=end)
+        newline = raw.find(b"\n", 0, end)
+        if newline < 0:
+            return cls(buf.reshape(1, end))
+        width = newline - 1 if newline and raw[newline - 1] == ord("\r") else newline
+        stride = newline + 1
+        rows, extra = divmod(end - width, stride)
+        # every row must end exactly where the next newline is
+        if extra or np.any(buf[newline::stride] != ord("\n")):
+            raise ValueError("grid rows differ in length")
+        cells = np.lib.stride_tricks.as_strided(
+            buf, (rows + 1, width), (stride, 1), writeable=False
+        )
+        return cls(cells)
+
+    @classmethod
+    def from_file(cls, path: str) -> "Grid":
+        """Memory-maps `path`; the cells stay a view of the mapped file."""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return cls.from_bytes(b"")
+            return cls.from_bytes(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def full(cls, rows: int, cols: int, fill: str = ".") -> "Grid":
+        import numpy as np
+
+        return cls(np.full((rows, cols), ord(fill), dtype=np.uint8))
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.cells.shape
+
+    @property
+    def rows(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def cols(self) -> int:
+        return self.cells.shape[1]
+
+    def __getitem__(self, key):
+        return self.cells[key]
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode() for row in self.cells)
+
+    def copy(self) -> "Grid":
+        return Grid(self.cells.copy())
+
+    def mask(self, chars: str) -> "np.ndarray":
+        """Boolean array marking cells that hold any of `chars`."""
+        import numpy as np
+
+        if len(chars) == 1:
+            return self.cells == ord(chars)
+        return np.isin(self.cells, np.frombuffer(chars.encode(), dtype=np.uint8))
+
+    def count(self, chars: str) -> int:
+        return int(self.mask(chars).sum())
+
+    def find(self, char: str) -> Tuple[int, int]:
+        """(row, col) of the first `char` in reading order."""
+        import numpy as np
+
+        flat = np.flatnonzero(self.cells == ord(char))
+        if not len(flat):
+            raise ValueError(f"{char!r} not in grid")
+        return self.position(int(flat[0]))
+
+    def find_all(self, chars: str) -> "np.ndarray":
+        """(row, col) pairs of every cell holding one of `chars`, in reading order."""
+        import numpy as np
+
+        return np.argwhere(self.mask(chars))
+
+    def neighbour_counts(self, chars: str, diagonal: bool = True) -> "np.ndarray":
+        """Per cell, how many neighbours hold one of `chars`."""
+        return neighbour_counts(self.mask(chars), diagonal)
+
+    def padded(self, fill: str = ".", width: int = 1) -> "Grid":
+        """
+        A copy with a `width`-cell border of `fill`, so walks that stop at the
+        border need no bounds checks.
+        """
+        import numpy as np
+
+        return Grid(np.pad(self.cells, width, constant_values=ord(fill)))
+
+    # --- Flat (row-major) indices, for queues and visited sets over cells ---
+
+    def index(self, row, col):
+        """Flat index of (row, col); works elementwise on arrays too."""
+        return row * self.cols + col
+
+    def position(self, index):
+        """(row, col) of a flat index; works elementwise on arrays too."""
+        return divmod(index, self.cols)
+
+    def offsets(self, diagonal: bool = True) -> List[int]:
+        """Flat-index steps to the neighbours of a cell (use on a padded grid)."""
+        return [dr * self.cols + dc for dr, dc in GRID_DIRECTIONS[8 if diagonal else 4]]
+
+    def ravel(self) -> "np.ndarray":
+        """The cells as one row-major array (copied if the grid is a strided view)."""
+        return self.cells.ravel()
+
+
+class Stencil:
+    """
+    Cellular-automaton engine over a 2-D boolean `state`, updated in place.
+    Neighbour counts come from shifted slices of a zero-bordered copy, so a
+    step is a handful of whole-array operations whatever the grid size.
+
+    A live cell stays alive when its count is in `survive` and a dead cell
+    comes alive when it is in `birth`: Conway's Life is survive=(2, 3),
+    birth=(3,). `changes` records how many cells each step flipped.
+    """
+
+    # rows per block: bounds the temporaries of a step on very large grids
+    BLOCK_ROWS = 1024
+
+    def __init__(
+        self,
+        state: "np.ndarray",
+        survive: Iterable[int] = (2, 3),
+        birth: Iterable[int] = (3,),
+        diagonal: bool = True,
+    ):
+        import numpy as np
+
+        self.state = state
+        self.offsets = GRID_DIRECTIONS[8 if diagonal else 4]
+        self.survive = np.zeros(9, dtype=bool)
+        self.survive[list(survive)] = True
+        self.birth = np.zeros(9, dtype=bool)
+        self.birth[list(birth)] = True
+        rows, cols = state.shape
+        self._padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+        self.changes: List[int] = []
+
+    def _counts(self, start: int, stop: int) -> "np.ndarray":
+        # rows start..stop of the counts; `_padded` must hold the current state
+        import numpy as np
+
+        cols = self.state.shape[1]
+        counts = np.zeros((stop - start, cols), dtype=np.uint8)
+        for dr, dc in self.offsets:
+            counts += self._padded[
+                1 + start + dr : 1 + stop + dr, 1 + dc : 1 + dc + cols
+            ]
+        return counts
+
+    def counts(self) -> "np.ndarray":
+        """Live-neighbour count of every cell in the current state."""
+        self._padded[1:-1, 1:-1] = self.state
+        return self._counts(0, self.state.shape[0])
+
+    def step(self) -> int:
+        """Advances one generation in place; returns how many cells changed."""
+        import numpy as np
+
+        self._padded[1:-1, 1:-1] = self.state
+        changed = 0
+        for start in range(0, self.state.shape[0], self.BLOCK_ROWS):
+            stop = min(start + self.BLOCK_ROWS, self.state.shape[0])
+            counts = self._counts(start, stop)
+            block = self.state[start:stop]
+            new = np.where(block, self.survive[counts], self.birth[counts])
+            changed += int(np.count_nonzero(new != block))
+            block[...] = new
+        self.changes.append(changed)
+        return changed
+
+    def run(self, max_steps: Optional[int] = None) -> List[int]:
+        """Steps until nothing changes (or `max_steps`); returns `changes`."""
+        steps = 0
+        while max_steps is None or steps < max_steps:
+            steps += 1
+            if not self.step():
+                self.changes.pop()
+                break
+        return self.changes
+
+
+class DisjointSet:
+    """
+    Union-find over the elements 0..n-1, kept in two `array("i")`s (parent and
+    component size), so memory is 8 bytes per element at any scale. `find`
+    uses iterative path halving, so long chains never hit the recursion
+    limit, and `union` attaches the smaller component to the larger one.
+    """
+
+    __slots__ = ("parent", "size", "components")
+
+    def __init__(self, n: int):
+        self.parent = array("i", range(n))
+        self.size = array("i", [1]) * n
+        self.components = n
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Joins the components of `a` and `b`; False if they already were one."""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        self.components -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def component_size(self, x: int) -> int:
+        return self.size[self.find(x)]
+
+    def component_sizes(self) -> List[int]:
+        """Size of every component, largest first."""
+        parent, size = self.parent, self.size
+        return sorted(
+            (size[r] for r in range(len(parent)) if parent[r] == r), reverse=True
+        )
+
+    def union_many(self, a: Iterable[int], b: Iterable[int]) -> List[int]:
+        """
+        Unions the pairs (a[k], b[k]) in order (NumPy arrays work too) and
+        returns the positions k of the pairs that joined two components.
+        Stops early once everything is one component.
+        """
+        if hasattr(a, "tolist"):
+            a, b = a.tolist(), b.tolist()
+        parent, size = self.parent, self.size
+        merged = []
+        for k, (x, y) in enumerate(zip(a, b)):
+            if self.components == 1:
+                break
+            # find() inlined: this loop runs once per edge
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            while parent[y] != y:
+                parent[y] = parent[parent[y]]
+                y = parent[y]
+            if x == y:
+                continue
+            if size[x] < size[y]:
+                x, y = y, x
+            parent[y] = x
+            size[x] += size[y]
+            self.components -= 1
+            merged.append(k)
+        return merged
+
+
+Point3 = Tuple[int, int, int]
+
+
+class PointIndex:
+    """
+    Uniform-grid spatial index over integer 3-D points. Each point goes in the
+    bucket of the cube of side `cell` containing it, and queries scan shells of
+    cubes outwards from the query point. Once shell r has been scanned, every
+    other point is at least r * cell + (distance from the query to the nearest
+    face of its own cube) away, so nearer results can be confirmed early.
+    """
+
+    # average points per cube of the bounding box when `cell` is not given
+    POINTS_PER_CELL = 4
+
+    def __init__(self, points: Iterable[Sequence[int]], cell: Optional[int] = None):
+        self.points: List[Point3] = [tuple(p) for p in points]
+        self.cell = cell or self._default_cell()
+        self.buckets: Dict[Point3, List[int]] = {}
+        for i, p in enumerate(self.points):
+            self.buckets.setdefault(self._key(p), []).append(i)
+        keys = list(self.buckets) or [(0, 0, 0)]
+        self._lo = tuple(min(k[axis] for k in keys) for axis in range(3))
+        self._hi = tuple(max(k[axis] for k in keys) for axis in range(3))
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _default_cell(self) -> int:
+        if not self.points:
+            return 1
+        volume = math.prod(
+            max(p[axis] for p in self.points) - min(p[axis] for p in self.points) + 1
+            for axis in range(3)
+        )
+        return max(
+            1, round((volume * self.POINTS_PER_CELL / len(self.points)) ** (1 / 3))
+        )
+
+    def _key(self, q: Sequence[int]) -> Point3:
+        c = self.cell
+        return (q[0] // c, q[1] // c, q[2] // c)
+
+    def _margin(self, q: Sequence[int], key: Point3) -> int:
+        """Distance from `q` to the nearest face of its cube."""
+        c = self.cell
+        return min(min(v - k * c, (k + 1) * c - v) for v, k in zip(q, key))
+
+    def _reach(self, key: Point3) -> int:
+        """Shell radius around `key` that covers every occupied cube."""
+        return max(max(k - lo, hi - k) for k, lo, hi in zip(key, self._lo, self._hi))
+
+    def _shell(self, key: Point3, r: int) -> Iterator[Point3]:
+        """Cubes at Chebyshev distance exactly `r` from `key` that may hold points."""
+        kx, ky, kz = key
+        if r == 0:
+            yield key
+            return
+        if (2 * r + 1) ** 3 - (2 * r - 1) ** 3 > len(self.buckets):
+            # a far shell of a sparse index: cheaper to walk the occupied cubes
+            for cube in self.buckets:
+                x, y, z = cube
+                if max(abs(x - kx), abs(y - ky), abs(z - kz)) == r:
+                    yield cube
+            return
+        lo, hi = self._lo, self._hi
+        for x in range(max(kx - r, lo[0]), min(kx + r, hi[0]) + 1):
+            x_face = abs(x - kx) == r
+            for y in range(max(ky - r, lo[1]), min(ky + r, hi[1]) + 1):
+                if x_face or abs(y - ky) == r:
+                    zs = range(max(kz - r, lo[2]), min(kz + r, hi[2]) + 1)
+                else:
+                    zs = [z for z in (kz - r, kz + r) if lo[2] <= z <= hi[2]]
+                for z in zs:
+                    yield (x, y, z)
+
+    def _scan(
+        self,
+        q: Sequence[int],
+        cubes: Iterable[Point3],
+        found: List[Tuple[int, int]],
+        after: int = -1,
+    ) -> None:
+        # appends (squared distance, index) for the points of `cubes` above `after`
+        points, buckets = self.points, self.buckets
+        qx, qy, qz = q
+        for cube in cubes:
+            for j in buckets.get(cube, ()):
+                if j > after:
+                    x, y, z = points[j]
+                    found.append(
+                        (
+                            (x - qx) * (x - qx)
+                            + (y - qy) * (y - qy)
+                            + (z - qz) * (z - qz),
+                            j,
+                        )
+                    )
+
+    def _axis_gaps(self, q: Sequence[int], key: Point3, r: int) -> List[List[int]]:
+        """
+        Per axis, the squared gap from `q` to the nearest integer point of the
+        cube o = -r..r cubes away (at list position o + r).
+        """
+        c = self.cell
+        gaps = []
+        for v, k in zip(q, key):
+            below = [(v - (k + o + 1) * c + 1) ** 2 for o in range(-r, 0)]
+            above = [((k + o) * c - v) ** 2 for o in range(1, r + 1)]
+            gaps.append(below + [0] + above)
+        return gaps
+
+    def nearest(self, q: Sequence[int], k: int = 1) -> List[Tuple[int, int]]:
+        """
+        The `k` points nearest to `q` as (squared distance, index), nearest
+        first and ties by index. A point of the index is its own nearest.
+        """
+        if not self.points or k <= 0:
+            return []
+        key = self._key(q)
+        margin, reach = self._margin(q, key), self._reach(key)
+        found: List[Tuple[int, int]] = []
+        for r in range(reach + 1):
+            self._scan(q, self._shell(key, r), found)
+            bound = r * self.cell + margin
+            if len(found) >= k and heapq.nsmallest(k, found)[-1][0] < bound * bound:
+                break
+        return heapq.nsmallest(k, found)
+
+    def within(self, q: Sequence[int], radius: int) -> List[Tuple[int, int]]:
+        """Every point at most `radius` from `q` as (squared distance, index), nearest first."""
+        if not self.points:
+            return []
+        key = self._key(q)
+        margin, reach = self._margin(q, key), self._reach(key)
+        found: List[Tuple[int, int]] = []
+        for r in range(reach + 1):
+            if r and (r - 1) * self.cell + margin > radius:
+                break
+            self._scan(q, self._shell(key, r), found)
+        limit = radius * radius
+        return sorted(f for f in found if f[0] <= limit)
+
+    def closest_pairs(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Every pair as (squared distance, i, j) with i < j, shortest first and
+        ties by i then j, generated lazily. Each point has a stream of its
+        higher-indexed neighbours and a heap merges the streams. A stream
+        lists a shell's cubes only when the merge reaches the shell's lower
+        bound and scans a cube only when it reaches the cube's own bound, so
+        the first few thousand pairs only look at very near neighbours.
+        """
+        points, buckets = self.points, self.buckets
+        # a stream is a heap of (squared distance, j) for points found so far,
+        # (bound, -1, cube) for unscanned cubes, (bound, -2, r) for shell r and
+        # (bound, -3, 1) for the edge and corner cubes of shell 1
+        streams: List[list] = [[] for _ in points]
+        heap = []
+        # every stream starts with its own cube scanned and shell 1 pending
+        for cube, bucket in buckets.items():
+            for i in bucket:
+                stream = streams[i]
+                self._scan(points[i], [cube], stream, i)
+                if len(buckets) > 1:
+                    stream.append((self._margin(points[i], cube) ** 2, -2, 1))
+                if stream:
+                    heapq.heapify(stream)
+                    heap.append((stream[0][0], i, max(stream[0][1], -1)))
+        heapq.heapify(heap)
 
-    for i, (raw, exp1, exp2) in enumerate(problem.tests, 1):
-        data = problem.parse(raw)
+        while heap:
+            d, i, j = heap[0]
+            stream = streams[i]
+            item = heapq.heappop(stream)
+            if j >= 0:
+                yield d, i, j
+            else:
+                self._expand(i, item, stream)
+            if stream:
+                heapq.heapreplace(heap, (stream[0][0], i, max(stream[0][1], -1)))
+            else:
+                heapq.heappop(heap)
 
-        if exp1 is not None:
-            assert problem.solution1(data) == exp1, f"Test {i} part1 failed"
+    def _expand(self, i: int, item: tuple, stream: list) -> None:
+        # scans a cube of point i's stream, or lists the cubes of a shell
+        q = self.points[i]
+        _, kind, what = item
+        if kind == -1:
+            found: List[Tuple[int, int]] = []
+            self._scan(q, [what], found, i)
+            for entry in found:
+                heapq.heappush(stream, entry)
+            return
 
-        if exp2 is not None:
-            assert problem.solution2(data) == exp2, f"Test {i} part2 failed"
+        key, r = self._key(q), what
+        reach, buckets = self._reach(key), self.buckets
+        x, y, z = key
+        if kind == -2 and r == 1:
+            # the 6 face cubes first: the other 20 cubes of shell 1 are at
+            # least two face gaps away, and most streams never get that far
+            cubes = [
+                (x - 1, y, z),
+                (x + 1, y, z),
+                (x, y - 1, z),
+                (x, y + 1, z),
+                (x, y, z - 1),
+                (x, y, z + 1),
+            ]
+            faces = [min(g[0], g[2]) for g in self._axis_gaps(q, key, 1)]
+            nearest, second = sorted(faces)[:2]
+            heapq.heappush(stream, (nearest + second, -3, 1))
+        elif kind == -3:
+            cubes = [
+                cube
+                for cube in self._shell(key, 1)
+                if (cube[0] != x) + (cube[1] != y) + (cube[2] != z) > 1
+            ]
+        elif (2 * r + 1) ** 3 - (2 * r - 1) ** 3 > len(buckets):
+            # more cubes per shell than occupied ones: list all the rest now
+            cubes = [
+                cube
+                for cube in buckets
+                if max(abs(cube[0] - x), abs(cube[1] - y), abs(cube[2] - z)) >= r
+            ]
+            r = reach
+        else:
+            cubes = self._shell(key, r)
 
-    print("All tests passed!")
+        gx, gy, gz = self._axis_gaps(q, key, r)
+        kx, ky, kz = x - r, y - r, z - r
+        for cx, cy, cz in cubes:
+            if (cx, cy, cz) in buckets:
+                cube = (gx[cx - kx] + gy[cy - ky] + gz[cz - kz], -1, (cx, cy, cz))
+                heapq.heappush(stream, cube)
+        if kind == -2 and r < reach:
+            bound = r * self.cell + self._margin(q, key)
+            heapq.heappush(stream, (bound * bound, -2, r + 1))
+
+
+# Shared 16-byte buffer installed by supervisor.run_limited in its child process.
+_progress_buffer: Optional[mmap.mmap] = None
+
+
+def report_progress(done: float, total: float = 0.0) -> None:
+    """
+    Lets a long-running solution publish how far it got, so a run killed by
+    --timeout/--max-mem can say so. A no-op outside a supervised run; call it
+    every few thousand iterations rather than on every one.
+    """
+    if _progress_buffer is not None:
+        struct.pack_into("dd", _progress_buffer, 0, done, total)
 
 
 def measure_performance(fn: Callable[[Any], Any], data: Any) -> Tuple[Any, float]:
@@ -62,17 +796,399 @@ def measure_performance(fn: Callable[[Any], Any], data: Any) -> Tuple[Any, float
     return result, time.perf_counter() - start
 
 
+@dataclass
+class TimingStats:
+    """Per-call timings (seconds) gathered by `measure_repeated`."""
+
+    result: Any
+    samples: List[float]
+    loops: int
+    overhead: float
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        import statistics  # pulls in fractions/decimal; only timing runs need it
+
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.samples, 95)
+
+    @property
+    def stddev(self) -> float:
+        import statistics
+
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"min {self.min:.6f}s | median {self.median:.6f}s | "
+            f"p95 {self.p95:.6f}s | stddev {self.stddev:.6f}s | "
+            f"{len(self.samples)} samples x {self.loops} loops | "
+            f"overhead {self.overhead:.2e}s/call"
+        )
+
+
+@dataclass
+class PhaseTimes:
+    """Seconds spent reading the input, parsing it, solving, and freeing the data."""
+
+    read: float
+    parse: float
+    solve: float
+    teardown: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.read + self.parse + self.solve + self.teardown
+
+    def __str__(self) -> str:
+        total = self.total or 1.0
+        phases = ("read", "parse", "solve", "teardown")
+        return (
+            " | ".join(
+                f"{name} {getattr(self, name):.6f}s ({getattr(self, name) / total:.0%})"
+                for name in phases
+            )
+            + f" | total {self.total:.6f}s"
+        )
+
+
+def release(refs: List[Any]) -> float:
+    """Drops the last references in `refs` and returns how long freeing took."""
+    start = time.perf_counter()
+    refs.clear()
+    return time.perf_counter() - start
+
+
+class Span:
+    """Accumulated time of one named region; repeated entries add up."""
+
+    __slots__ = ("name", "elapsed", "calls", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.elapsed = 0.0
+        self.calls = 0
+        self.children: Dict[str, "Span"] = {}
+
+    def lines(self, total: Optional[float] = None, depth: int = 0) -> List[str]:
+        """Indented `name  seconds  share  calls` rows for this span's subtree."""
+        total = total or self.elapsed or 1.0
+        out = []
+        for child in self.children.values():
+            calls = f"  x{child.calls}" if child.calls > 1 else ""
+            out.append(
+                f"{'  ' * depth}{child.name:<{32 - 2 * depth}} "
+                f"{child.elapsed:.6f}s {child.elapsed / total:6.1%}{calls}"
+            )
+            out += child.lines(total, depth + 1)
+        return out
+
+
+# innermost open span while `record_spans` is active, otherwise None
+_active_span: Optional[Span] = None
+
+
+class span:
+    """
+    Times a region of solution code when a caller is recording:
+
+        with span("transpose"):
+            cols = list(zip(*rows))
+
+    Outside `record_spans` a span is just an object and a global lookup, but
+    still wrap whole loops rather than individual iterations.
+    """
+
+    __slots__ = ("name", "node", "parent", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.node = None
+
+    def __enter__(self) -> "span":
+        global _active_span
+        parent = _active_span
+        if parent is None:
+            return self
+        node = parent.children.get(self.name)
+        if node is None:
+            node = parent.children[self.name] = Span(self.name)
+        node.calls += 1
+        self.node, self.parent = node, parent
+        _active_span = node
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        global _active_span
+        if self.node is not None:
+            self.node.elapsed += time.perf_counter() - self.start
+            _active_span = self.parent
+            self.node = None
+
+
+@contextmanager
+def record_spans(name: str = "solve") -> Iterator[Span]:
+    """Collects the `span`s opened inside the block under a root span."""
+    global _active_span
+    root, previous = Span(name), _active_span
+    _active_span = root
+    start = time.perf_counter()
+    try:
+        yield root
+    finally:
+        root.elapsed = time.perf_counter() - start
+        root.calls = 1
+        _active_span = previous
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of `values` (pct in 0..100)."""
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def _time_loops(fn: Callable[[Any], Any], data: Any, loops: int) -> Tuple[Any, float]:
+    # Solutions may mutate their input (e.g. 2025 day04), so every call gets its
+    # own copy. Copies are made one at a time outside the timed region, so
+    # memory stays at one copy however high calibration pushes `loops`.
+    result = None
+    elapsed = 0.0
+    for _ in range(loops):
+        d = copy.deepcopy(data)
+        start = time.perf_counter()
+        result = fn(d)
+        elapsed += time.perf_counter() - start
+        del d
+    return result, elapsed
+
+
+def calibrate_loops(
+    fn: Callable[[Any], Any], data: Any, min_sample: float = 0.05
+) -> int:
+    """Picks calls per sample like `timeit.autorange`: 1, 2, 5, 10, 20, ..."""
+    loops = 1
+    while True:
+        for factor in (1, 2, 5):
+            n = loops * factor
+            _, elapsed = _time_loops(fn, data, n)
+            if elapsed >= min_sample:
+                return n
+        loops *= 10
+
+
+def measure_repeated(
+    fn: Callable[[Any], Any],
+    data: Any,
+    repeat: int = 5,
+    warmup: int = 1,
+    loops: Optional[int] = None,
+) -> TimingStats:
+    """Times `fn` over `repeat` samples after `warmup` discarded calls."""
+    for _ in range(warmup):
+        fn(copy.deepcopy(data))
+    loops = loops or calibrate_loops(fn, data)
+
+    result = None
+    samples = []
+    for _ in range(repeat):
+        result, elapsed = _time_loops(fn, data, loops)
+        samples.append(elapsed / loops)
+
+    # harness cost: the same loop around a no-op
+    _, empty = _time_loops(lambda d: None, data, loops)
+    return TimingStats(result, samples, loops, empty / loops)
+
+
+def scaled_datasets(
+    problem: Any,
+    sizes: Optional[Sequence[int]] = None,
+    seed: int = 0,
+    part: Optional[int] = None,
+) -> Optional[Iterator[Tuple[int, Any]]]:
+    """
+    Yields (size, parsed data) for a scalability sweep, or returns None when the
+    module has no generator.
+
+    Modules either define `generate_scaled_input()` returning the datasets
+    themselves, or `generate_input(size, seed)` returning valid raw puzzle text
+    plus `SCALE_SIZES`, the sizes swept by default (a list, or a {part: list}
+    dict when one part is much slower than the other). Datasets are generated
+    one at a time so large sizes are never all held in memory together.
+    """
+    if sizes is None and hasattr(problem, "generate_scaled_input"):
+        return iter(problem.generate_scaled_input())
+    if not hasattr(problem, "generate_input"):
+        return None
+    if sizes is None:
+        sizes = getattr(problem, "SCALE_SIZES", [10, 100, 1000, 10000])
+        if isinstance(sizes, dict):
+            sizes = sizes[part or min(sizes)]
+    return ((n, problem.parse(problem.generate_input(n, seed))) for n in sizes)
+
+
 def measure_scalability(
-    fn: Callable[[Any], Any], datasets: List[Tuple[int, Any]]
+    fn: Callable[[Any], Any],
+    datasets: List[Tuple[int, Any]],
+    repeat: int = 3,
+    max_repeat_time: float = 1.0,
 ) -> List[Tuple[int, float]]:
-    """Measures the scalability of a function using given datasets."""
+    """
+    Measures the scalability of a function using given datasets. Each size keeps
+    the best of `repeat` runs, but stops repeating once a run exceeds
+    `max_repeat_time` seconds.
+    """
     out = []
     for size, data in datasets:
-        _, t = measure_performance(fn, data)
-        out.append((size, t))
+        best = math.inf
+        for _ in range(repeat):
+            _, t = measure_performance(fn, copy.deepcopy(data))
+            best = min(best, t)
+            if t > max_repeat_time:
+                break
+        out.append((size, best))
     return out
 
 
+def get_variants(problem: Any, part: int) -> Optional[Dict[str, Callable]]:
+    """
+    The implementations a module registers for `part` as
+    `variants = {part: {name: fn, ...}}`. The first one is the reference the
+    others must agree with; `solutionN` itself is usually one of them.
+    """
+    variants = getattr(problem, "variants", {}).get(part)
+    return dict(variants) if variants else None
+
+
+def example_inputs(problem: Any) -> List[str]:
+    """Raw example inputs embedded in a module (`tests` entries, `test_data`)."""
+    raws = [raw for raw, *_ in getattr(problem, "tests", [])]
+    if hasattr(problem, "test_data"):
+        raws.append(problem.test_data)
+    return raws
+
+
+def _disagreements(label: str, results: Dict[str, Any]) -> List[str]:
+    (ref_name, expected), *others = results.items()
+    return [
+        f"{label}: {name} returned {got!r}, {ref_name} returned {expected!r}"
+        for name, got in others
+        if got != expected
+    ]
+
+
+def check_variants(
+    variants: Dict[str, Callable], datasets: Iterable[Tuple[str, Any]]
+) -> List[str]:
+    """Runs every variant on each (label, data) and lists the disagreements."""
+    mismatches = []
+    for label, data in datasets:
+        results = {name: fn(copy.deepcopy(data)) for name, fn in variants.items()}
+        mismatches += _disagreements(label, results)
+    return mismatches
+
+
+def measure_variants(
+    variants: Dict[str, Callable],
+    datasets: Iterable[Tuple[int, Any]],
+    repeat: int = 3,
+    max_repeat_time: float = 1.0,
+) -> Iterator[Tuple[int, Dict[str, float], List[str]]]:
+    """
+    Yields (size, best time per variant, disagreements) for each dataset, timing
+    like `measure_scalability` and comparing answers against the reference.
+    """
+    for size, data in datasets:
+        times, results = {}, {}
+        for name, fn in variants.items():
+            best = math.inf
+            for _ in range(repeat):
+                results[name], t = measure_performance(fn, copy.deepcopy(data))
+                best = min(best, t)
+                if t > max_repeat_time:
+                    break
+            times[name] = best
+        yield size, times, _disagreements(f"size {size}", results)
+
+
+# two-sided 95% Student-t critical values by degrees of freedom
+_T95 = {1: 12.71, 2: 4.30, 3: 3.18, 4: 2.78, 5: 2.57, 6: 2.45, 7: 2.36, 8: 2.31}
+
+
+@dataclass
+class ComplexityFit:
+    """Power-law fit time ~ c * n^exponent over (size, seconds) measurements."""
+
+    exponent: float
+    ci95: float
+    r_squared: float
+    points: int
+
+    def __str__(self) -> str:
+        return (
+            f"≈ n^{self.exponent:.2f} ± {self.ci95:.2f} "
+            f"(95% CI, R²={self.r_squared:.3f}, {self.points} sizes)"
+        )
+
+
+def fit_complexity(results: List[Tuple[int, float]]) -> ComplexityFit:
+    """Least-squares fit of log(time) against log(size)."""
+    pts = [(math.log(n), math.log(t)) for n, t in results if n > 0 and t > 0]
+    if len(pts) < 2:
+        raise ValueError("need at least two sizes with non-zero time to fit")
+
+    k = len(pts)
+    mx = sum(x for x, _ in pts) / k
+    my = sum(y for _, y in pts) / k
+    sxx = sum((x - mx) ** 2 for x, _ in pts)
+    sxy = sum((x - mx) * (y - my) for x, y in pts)
+    syy = sum((y - my) ** 2 for _, y in pts)
+    if sxx == 0:
+        raise ValueError("need at least two distinct sizes to fit")
+
+    slope = sxy / sxx
+    residual = max(syy - slope * sxy, 0.0)
+    r_squared = 1 - residual / syy if syy > 0 else 1.0
+    if k > 2:
+        stderr = math.sqrt(residual / (k - 2) / sxx)
+        ci95 = _T95.get(k - 2, 2.0) * stderr
+    else:
+        ci95 = math.inf
+    return ComplexityFit(slope, ci95, r_squared, k)
+
+
+def expected_complexity(problem: Any, part: int) -> Optional[float]:
+    """
+    Reads a module's declared growth bound. `EXPECTED_COMPLEXITY` is either one
+    exponent for both parts (1 for O(n), 2 for O(n^2), ...) or a {part: exponent}
+    dict.
+    """
+    bound = getattr(problem, "EXPECTED_COMPLEXITY", None)
+    if isinstance(bound, dict):
+        return bound.get(part)
+    return bound
+
+
+def check_complexity(
+    fit: ComplexityFit, expected: float, tolerance: float = 0.25
+) -> bool:
+    """
+    True when the fitted exponent stays within `tolerance` of the declared bound.
+    The tolerance absorbs log factors: n log n measures as roughly n^1.1.
+    """
+    return fit.exponent <= expected + tolerance
+
+
 def flatten(nested_list: List[List[Any]]) -> List[Any]:
     """
     Flatten a nested list of lists into a single list.
@@ -93,3 +1209,23 @@ def flatten(nested_list: List[List[Any]]) -> List[Any]:
         raise TypeError("Input must be a list of lists.")
 
     return list(chain.from_iterable(nested_list))
+
+
+def test_time_loops_keeps_one_copy_alive():
+    class Box:
+        alive = 0
+
+        def __init__(self):
+            Box.alive += 1
+
+        def __del__(self):
+            Box.alive -= 1
+
+        def __deepcopy__(self, memo):
+            return Box()
+
+    peak = []
+    data = Box()
+    _time_loops(lambda d: peak.append(Box.alive), data, loops=50)
+    # the original plus the copy being solved, never all 50 copies at once
+    assert max(peak) == 2
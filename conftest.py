@@ -0,0 +1,69 @@
+import pytest
+
+from common import (
+    check_complexity,
+    expected_complexity,
+    fit_complexity,
+    measure_scalability,
+    scaled_datasets,
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--complexity",
+        action="store_true",
+        help="Fail days whose --scale growth exceeds their EXPECTED_COMPLEXITY",
+    )
+
+
+class ComplexityError(AssertionError):
+    pass
+
+
+class ComplexityItem(pytest.Item):
+    """Fits a day's scaling curve and checks it against the declared bound."""
+
+    def __init__(self, *, part, expected, **kwargs):
+        super().__init__(**kwargs)
+        self.part = part
+        self.expected = expected
+
+    def runtest(self):
+        problem = self.parent.obj
+        datasets = scaled_datasets(problem, part=self.part)
+        solution = getattr(problem, f"solution{self.part}")
+        fit = fit_complexity(measure_scalability(solution, datasets))
+        if not check_complexity(fit, self.expected):
+            raise ComplexityError(
+                f"part {self.part} grows {fit}, expected ≤ n^{self.expected:g}"
+            )
+
+    def repr_failure(self, excinfo):
+        if isinstance(excinfo.value, ComplexityError):
+            return str(excinfo.value)
+        return super().repr_failure(excinfo)
+
+    def reportinfo(self):
+        return self.path, None, self.name
+
+
+def pytest_pycollect_makeitem(collector, name, obj):
+    # `EXPECTED_COMPLEXITY` doubles as the collection anchor, so only modules
+    # that declare a bound (and can generate inputs) get complexity items.
+    if name != "EXPECTED_COMPLEXITY":
+        return None
+    if not collector.config.getoption("--complexity"):
+        return []
+    problem = collector.obj
+    if not (
+        hasattr(problem, "generate_scaled_input") or hasattr(problem, "generate_input")
+    ):
+        return []
+    return [
+        ComplexityItem.from_parent(
+            collector, name=f"complexity[part{part}]", part=part, expected=expected
+        )
+        for part in (1, 2)
+        if (expected := expected_complexity(problem, part)) is not None
+    ]
@@ -0,0 +1,253 @@
+"""
+Resident runner: `python daemon.py serve` keeps numpy, pytest, the tooling
+modules and every solution imported, and answers requests over a Unix socket.
+`python daemon.py <main.py arguments>` is the thin client; it only imports the
+standard library and falls back to running main.py itself when no server is up.
+"""
+
+import json
+import os
+import socket
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOCKET_PATH = os.path.join(ROOT, ".cache", "runner.sock")
+
+
+class _SocketWriter:
+    """
+    File-like object forwarding writes to the client as JSON lines, tagged
+    "out" or "err" so the client can write them to the matching stream.
+    """
+
+    def __init__(self, conn: socket.socket, stream: str = "out"):
+        self.conn = conn
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        if text:
+            self.conn.sendall(json.dumps({self.stream: text}).encode() + b"\n")
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+class _Reloader:
+    """Reloads solution modules whose file changed since they were imported."""
+
+    def __init__(self):
+        self.mtimes = {}
+
+    def _solution_modules(self):
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None)
+            if name.startswith("solutions.") and path:
+                yield name, module, path
+
+    def snapshot(self) -> None:
+        for name, _, path in self._solution_modules():
+            if name not in self.mtimes:
+                self.mtimes[name] = os.stat(path).st_mtime_ns
+
+    def reload_changed(self) -> list:
+        import importlib
+
+        reloaded = []
+        for name, module, path in self._solution_modules():
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if self.mtimes.get(name, mtime) != mtime:
+                try:
+                    importlib.reload(module)
+                except Exception as e:  # keep serving; the next run reports it
+                    print(f"reload {name} failed: {e}", file=sys.stderr)
+                    del sys.modules[name]
+                self.mtimes[name] = mtime
+                reloaded.append(name)
+        return reloaded
+
+
+def _warm_up() -> None:
+    import numpy  # noqa: F401
+    import pytest  # noqa: F401
+
+    # main.py imports these per command; a warm runner holds them all
+    import benchmarks.history  # noqa: F401
+    import benchmarks.suite  # noqa: F401
+    import main  # noqa: F401
+    import profilers  # noqa: F401
+    import runner  # noqa: F401
+    import supervisor  # noqa: F401
+    from registry import registry
+
+    for year, day in registry.days():
+        try:
+            registry.load(year, day)
+        except Exception as e:
+            print(f"{year} day {day:02d} failed to import: {e}", file=sys.stderr)
+
+
+def _handle(conn: socket.socket, argv: list, reloader: _Reloader) -> int:
+    import contextlib
+
+    import main
+    from registry import registry
+
+    out, err = _SocketWriter(conn, "out"), _SocketWriter(conn, "err")
+    code = 0
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        registry.refresh()
+        for name in reloader.reload_changed():
+            print(f"reloaded {name}", file=sys.stderr)
+        try:
+            main.cli(argv)
+        except SystemExit as e:
+            if isinstance(e.code, str):
+                print(e.code, file=sys.stderr)
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}", file=sys.stderr)
+            code = 1
+    reloader.snapshot()
+    return code
+
+
+def serve(path: str = SOCKET_PATH) -> None:
+    """Serves requests one at a time until a client sends `stop`."""
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    _warm_up()
+    reloader = _Reloader()
+    reloader.snapshot()
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if os.path.exists(path):
+        live = _connect(path)
+        if live is not None:
+            live.close()
+            sys.exit(f"a runner is already listening on {path}")
+        os.unlink(path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+    print(f"Runner listening on {path} (pid {os.getpid()})", file=sys.stderr)
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                with conn.makefile("rb") as f:
+                    request = json.loads(f.readline())
+                if request["argv"] == ["stop"]:
+                    conn.sendall(json.dumps({"exit": 0}).encode() + b"\n")
+                    break
+                try:
+                    code = _handle(conn, request["argv"], reloader)
+                    conn.sendall(json.dumps({"exit": code}).encode() + b"\n")
+                except BrokenPipeError:
+                    pass  # client went away mid-run
+    finally:
+        server.close()
+        os.unlink(path)
+
+
+def _connect(path: str):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+    return sock
+
+
+def request(argv: list, path: str = SOCKET_PATH) -> int:
+    """Sends `argv` to the runner, streams its output and returns the exit code."""
+    sock = _connect(path)
+    if sock is None:
+        if argv == ["stop"]:
+            return 0
+        main_py = os.path.join(ROOT, "main.py")
+        os.execv(sys.executable, [sys.executable, main_py, *argv])
+
+    with sock, sock.makefile("rb") as f:
+        sock.sendall(json.dumps({"argv": argv}).encode() + b"\n")
+        for line in f:
+            message = json.loads(line)
+            if "exit" in message:
+                return message["exit"]
+            if "out" in message:
+                stream, text = sys.stdout, message["out"]
+            else:
+                stream, text = sys.stderr, message["err"]
+            stream.write(text)
+            stream.flush()
+    return 1  # the server died mid-request
+
+
+def _copy_tree(dest: str) -> None:
+    """The code and solutions, without caches, inputs or benchmark history."""
+    import shutil
+
+    for name in os.listdir(ROOT):
+        if name.endswith(".py"):
+            shutil.copy(os.path.join(ROOT, name), dest)
+    skip = shutil.ignore_patterns("__pycache__", "*.sqlite", "report.*")
+    for name in ("benchmarks", "solutions"):
+        shutil.copytree(os.path.join(ROOT, name), os.path.join(dest, name), ignore=skip)
+
+
+def test_serve_request_reload(tmp_path, capsys):
+    import subprocess
+    import time
+
+    _copy_tree(str(tmp_path))
+    (tmp_path / "inputs" / "2015").mkdir(parents=True)
+    (tmp_path / "inputs" / "2015" / "day01.in").write_text("(()(\n")
+    path = str(tmp_path / ".cache" / "runner.sock")
+    server = subprocess.Popen(
+        [sys.executable, str(tmp_path / "daemon.py"), "serve"],
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 60
+        while not os.path.exists(path):
+            assert server.poll() is None and time.monotonic() < deadline
+            time.sleep(0.05)
+
+        assert request(["2015", "1", "1"], path) == 0
+        assert capsys.readouterr() == ("2\n", "")
+
+        # a bad command line: usage and error on stderr only, argparse's code
+        assert request(["2015"], path) == 2
+        out, err = capsys.readouterr()
+        assert out == "" and "usage:" in err
+
+        # an edited solution is reloaded before the next request
+        day01 = tmp_path / "solutions" / "2015" / "day01.py"
+        day01.write_text(
+            day01.read_text() + "\n\ndef solution1(data):\n    return -1\n"
+        )
+        stat = day01.stat()
+        os.utime(day01, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert request(["2015", "1", "1"], path) == 0
+        out, err = capsys.readouterr()
+        assert out == "-1\n"
+        assert "reloaded solutions.2015.day01" in err
+
+        assert request(["stop"], path) == 0
+        assert server.wait(timeout=10) == 0
+        assert not os.path.exists(path)
+    finally:
+        if server.poll() is None:
+            server.kill()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["serve"]:
+        serve()
+    else:
+        sys.exit(request(sys.argv[1:]))
@@ -2,13 +2,11 @@ import logging
 import os
 import sys
 
-import pytest
-
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
 from common import setup_logging
 
-logger = setup_logging(logging.INFO)
+logger = setup_logging(logging.INFO, __name__)
 
 
 def parse(raw_data: str) -> str:
@@ -29,18 +27,13 @@ test_data: str = """1
 3"""
 
 
-@pytest.fixture
-def input_data() -> str:
-    return test_data
-
-
-@pytest.mark.parametrize(
-    "expected, solution",
-    [
+def test_solutions():
+    test_cases = [
         (0, solution1),
         (0, solution2),
-    ],
-)
-def test_solutions(input_data, expected, solution):
-    result = solution(parse(input_data))
-    assert result == expected, f"Expected {expected}, got {result}"
+    ]
+    for expected, solution in test_cases:
+        result = solution(parse(test_data))
+        assert (
+            result == expected
+        ), f"{solution.__name__}: expected {expected}, got {result}"
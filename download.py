@@ -0,0 +1,289 @@
+"""
+Puzzle input downloader: fetches a year's inputs concurrently through one
+pooled `requests.Session`, at most one request per `interval` seconds, and
+never re-fetches an input that is already on disk. `StandInServer` mimics the
+AoC input endpoint for offline use (`--base-url`) and for the tests below.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = "https://adventofcode.com"
+INPUTS_DIR = "inputs"
+ETAGS_PATH = os.path.join(".cache", "downloads", "etags.json")
+# AoC asks automated tools to identify themselves
+USER_AGENT = "github.com/moidshaikh/advent_of_code input downloader"
+TOKEN_ENV = "AOC_SESSION"
+
+
+@dataclass
+class Download:
+    year: int
+    day: int
+    path: str
+    status: str  # "cached", "fetched", "not-modified", "unavailable" or "error"
+    detail: str = ""
+
+
+def days_in(year: int) -> int:
+    # from 2025 on, events run for 12 days instead of 25
+    return 12 if year >= 2025 else 25
+
+
+def input_path(year: int, day: int, inputs_dir: str = INPUTS_DIR) -> str:
+    return os.path.join(inputs_dir, str(year), f"day{day:02d}.in")
+
+
+class RateLimiter:
+    """Spaces request starts at least `interval` seconds apart across threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class Downloader:
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: str = BASE_URL,
+        inputs_dir: str = INPUTS_DIR,
+        etags_path: str = ETAGS_PATH,
+        interval: float = 1.0,
+        jobs: int = 4,
+    ):
+        token = token or os.environ.get(TOKEN_ENV)
+        if not token:
+            raise RuntimeError(f"set {TOKEN_ENV} to your adventofcode.com session")
+        self.base_url = base_url.rstrip("/")
+        self.inputs_dir = inputs_dir
+        self.etags_path = etags_path
+        self.jobs = jobs
+        self.limiter = RateLimiter(interval)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=jobs)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.cookies.set("session", token)
+        self.session.headers["User-Agent"] = USER_AGENT
+
+        try:
+            with open(etags_path) as f:
+                self.etags: Dict[str, str] = json.load(f)
+        except (OSError, ValueError):
+            self.etags = {}
+        self._etags_lock = threading.Lock()
+
+    def fetch(self, year: int, day: int, force: bool = False) -> Download:
+        """
+        Downloads one input unless a non-empty copy exists. With `force`, the
+        stored ETag is sent so an unchanged input costs a 304 and no rewrite.
+        """
+        path = input_path(year, day, self.inputs_dir)
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists and not force:
+            return Download(year, day, path, "cached")
+
+        url = f"{self.base_url}/{year}/day/{day}/input"
+        headers = {}
+        if exists and url in self.etags:
+            headers["If-None-Match"] = self.etags[url]
+
+        self.limiter.wait()
+        try:
+            response = self.session.get(url, headers=headers, timeout=30)
+        except requests.RequestException as e:
+            return Download(year, day, path, "error", str(e))
+
+        if response.status_code == 304:
+            return Download(year, day, path, "not-modified")
+        if response.status_code == 404:
+            return Download(year, day, path, "unavailable", "not unlocked yet")
+        if response.status_code != 200:
+            detail = f"HTTP {response.status_code}: {response.text.strip()[:80]}"
+            return Download(year, day, path, "error", detail)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(response.content)
+        os.replace(tmp, path)
+        if "ETag" in response.headers:
+            with self._etags_lock:
+                self.etags[url] = response.headers["ETag"]
+        return Download(year, day, path, "fetched", f"{len(response.content)} bytes")
+
+    def fetch_all(
+        self, year: int, days: Optional[Iterable[int]] = None, force: bool = False
+    ) -> List[Download]:
+        days = list(days or range(1, days_in(year) + 1))
+        try:
+            with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                return list(pool.map(lambda d: self.fetch(year, d, force), days))
+        finally:
+            self._save_etags()
+
+    def _save_etags(self) -> None:
+        os.makedirs(os.path.dirname(self.etags_path), exist_ok=True)
+        with open(self.etags_path, "w") as f:
+            json.dump(self.etags, f, indent=1, sort_keys=True)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+# --- Offline stand-in for adventofcode.com ---
+
+
+class StandInServer:
+    """
+    Serves `inputs[(year, day)]` at /<year>/day/<day>/input on localhost, with
+    the session check, 404s for locked days and ETag/304 handling of the real
+    site. Use as a context manager; `url` is the base URL to download from.
+    """
+
+    INPUT_RE = re.compile(r"^/(\d{4})/day/(\d{1,2})/input$")
+
+    def __init__(self, inputs: Dict[Tuple[int, int], str], token: str = "test"):
+        self.inputs = inputs
+        self.token = token
+        self.requests: List[str] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stand_in.requests.append(self.path)
+                match = stand_in.INPUT_RE.match(self.path)
+                if f"session={stand_in.token}" not in self.headers.get("Cookie", ""):
+                    return self._reply(400, "Puzzle inputs differ by user.")
+                key = match and (int(match.group(1)), int(match.group(2)))
+                if key not in stand_in.inputs:
+                    return self._reply(404, "404 Not Found")
+                body = stand_in.inputs[key].encode()
+                etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+                if self.headers.get("If-None-Match") == etag:
+                    return self._reply(304, "", etag)
+                self._reply(200, body, etag)
+
+            def _reply(self, status, body, etag=None):
+                body = body.encode() if isinstance(body, str) else body
+                self.send_response(status)
+                if etag:
+                    self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self) -> "StandInServer":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def test_download_year_offline(tmp_path):
+    inputs = {(2015, d): f"input {d}\n" for d in range(1, 4)}
+    with StandInServer(inputs, token="abc") as server:
+        downloader = Downloader(
+            "abc",
+            server.url,
+            inputs_dir=str(tmp_path / "inputs"),
+            etags_path=str(tmp_path / "etags.json"),
+            interval=0,
+        )
+        results = downloader.fetch_all(2015, days=range(1, 5))
+        assert [r.status for r in results] == ["fetched"] * 3 + ["unavailable"]
+        with open(results[0].path) as f:
+            assert f.read() == "input 1\n"
+
+        # on-disk inputs are never requested again
+        seen = len(server.requests)
+        assert {r.status for r in downloader.fetch_all(2015, days=range(1, 4))} == {
+            "cached"
+        }
+        assert len(server.requests) == seen
+
+        # a forced refresh revalidates with the stored ETag
+        assert downloader.fetch(2015, 2, force=True).status == "not-modified"
+
+
+def test_download_rejects_bad_session(tmp_path):
+    with StandInServer({(2015, 1): "x"}, token="abc") as server:
+        downloader = Downloader(
+            "wrong", server.url, inputs_dir=str(tmp_path), interval=0
+        )
+        result = downloader.fetch(2015, 1)
+        assert result.status == "error" and "400" in result.detail
+        assert not os.path.exists(result.path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Download Advent of Code inputs")
+    parser.add_argument("year", type=int)
+    parser.add_argument(
+        "--days",
+        type=lambda v: [int(x) for x in v.split(",")],
+        help="Comma-separated days (default: the whole event)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Revalidate inputs that already exist"
+    )
+    parser.add_argument("--jobs", type=int, default=4, help="Concurrent requests")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Minimum seconds between request starts",
+    )
+    parser.add_argument(
+        "--base-url",
+        default=BASE_URL,
+        help="Server to fetch from (e.g. a StandInServer)",
+    )
+    args = parser.parse_args()
+
+    try:
+        downloader = Downloader(
+            base_url=args.base_url, interval=args.interval, jobs=args.jobs
+        )
+    except RuntimeError as e:
+        sys.exit(f"⚠ ERROR: {e}")
+    results = downloader.fetch_all(args.year, args.days, force=args.force)
+    downloader.close()
+    for r in results:
+        print(f"{r.year} day {r.day:02d} | {r.status:<12} {r.detail}")
+    sys.exit(1 if any(r.status == "error" for r in results) else 0)
@@ -1,74 +1,464 @@
 import argparse
-import importlib
+import copy
+import functools
 import os
+import sys
 
+from cache import cached_answer, load_parsed
 from common import (
+    PhaseTimes,
+    check_complexity,
+    check_variants,
+    example_inputs,
+    expected_complexity,
+    file_hash,
+    fit_complexity,
+    get_variants,
     measure_performance,
+    measure_repeated,
     measure_scalability,
+    measure_variants,
     read_input,
-    run_tests,
+    record_spans,
+    release,
+    scaled_datasets,
+    set_log_levels,
     setup_logging,
 )
+from registry import load_problem, registry
 
+# Tooling modules (benchmarks, profilers, runner, startup, supervisor) are
+# imported in the branches that use them, so a plain run only loads the
+# registry, the caches and common.py.
 
-def load_problem(year, day):
-    module = f"solutions.{year}.day{day:02d}"
-    return importlib.import_module(module)
 
+def main(
+    year,
+    day,
+    part,
+    test_flag,
+    time_flag,
+    scale_flag,
+    repeat=None,
+    warmup=1,
+    parse_cache=True,
+    mem_flag=False,
+    top=10,
+    profile_flag=False,
+    pstats_path=None,
+    collapsed_path=None,
+    sizes=None,
+    seed=0,
+    jobs=None,
+    budget=1.0,
+    answer_cache=False,
+    variants_flag=False,
+):
+    # --- Test mode ---
+    if test_flag:
+        from runner import run_tests
 
-def main(year, day, part, test_flag, time_flag, scale_flag):
-    setup_logging()
+        sys.exit(1 if run_tests([(year, day)], jobs=jobs, budget=budget) else 0)
 
-    problem = load_problem(year, day)
+    setup_logging()
 
-    # --- Test mode ---
-    if test_flag:
-        run_tests(problem)
+    # --- Variant comparison uses examples and generated inputs only ---
+    if variants_flag:
+        run_variants(load_problem(year, day), year, day, part, sizes, seed)
         return
 
-    # --- Load input + parse ---
     input_path = os.path.join("inputs", str(year), f"day{day:02d}.in")
-    raw = read_input(input_path)
-    data = problem.parse(raw)
+
+    # --- Default run: with --answer-cache, answered without importing the module ---
+    if not (time_flag or scale_flag or mem_flag or profile_flag):
+
+        def solve():
+            problem = load_problem(year, day)
+            data = load_parsed(problem, input_path, use_cache=parse_cache, stream=True)
+            return getattr(problem, f"solution{part}")(data)
+
+        source_path = registry.get(year, day).path
+        result, hit = cached_answer(
+            source_path, input_path, part, solve, use_cache=answer_cache
+        )
+        if hit:
+            print(f"{year} day {day:02d} part {part}: cached answer", file=sys.stderr)
+        print(result)
+        return
+
+    from benchmarks.history import record_run
+
+    problem = load_problem(year, day)
 
     # choose part
     solution = getattr(problem, f"solution{part}")
 
-    # --- Default run ---
-    if not time_flag and not scale_flag:
-        print(solution(data))
+    # --- Scale-only runs use generated inputs, not the puzzle input ---
+    if scale_flag and not (time_flag or mem_flag or profile_flag):
+        run_scale(problem, year, day, part, sizes, seed)
         return
 
-    # --- Time measurement ---
+    # --- Load input + parse ---
     if time_flag:
-        result, elapsed = measure_performance(solution, data)
+        # timed phase by phase, so neither the parse cache nor streaming readers
+        raw, t_read = measure_performance(read_input, input_path)
+        data, t_parse = measure_performance(problem.parse, raw)
+    else:
+        # A streamed input can only be consumed once, so stream only for single runs.
+        stream = not (repeat or mem_flag or profile_flag)
+        data = load_parsed(problem, input_path, use_cache=parse_cache, stream=stream)
+
+    # --- Memory / CPU profiles ---
+    if mem_flag:
+        from profilers import measure_memory, print_memory_report
+
+        print_memory_report(measure_memory(solution, data, top=top))
+    if profile_flag:
+        from profilers import print_cpu_report, profile_cpu
+
+        result, stats = profile_cpu(
+            solution, copy.deepcopy(data), pstats_path, collapsed_path
+        )
+        print_cpu_report(result, stats, top=top)
+        if pstats_path:
+            print(f"\nWrote {pstats_path} (open with `python -m pstats` or snakeviz)")
+        if collapsed_path:
+            print(f"Wrote {collapsed_path} (collapsed stacks for flamegraph tools)")
+    if (mem_flag or profile_flag) and not time_flag and not scale_flag:
+        return
+
+    input_hash = file_hash(input_path)
+
+    # --- Time measurement ---
+    if time_flag and repeat:
+        stats = measure_repeated(solution, data, repeat=repeat, warmup=warmup)
+        parse_stats = measure_repeated(problem.parse, raw, repeat=repeat, warmup=warmup)
+        phases = PhaseTimes(t_read, parse_stats.median, stats.median)
+        refs = [raw, data]
+        del raw, data
+        phases.teardown = release(refs)
+        print(f"Result: {stats.result}")
+        print(f"Time: {stats}")
+        print(f"Phases (medians): {phases}")
+        record_run(
+            year,
+            day,
+            part,
+            input_hash,
+            problem.__file__,
+            stats.median,
+            stats.min,
+            stats.p95,
+            len(stats.samples),
+        )
+    elif time_flag:
+        with record_spans() as spans:
+            result, elapsed = measure_performance(solution, data)
+        refs = [raw, data]
+        del raw, data
+        phases = PhaseTimes(t_read, t_parse, elapsed, release(refs))
         print(f"Result: {result}  (time: {elapsed:.6f}s)")
+        print(f"Phases: {phases}")
+        if spans.children:
+            print("Spans in solve:")
+            print("\n".join(f"  {line}" for line in spans.lines()))
+        record_run(year, day, part, input_hash, problem.__file__, elapsed)
 
     # --- Scalability test ---
     if scale_flag:
-        if hasattr(problem, "generate_scaled_input"):
-            datasets = problem.generate_scaled_input()
-        else:
-            # fallback: repeat input N times
-            base = raw.strip() or "x"
-            sizes = [10, 100, 1000, 5000]
-            datasets = [(s, problem.parse(base * s)) for s in sizes]
+        run_scale(problem, year, day, part, sizes, seed)
 
-        results = measure_scalability(solution, datasets)
-        print("\nSize | Time (s)")
-        for s, t in results:
-            print(f"{s:5} | {t:.6f}")
 
+def run_scale(problem, year, day, part, sizes=None, seed=0):
+    from benchmarks.history import record_run
 
-if __name__ == "__main__":
+    solution = getattr(problem, f"solution{part}")
+    datasets = scaled_datasets(problem, sizes, seed, part)
+    if datasets is None:
+        print(
+            f"No input generator for {year} day {day:02d}: define "
+            "generate_input(size, seed) and SCALE_SIZES in the module."
+        )
+        sys.exit(1)
+
+    results = measure_scalability(solution, datasets)
+    print("\n    Size | Time (s)")
+    for s, t in results:
+        print(f"{s:8} | {t:.6f}")
+        record_run(
+            year,
+            day,
+            part,
+            f"scale:{s}:seed{seed}",
+            problem.__file__,
+            t,
+            kind="scale",
+            size=s,
+        )
+
+    try:
+        fit = fit_complexity(results)
+    except ValueError as e:
+        print(f"\nGrowth: cannot fit ({e})")
+        return
+    print(f"\nGrowth: {fit}")
+    expected = expected_complexity(problem, part)
+    if expected is not None:
+        ok = check_complexity(fit, expected)
+        print(f"Expected: ≤ n^{expected:g}  -> {'PASS' if ok else 'FAIL'}")
+        if not ok:
+            sys.exit(1)
+
+
+def run_variants(problem, year, day, part, sizes=None, seed=0):
+    variants = get_variants(problem, part)
+    if variants is None:
+        print(
+            f"No variants for {year} day {day:02d} part {part}: define "
+            "variants = {part: {name: fn, ...}} in the module."
+        )
+        sys.exit(1)
+    reference = next(iter(variants))
+
+    examples = [
+        (f"example {i}", problem.parse(raw))
+        for i, raw in enumerate(example_inputs(problem), 1)
+    ]
+    mismatches = check_variants(variants, examples)
+    print(f"Examples: {len(examples)} checked, {len(mismatches)} disagreements")
+
+    if sizes is None and hasattr(problem, "VARIANT_SIZES"):
+        # the reference is often too slow for the SCALE_SIZES sweep
+        sizes = problem.VARIANT_SIZES
+        if isinstance(sizes, dict):
+            sizes = sizes.get(part)
+    datasets = scaled_datasets(problem, sizes, seed, part)
+    if datasets is not None:
+        width = max(16, *map(len, variants))
+        print(f"\nSpeedup vs {reference}")
+        print("    Size | " + " | ".join(f"{name:>{width}}" for name in variants))
+        for size, times, disagreements in measure_variants(variants, datasets):
+            cells = [
+                f"{t:.6f}s {times[reference] / t:5.1f}x" if t else "n/a"
+                for t in times.values()
+            ]
+            print(f"{size:8} | " + " | ".join(f"{c:>{width}}" for c in cells))
+            mismatches += disagreements
+
+    for m in mismatches:
+        print(f"MISMATCH {m}")
+    if mismatches:
+        sys.exit(1)
+
+
+def cli(argv=None):
+    """Entry point shared by `python main.py` and the resident runner (daemon.py)."""
     parser = argparse.ArgumentParser()
-    parser.add_argument("year", type=int)
-    parser.add_argument("day", type=int)
-    parser.add_argument("part", type=int, choices=[1, 2])
+    parser.add_argument(
+        "year", help="Year, `all` to run every year, or `bench` for benchmark tools"
+    )
+    parser.add_argument(
+        "day",
+        nargs="?",
+        help="Day, `all` to run every day; after bench: a year filter or `compare`",
+    )
+    parser.add_argument("part", nargs="?", type=int, choices=[1, 2])
 
     parser.add_argument("--test", action="store_true", help="Run built-in tests")
     parser.add_argument("--time", action="store_true", help="Measure runtime")
     parser.add_argument("--scale", action="store_true", help="Run scalability test")
+    parser.add_argument(
+        "--variants",
+        action="store_true",
+        help="Check the module's alternative implementations agree and compare speed",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda v: [int(x) for x in v.split(",")],
+        help="With --scale/--variants: comma-separated sizes (default: SCALE_SIZES)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="With --scale/--variants: generator seed"
+    )
+    parser.add_argument(
+        "--repeat", type=int, help="With --time: timed samples (min/median/p95)"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="With --repeat: untimed warmup calls"
+    )
+    parser.add_argument(
+        "--mem",
+        action="store_true",
+        help="Report peak traced memory, peak RSS and top allocation sites",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile with cProfile and show the hottest functions",
+    )
+    parser.add_argument("--pstats", help="With --profile: write a .pstats file")
+    parser.add_argument(
+        "--collapsed", help="With --profile: write sampled collapsed stacks"
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="Rows to show in --mem/--profile reports"
+    )
+    parser.add_argument(
+        "--no-parse-cache",
+        action="store_true",
+        help="Always re-run parse() instead of loading the cached result",
+    )
+    parser.add_argument(
+        "--answer-cache",
+        action="store_true",
+        help="Reuse the stored answer while the input and solution are unchanged "
+        "(off by default)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute the answer even when --answer-cache is also given, "
+        "e.g. by an alias or `make run CACHE=1`",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="Kill the run after this many seconds "
+        "(`all` and `bench` default to a per-day and part limit)",
+    )
+    parser.add_argument(
+        "--max-mem",
+        type=int,
+        metavar="MB",
+        help="Cap the run's additional address space; allocations beyond it fail",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker processes for `all` and --test (default: CPU count)",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=1.0,
+        help="With --test: flag cases slower than this many seconds",
+    )
+
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="bench compare: flag medians slower than baseline by this fraction",
+    )
+    parser.add_argument(
+        "--baseline", help="bench compare: git commit to compare against"
+    )
+    parser.add_argument("--json", help="bench: where to write the JSON report")
+    parser.add_argument("--html", help="bench: where to write the HTML summary")
+    parser.add_argument(
+        "--log",
+        metavar="LEVELS",
+        help="Log levels, e.g. DEBUG or 2025.day07=DEBUG,day04=ERROR "
+        "(same syntax as the AOC_LOG environment variable)",
+    )
+
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="Break down this command's import time (python -X importtime) "
+        "and fail above the startup budget",
+    )
 
-    args = parser.parse_args()
-    main(args.year, args.day, args.part, args.test, args.time, args.scale)
+    args = parser.parse_args(argv)
+    if args.startup_report:
+        from startup import print_startup_report
+
+        command = [a for a in argv or sys.argv[1:] if a != "--startup-report"]
+        sys.exit(print_startup_report(command))
+    if args.log:
+        try:
+            set_log_levels(args.log)
+        except ValueError as e:
+            parser.error(str(e))
+
+    # --- Benchmarks: `main.py bench [YEAR]` / `main.py bench compare` ---
+    if args.year == "bench":
+        from benchmarks.history import print_compare
+        from benchmarks.suite import REPORT_HTML, REPORT_JSON, main_bench
+        from runner import BATCH_TIMEOUT
+
+        if args.day == "compare":
+            sys.exit(1 if print_compare(args.threshold, args.baseline) else 0)
+        if args.day is not None and not args.day.isdigit():
+            parser.error("expected `bench`, `bench YEAR` or `bench compare`")
+        failed = main_bench(
+            None if args.day is None else int(args.day),
+            repeat=args.repeat or 3,
+            seed=args.seed,
+            timeout=BATCH_TIMEOUT if args.timeout is None else args.timeout,
+            json_path=args.json or REPORT_JSON,
+            html_path=args.html or REPORT_HTML,
+        )
+        sys.exit(1 if failed else 0)
+
+    # --- Batch mode: `main.py all` / `main.py 2025 all` ---
+    if args.year == "all" or args.day == "all":
+        from runner import main_all
+
+        year = None if args.year == "all" else int(args.year)
+        failed = main_all(
+            year,
+            jobs=args.jobs,
+            test=args.test,
+            budget=args.budget,
+            answer_cache=args.answer_cache and not args.no_cache,
+            timeout=args.timeout,
+            max_mem=args.max_mem,
+        )
+        sys.exit(1 if failed else 0)
+
+    if (
+        not args.year.isdigit()
+        or args.day is None
+        or (args.part is None and not args.test)
+    ):
+        parser.error("expected YEAR DAY PART, `YEAR all` or `all`")
+    run = functools.partial(
+        main,
+        int(args.year),
+        int(args.day),
+        args.part,
+        args.test,
+        args.time,
+        args.scale,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        parse_cache=not args.no_parse_cache,
+        mem_flag=args.mem,
+        top=args.top,
+        profile_flag=args.profile,
+        pstats_path=args.pstats,
+        collapsed_path=args.collapsed,
+        sizes=args.sizes,
+        seed=args.seed,
+        jobs=args.jobs,
+        budget=args.budget,
+        answer_cache=args.answer_cache and not args.no_cache,
+        variants_flag=args.variants,
+    )
+    if args.timeout is None and args.max_mem is None:
+        run()
+        return
+
+    # --- Supervised run: the whole command executes in a limited child ---
+    from supervisor import run_limited
+
+    outcome = run_limited(run, timeout=args.timeout, max_mem=args.max_mem)
+    if outcome.error:
+        print(outcome.telemetry(), file=sys.stderr)
+        sys.exit(1)
+    sys.exit(outcome.exit_code or 0)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,233 @@
+import copy
+import cProfile
+import io
+import os
+import pstats
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+@dataclass
+class MemoryReport:
+    result: Any
+    elapsed: float
+    peak_traced: int
+    rss_before: Optional[int]
+    peak_rss: Optional[int]
+    top_by_size: List[tracemalloc.Statistic] = field(default_factory=list)
+    top_by_count: List[tracemalloc.Statistic] = field(default_factory=list)
+
+
+def format_bytes(n: Optional[float]) -> str:
+    if n is None:
+        return "n/a"
+    for unit in ("B", "KiB", "MiB"):
+        if abs(n) < 1024:
+            return f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GiB"
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (Linux only)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def peak_rss() -> Optional[int]:
+    """High-water RSS of this process in bytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _PeakSnapshotter(threading.Thread):
+    """
+    Polls traced memory and keeps a snapshot whenever it reaches a new high, so
+    allocation sites can be reported close to the peak rather than only for
+    whatever is still alive once the solution returns.
+    """
+
+    def __init__(self, interval: float = 0.05, growth: float = 1.5):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self._best = 0
+        self._stop = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def poll(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self._best * self.growth:
+            self.snapshot = tracemalloc.take_snapshot()
+            self._best = current
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.join()
+        if self.snapshot is None:
+            self.snapshot = tracemalloc.take_snapshot()
+
+
+def measure_memory(
+    fn: Callable[[Any], Any], data: Any, top: int = 10, frames: int = 1
+) -> MemoryReport:
+    """
+    Runs `fn(data)` twice: once untraced for wall time and peak RSS (which the
+    tracing and snapshots would otherwise inflate), then under tracemalloc for
+    peak traced memory and the hottest allocation sites.
+    """
+    traced_data = copy.deepcopy(data)
+    rss_before = current_rss()
+    start = time.perf_counter()
+    result = fn(data)
+    elapsed = time.perf_counter() - start
+    rss_peak = peak_rss()
+
+    tracemalloc.start(frames)
+    tracemalloc.reset_peak()
+    watcher = _PeakSnapshotter()
+    watcher.start()
+    try:
+        fn(traced_data)
+        watcher.stop()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # ignore allocations made by tracemalloc itself and this module
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, threading.__file__),
+    ]
+    stats = watcher.snapshot.filter_traces(filters).statistics("lineno")
+    by_size = sorted(stats, key=lambda s: s.size, reverse=True)[:top]
+    by_count = sorted(stats, key=lambda s: s.count, reverse=True)[:top]
+    return MemoryReport(result, elapsed, peak, rss_before, rss_peak, by_size, by_count)
+
+
+def print_memory_report(report: MemoryReport) -> None:
+    print(f"Result: {report.result}  (time: {report.elapsed:.6f}s)")
+    print(f"Peak traced memory: {format_bytes(report.peak_traced)}")
+    rss_growth = (
+        report.peak_rss - report.rss_before
+        if report.peak_rss is not None and report.rss_before is not None
+        else None
+    )
+    print(
+        f"Peak RSS: {format_bytes(report.peak_rss)} "
+        f"(before run: {format_bytes(report.rss_before)}, "
+        f"growth: {format_bytes(rss_growth)})"
+    )
+
+    for title, stats in (
+        ("Top allocation sites by size (near peak)", report.top_by_size),
+        ("Top allocation sites by count (near peak)", report.top_by_count),
+    ):
+        print(f"\n{title}:")
+        for stat in stats:
+            frame = stat.traceback[0]
+            where = f"{os.path.relpath(frame.filename)}:{frame.lineno}"
+            print(f"{format_bytes(stat.size):>12} | {stat.count:>9} blocks | {where}")
+
+
+class StackSampler:
+    """
+    Samples the main thread's Python stack on every ITIMER_PROF tick (CPU time)
+    and counts collapsed `a;b;c` stacks, the input format of flamegraph.pl,
+    speedscope and inferno.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        if not hasattr(signal, "ITIMER_PROF"):
+            raise RuntimeError("stack sampling needs signal.setitimer (Unix only)")
+        self.interval = interval
+        self.stacks: Counter = Counter()
+
+    def _sample(self, signum, frame) -> None:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename != __file__:
+                names.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                    f":{code.co_firstlineno})"
+                )
+            frame = frame.f_back
+        self.stacks[";".join(reversed(names))] += 1
+
+    def __enter__(self) -> "StackSampler":
+        self._previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous)
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def profile_cpu(
+    fn: Callable[[Any], Any],
+    data: Any,
+    pstats_path: Optional[str] = None,
+    collapsed_path: Optional[str] = None,
+) -> Tuple[Any, pstats.Stats]:
+    """Runs `fn(data)` under cProfile, optionally also sampling collapsed stacks."""
+    profiler = cProfile.Profile()
+    sampler = StackSampler() if collapsed_path else None
+    if sampler:
+        sampler.__enter__()
+    try:
+        result = profiler.runcall(fn, data)
+    finally:
+        if sampler:
+            sampler.__exit__()
+
+    stats = pstats.Stats(profiler)
+    if pstats_path:
+        stats.dump_stats(pstats_path)
+    if sampler:
+        sampler.write_collapsed(collapsed_path)
+    return result, stats
+
+
+def print_cpu_report(result: Any, stats: pstats.Stats, top: int = 10) -> None:
+    print(f"Result: {result}  (profiled time: {stats.total_tt:.6f}s)")
+    for title, key in (
+        ("Top functions by cumulative time", pstats.SortKey.CUMULATIVE),
+        ("Top functions by self time", pstats.SortKey.TIME),
+    ):
+        out = io.StringIO()
+        stats.stream = out
+        stats.strip_dirs().sort_stats(key).print_stats(top)
+        # drop pstats' preamble, keep the table
+        table = out.getvalue().split("\n")
+        start = next(i for i, line in enumerate(table) if "ncalls" in line)
+        print(f"\n{title}:")
+        print("\n".join(line for line in table[start:] if line.strip()))
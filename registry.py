@@ -0,0 +1,203 @@
+import ast
+import importlib
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+
+SOLUTIONS_DIR = "solutions"
+INDEX_PATH = os.path.join(".cache", "registry.json")
+DAY_FILE_RE = re.compile(r"^day(\d{2})\.py$")
+# lower-case module attributes whose literal value is worth indexing too
+LITERAL_NAMES = {"tests"}
+
+
+@dataclass
+class Entry:
+    """What a solution module offers, read from its source without importing it."""
+
+    year: int
+    day: int
+    path: str
+    parts: Tuple[int, ...]
+    functions: List[str]
+    # literal values of UPPERCASE constants (SCALE_SIZES, ...) and `tests`
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    # other top-level names bound by assignment (`tests`, `variants`, ...)
+    names: List[str] = field(default_factory=list)
+
+    @property
+    def module_name(self) -> str:
+        return f"{SOLUTIONS_DIR}.{self.year}.day{self.day:02d}"
+
+    def has(self, name: str) -> bool:
+        return name in self.functions or name in self.names or name in self.metadata
+
+    def load(self) -> ModuleType:
+        """Imports the module on first use; later calls hit sys.modules."""
+        return importlib.import_module(self.module_name)
+
+
+def scan_module(year: int, day: int, path: str) -> Entry:
+    """Builds an Entry from the module's top-level definitions."""
+    with open(path, "r") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    functions, names, metadata = [], [], {}
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.append(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if not isinstance(target, ast.Name):
+                    continue
+                literal = target.id.isupper() or target.id in LITERAL_NAMES
+                if literal and node.value is not None:
+                    try:
+                        metadata[target.id] = ast.literal_eval(node.value)
+                        continue
+                    except ValueError:
+                        pass
+                names.append(target.id)
+
+    parts = tuple(p for p in (1, 2) if f"solution{p}" in functions)
+    return Entry(year, day, path, parts, functions, metadata, names)
+
+
+def _entry_to_json(entry: Entry) -> Dict[str, Any]:
+    # JSON would turn int keys such as SCALE_SIZES = {1: ...} into strings and
+    # tuples into lists, so the metadata is stored as its Python literal
+    return {**asdict(entry), "metadata": repr(entry.metadata)}
+
+
+def _entry_from_json(data: Dict[str, Any]) -> Entry:
+    return Entry(
+        **{
+            **data,
+            "parts": tuple(data["parts"]),
+            "metadata": ast.literal_eval(data["metadata"]),
+        }
+    )
+
+
+class Registry:
+    """
+    Index of every solutions/<year>/dayNN.py. Entries are rebuilt only for files
+    whose size or mtime changed since the index was last saved, so discovery
+    costs one stat per file and importing is deferred until `load`.
+    """
+
+    def __init__(self, root: str = SOLUTIONS_DIR, index_path: str = INDEX_PATH):
+        self.root = root
+        self.index_path = index_path
+        self._entries: Optional[Dict[Tuple[int, int], Entry]] = None
+
+    def _discover(self) -> Dict[Tuple[int, int], Entry]:
+        try:
+            with open(self.index_path, "r") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = {}
+
+        entries, index, dirty = {}, {}, False
+        for year_dir in sorted(os.listdir(self.root)):
+            year_path = os.path.join(self.root, year_dir)
+            if not year_dir.isdigit() or not os.path.isdir(year_path):
+                continue
+            for name in sorted(os.listdir(year_path)):
+                match = DAY_FILE_RE.match(name)
+                if not match:
+                    continue
+                path = os.path.join(year_path, name)
+                st = os.stat(path)
+                stamp = [st.st_mtime_ns, st.st_size]
+                hit = cached.get(path)
+                entry = None
+                if hit and hit["stamp"] == stamp:
+                    try:
+                        entry = _entry_from_json(hit["entry"])
+                    except (KeyError, TypeError, ValueError, SyntaxError):
+                        pass  # written by an older format; rescan
+                if entry is None:
+                    entry = scan_module(int(year_dir), int(match.group(1)), path)
+                    dirty = True
+                entries[(entry.year, entry.day)] = entry
+                index[path] = {"stamp": stamp, "entry": _entry_to_json(entry)}
+
+        if dirty or len(index) != len(cached):
+            try:
+                os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+                with open(self.index_path, "w") as f:
+                    json.dump(index, f)
+            except OSError:
+                pass  # a read-only checkout still works, just without the index
+        return entries
+
+    @property
+    def entries(self) -> Dict[Tuple[int, int], Entry]:
+        if self._entries is None:
+            self._entries = self._discover()
+        return self._entries
+
+    def refresh(self) -> None:
+        """Forgets the in-memory index; the next lookup re-stats every file."""
+        self._entries = None
+
+    def days(self, year: Optional[int] = None) -> List[Tuple[int, int]]:
+        return sorted(k for k in self.entries if year is None or k[0] == year)
+
+    def get(self, year: int, day: int) -> Entry:
+        try:
+            return self.entries[(year, day)]
+        except KeyError:
+            raise LookupError(f"no solution module for {year} day {day:02d}") from None
+
+    def find(self, path: str) -> Entry:
+        path = os.path.normpath(path)
+        for entry in self.entries.values():
+            if os.path.normpath(entry.path) == path:
+                return entry
+        raise LookupError(f"{path} is not a solution module")
+
+    def load(self, year: int, day: int) -> ModuleType:
+        return self.get(year, day).load()
+
+
+registry = Registry()
+
+
+def load_problem(year: int, day: int) -> ModuleType:
+    return registry.load(year, day)
+
+
+def test_warm_index_matches_cold_scan(tmp_path, monkeypatch):
+    index_path = str(tmp_path / "registry.json")
+    cold = Registry(index_path=index_path).entries
+    assert cold[(2025, 4)].metadata["SCALE_SIZES"][1]  # int part keys
+
+    def no_rescan(*args):
+        raise AssertionError("warm index rescanned an unchanged module")
+
+    monkeypatch.setitem(globals(), "scan_module", no_rescan)
+    warm = Registry(index_path=index_path).entries
+    assert warm == cold
+
+
+def test_changed_module_is_rescanned(tmp_path):
+    day = tmp_path / "solutions" / "2015" / "day01.py"
+    day.parent.mkdir(parents=True)
+    day.write_text("SCALE_SIZES = {1: [10]}\ndef solution1(data):\n    return 1\n")
+    index = Registry(str(tmp_path / "solutions"), str(tmp_path / "index.json"))
+    assert index.get(2015, 1).parts == (1,)
+
+    day.write_text(
+        "SCALE_SIZES = {2: [20]}\n"
+        "def solution1(data):\n    return 1\n"
+        "def solution2(data):\n    return 2\n"
+    )
+    index = Registry(str(tmp_path / "solutions"), str(tmp_path / "index.json"))
+    entry = index.get(2015, 1)
+    assert entry.parts == (1, 2) and entry.metadata["SCALE_SIZES"] == {2: [20]}
@@ -0,0 +1,379 @@
+import contextlib
+import functools
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional, Tuple
+
+from cache import cached_answer, load_parsed
+from registry import load_problem, registry
+from supervisor import RunFailed, run_limited
+
+# per (day, part) wall-clock limit for `main.py all` unless --timeout is given
+BATCH_TIMEOUT = 60.0
+
+
+@dataclass
+class JobResult:
+    year: int
+    day: int
+    part: int
+    result: Any = None
+    elapsed: float = 0.0
+    error: Optional[str] = None
+    cached: bool = False
+
+
+def discover_days(year: Optional[int] = None) -> List[Tuple[int, int]]:
+    """Finds every (year, day) that has a solutions/<year>/dayNN.py module."""
+    return registry.days(year)
+
+
+def run_job(
+    year: int,
+    day: int,
+    part: int,
+    answer_cache: bool = False,
+    timeout: Optional[float] = None,
+    max_mem: Optional[int] = None,
+) -> JobResult:
+    """
+    Loads, parses and solves one (year, day, part) inside a worker process. With
+    a `timeout` or `max_mem`, solving happens in a supervised child, so a runaway
+    day is killed and reported instead of stalling (or taking down) the pool.
+    """
+    input_path = os.path.join("inputs", str(year), f"day{day:02d}.in")
+
+    def solve():
+        problem = load_problem(year, day)
+        data = load_parsed(problem, input_path, stream=True)
+        return getattr(problem, f"solution{part}")(data)
+
+    def solve_limited():
+        outcome = run_limited(solve, timeout=timeout, max_mem=max_mem)
+        if outcome.error:
+            raise RunFailed(outcome)
+        return outcome.result
+
+    start = time.perf_counter()
+    try:
+        source_path = registry.get(year, day).path
+        limited = timeout is not None or max_mem is not None
+        result, hit = cached_answer(
+            source_path,
+            input_path,
+            part,
+            solve_limited if limited else solve,
+            use_cache=answer_cache,
+        )
+    except RunFailed as e:
+        return JobResult(
+            year, day, part, elapsed=e.outcome.elapsed, error=e.outcome.telemetry()
+        )
+    except Exception as e:
+        elapsed = time.perf_counter() - start
+        return JobResult(
+            year, day, part, elapsed=elapsed, error=f"{type(e).__name__}: {e}"
+        )
+    return JobResult(year, day, part, result, time.perf_counter() - start, cached=hit)
+
+
+def run_all(
+    year: Optional[int] = None,
+    parts: Tuple[int, ...] = (1, 2),
+    jobs: Optional[int] = None,
+    answer_cache: bool = False,
+    timeout: Optional[float] = None,
+    max_mem: Optional[int] = None,
+) -> Iterator[JobResult]:
+    """Fans every (day, part) out to a process pool and yields results as they finish."""
+    days = discover_days(year)
+    workers = jobs or os.process_cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_job, y, d, p, answer_cache, timeout, max_mem)
+            for y, d in days
+            for p in parts
+            if p in registry.get(y, d).parts
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def format_result(res: JobResult) -> str:
+    label = f"{res.year} day {res.day:02d} part {res.part}"
+    if res.error:
+        return f"{label} | ERROR {res.error}  ({res.elapsed:.6f}s)"
+    if res.cached:
+        return f"{label} | {res.result}  (cached)"
+    return f"{label} | {res.result}  ({res.elapsed:.6f}s)"
+
+
+def main_all(
+    year: Optional[int] = None,
+    jobs: Optional[int] = None,
+    test: bool = False,
+    budget: float = 1.0,
+    answer_cache: bool = False,
+    timeout: Optional[float] = None,
+    max_mem: Optional[int] = None,
+) -> int:
+    """Runs every discovered day, streams results and returns the failure count."""
+    if timeout is None:
+        timeout = BATCH_TIMEOUT
+    if test:
+        days = discover_days(year)
+        return run_tests(days, jobs, budget, timeout=timeout, max_mem=max_mem)
+
+    start = time.perf_counter()
+    results = []
+    runs = run_all(
+        year, jobs=jobs, answer_cache=answer_cache, timeout=timeout, max_mem=max_mem
+    )
+    for res in runs:
+        print(format_result(res), flush=True)
+        results.append(res)
+
+    failed = [r for r in results if r.error]
+    slowest = max(results, key=lambda r: r.elapsed, default=None)
+    print(
+        f"\n{len(results)} jobs, {len(failed)} failed, "
+        f"wall {time.perf_counter() - start:.3f}s"
+    )
+    if slowest is not None:
+        print(f"Slowest: {format_result(slowest)}")
+    return len(failed)
+
+
+# --- Test runner ---
+
+
+@dataclass
+class CaseResult:
+    name: str
+    passed: bool
+    elapsed: float
+    message: str = ""
+
+
+class _Collector:
+    """pytest plugin recording which files contain collectable tests."""
+
+    def __init__(self):
+        self.files = set()
+
+    def pytest_collection_finish(self, session):
+        self.files = {item.nodeid.split("::")[0] for item in session.items}
+
+
+class _Recorder:
+    """pytest plugin turning per-test reports into CaseResults."""
+
+    def __init__(self):
+        self.results: dict[str, CaseResult] = {}
+
+    def pytest_runtest_logreport(self, report):
+        case = self.results.setdefault(
+            report.nodeid, CaseResult(report.nodeid, True, 0.0)
+        )
+        case.elapsed += report.duration
+        if report.failed:
+            case.passed = False
+            case.message = report.longreprtext.strip().splitlines()[-1]
+
+
+def _quiet_pytest(args: List[str], plugin: Any) -> None:
+    import pytest
+
+    # -s keeps pytest from swapping sys.stderr under the loggers that solution
+    # modules create at import; importlib mode keeps 2015/day01.py and
+    # 2025/day01.py from clashing as the same `day01` module.
+    flags = ["-q", "-s", "-p", "no:cacheprovider", "--import-mode=importlib"]
+    with contextlib.redirect_stdout(io.StringIO()):
+        pytest.main([*flags, *args], plugins=[plugin])
+
+
+def collect_cases(days: List[Tuple[int, int]]) -> List[Tuple[str, str, Any]]:
+    """
+    Lists the embedded test cases of each day as (kind, module path, detail):
+
+    - ("pytest", path, None): the pytest functions of a file, run together
+      and reported one test at a time;
+    - ("case", path, (index, part)): one entry of a module's `tests` list of
+      (raw, expected_part1, expected_part2) tuples, so slow examples such as
+      the 2015 day04 MD5 searches spread across workers;
+    - ("helper", path, None): a `run_with_tests()` helper, for modules without
+      a `tests` list.
+    """
+    entries = [registry.get(y, d) for y, d in days]
+    # only files that define test functions are worth handing to pytest
+    paths = [e.path for e in entries if any(f.startswith("test") for f in e.functions)]
+    collector = _Collector()
+    if paths:
+        _quiet_pytest(["--collect-only", *paths], collector)
+
+    cases = []
+    for entry in entries:
+        if entry.path in collector.files:
+            cases.append(("pytest", entry.path, None))
+        if "tests" in entry.metadata:
+            for i, (_, *expected) in enumerate(entry.metadata["tests"]):
+                for part, exp in enumerate(expected, 1):
+                    if exp is not None:
+                        cases.append(("case", entry.path, (i, part)))
+        elif entry.has("run_with_tests"):
+            cases.append(("helper", entry.path, None))
+    return cases
+
+
+def run_case(
+    kind: str,
+    path: str,
+    detail: Any,
+    timeout: Optional[float] = None,
+    max_mem: Optional[int] = None,
+) -> List[CaseResult]:
+    """Runs one collected case inside a worker process, supervised if limited."""
+    if timeout is None and max_mem is None:
+        return _run_case(kind, path, detail)
+    case = functools.partial(_run_case, kind, path, detail)
+    outcome = run_limited(case, timeout=timeout, max_mem=max_mem)
+    if outcome.error:
+        if kind == "case":
+            name = f"{path}::tests[{detail[0]}]::part{detail[1]}"
+        else:
+            name = path if kind == "pytest" else f"{path}::run_with_tests"
+        return [CaseResult(name, False, outcome.elapsed, outcome.telemetry())]
+    return outcome.result
+
+
+def _run_case(kind: str, path: str, detail: Any) -> List[CaseResult]:
+    if kind == "pytest":
+        recorder = _Recorder()
+        _quiet_pytest([path], recorder)
+        return list(recorder.results.values())
+
+    if kind == "case":
+        i, part = detail
+        name = f"{path}::tests[{i}]::part{part}"
+    else:
+        name = f"{path}::run_with_tests"
+
+    start = time.perf_counter()
+    try:
+        problem = registry.find(path).load()
+        if kind == "case":
+            raw, *expected = problem.tests[i]
+            result = getattr(problem, f"solution{part}")(problem.parse(raw))
+            assert (
+                result == expected[part - 1]
+            ), f"expected {expected[part - 1]}, got {result}"
+        else:
+            with contextlib.redirect_stdout(io.StringIO()):
+                problem.run_with_tests()
+    except Exception as e:
+        elapsed = time.perf_counter() - start
+        message = f"{type(e).__name__}: {e}".splitlines()[0]
+        return [CaseResult(name, False, elapsed, message)]
+    return [CaseResult(name, True, time.perf_counter() - start)]
+
+
+def run_tests(
+    days: List[Tuple[int, int]],
+    jobs: Optional[int] = None,
+    budget: float = 1.0,
+    timeout: Optional[float] = None,
+    max_mem: Optional[int] = None,
+) -> int:
+    """
+    Runs every embedded test case of `days` across a process pool, printing each
+    with its wall time and flagging those over `budget` seconds. `timeout` and
+    `max_mem` apply to each case. Returns the number of failed cases.
+    """
+    start = time.perf_counter()
+    cases = collect_cases(days)
+    results = []
+    workers = jobs or os.process_cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_case, *case, timeout, max_mem) for case in cases]
+        for future in as_completed(futures):
+            for res in future.result():
+                status = "PASS" if res.passed else "FAIL"
+                slow = "  SLOW" if res.elapsed > budget else ""
+                print(f"{status} {res.elapsed:9.4f}s{slow} | {res.name}", flush=True)
+                if not res.passed:
+                    print(f"     {res.message}")
+                results.append(res)
+
+    failed = sum(1 for r in results if not r.passed)
+    slow = sum(1 for r in results if r.elapsed > budget)
+    print(
+        f"\n{len(results)} cases, {failed} failed, {slow} over {budget:g}s budget, "
+        f"wall {time.perf_counter() - start:.3f}s"
+    )
+    return failed
+
+
+def _fake_day(tmp_path, monkeypatch, source: str) -> None:
+    """Points the registry and loader at a throwaway 2015 day 01 in `tmp_path`."""
+    import importlib.util
+
+    from registry import Registry
+
+    year_dir = tmp_path / "solutions" / "2015"
+    year_dir.mkdir(parents=True)
+    (year_dir / "day01.py").write_text(source)
+    spec = importlib.util.spec_from_file_location("day01", year_dir / "day01.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    (tmp_path / "inputs" / "2015").mkdir(parents=True)
+    (tmp_path / "inputs" / "2015" / "day01.in").write_text("1 2 3\n")
+
+    monkeypatch.chdir(tmp_path)
+    index = Registry("solutions", str(tmp_path / "index.json"))
+    monkeypatch.setitem(globals(), "registry", index)
+    monkeypatch.setitem(globals(), "load_problem", lambda year, day: module)
+
+
+def test_run_job(tmp_path, monkeypatch):
+    _fake_day(
+        tmp_path,
+        monkeypatch,
+        "import time\n"
+        "def parse(raw):\n    return [int(x) for x in raw.split()]\n"
+        "def solution1(data):\n    return sum(data)\n"
+        "def solution2(data):\n    time.sleep(5)\n",
+    )
+    res = run_job(2015, 1, 1)
+    assert (res.result, res.error, res.cached) == (6, None, False)
+    assert format_result(res).startswith("2015 day 01 part 1 | 6  (")
+
+    assert not run_job(2015, 1, 1, answer_cache=True).cached
+    res = run_job(2015, 1, 1, answer_cache=True)
+    assert res.cached
+    assert format_result(res) == "2015 day 01 part 1 | 6  (cached)"
+
+    res = run_job(2015, 1, 2, timeout=0.2)
+    assert res.error.startswith("TIMEOUT (limit 0.2s) after")
+    assert format_result(res).startswith("2015 day 01 part 2 | ERROR TIMEOUT")
+
+    res = run_job(2015, 2, 1)
+    assert res.error == "LookupError: no solution module for 2015 day 02"
+
+
+def test_collect_cases(tmp_path, monkeypatch):
+    _fake_day(
+        tmp_path,
+        monkeypatch,
+        "tests = [('1', 1, None), ('2', 2, 4)]\n"
+        "def solution1(data):\n    return data\n"
+        "def solution2(data):\n    return data\n",
+    )
+    path = registry.get(2015, 1).path
+    assert collect_cases([(2015, 1)]) == [
+        ("case", path, (0, 1)),
+        ("case", path, (1, 1)),
+        ("case", path, (1, 2)),
+    ]
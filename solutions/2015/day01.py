@@ -1,9 +1,46 @@
 # A opening parenthesis, (, means he should go up one floor,
 # a closing parenthesis, ), means he should go down one floor.
+import os
+import random
+import sys
+from typing import Iterator
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, project_root)
+from common import read_chars
+
+SCALE_SIZES = [10_000, 100_000, 1_000_000, 4_000_000]
+EXPECTED_COMPLEXITY = 1
 
 
 def parse(raw: str) -> str:
-    return raw
+    return raw.strip()
+
+
+def parse_stream(path: str) -> Iterator[str]:
+    # part 2 stops reading the file as soon as Santa reaches the basement
+    return (ch for ch in read_chars(path) if ch in "()")
+
+
+def generate_input(size: int, seed: int = 0) -> str:
+    """
+    Roughly `size` parentheses that stay at or above the ground floor until the
+    very last one, so part 2 has to walk the whole stream.
+    """
+    rng = random.Random(seed)
+    steps = (size - 1) // 2 * 2
+    out = []
+    floor = 0
+    for i in range(steps):
+        remaining = steps - i
+        if floor >= remaining or (floor > 0 and rng.random() < 0.5):
+            out.append(")")
+            floor -= 1
+        else:
+            out.append("(")
+            floor += 1
+    out.append(")")
+    return "".join(out)
 
 
 def test_part1():
@@ -1,13 +1,37 @@
 # Day 02
+import os
+import random
+import sys
+from typing import Iterator
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, project_root)
+from common import read_lines
+
+SCALE_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+EXPECTED_COMPLEXITY = 1
+
+
+def generate_input(size: int, seed: int = 0) -> str:
+    """`size` presents as `LxWxH` lines with sides between 1 and 30."""
+    rng = random.Random(seed)
+    return "\n".join(
+        f"{rng.randint(1, 30)}x{rng.randint(1, 30)}x{rng.randint(1, 30)}"
+        for _ in range(size)
+    )
 
 
 def parse(raw_data: str) -> list[list[int]]:
-    return [list(map(int, x.split("x"))) for x in raw_data.split("\n")]
+    return [list(map(int, x.split("x"))) for x in raw_data.split("\n") if x]
     # return [[2, 3, 4], [1, 1, 10]]
 
 
-def solution1(raw_data: str) -> int:
-    dimensions: list[list[int]] = parse(raw_data)
+def parse_stream(path: str) -> Iterator[list[int]]:
+    # one present at a time, so memory stays flat however long the list is
+    return (list(map(int, line.split("x"))) for line in read_lines(path) if line)
+
+
+def solution1(dimensions: list[list[int]]) -> int:
     wrapping_paper: int = 0
     for dimension in dimensions:
         # assuming largest is length, smallest is height
@@ -22,9 +46,7 @@ def solution1(raw_data: str) -> int:
     return wrapping_paper
 
 
-def solution2(raw_data: str) -> int:
-    paper = solution1(raw_data)
-    dimensions: list[list[int]] = parse(raw_data)
+def solution2(dimensions: list[list[int]]) -> int:
     ribbon_length: int = 0
 
     for dimension in dimensions:
@@ -1,78 +1,70 @@
 import os
+import random
 import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
 
+SCALE_SIZES = [10_000, 100_000, 1_000_000]
+EXPECTED_COMPLEXITY = 1
+
 
 def parse(raw_data: str) -> str:
     return raw_data
 
 
+def generate_input(size: int, seed: int = 0) -> str:
+    """`size` random `^v<>` moves."""
+    rng = random.Random(seed)
+    return "".join(rng.choices("^v<>", k=size))
+
+
+def houses(moves: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """x and y of every house on a route of `^v<>` byte codes from (0, 0)."""
+    import numpy as np
+
+    dx = (moves == ord(">")).astype(np.int64) - (moves == ord("<"))
+    dy = (moves == ord("^")).astype(np.int64) - (moves == ord("v"))
+    x = np.concatenate(([0], np.cumsum(dx)))
+    y = np.concatenate(([0], np.cumsum(dy)))
+    return x, y
+
+
+def count_distinct(x: "np.ndarray", y: "np.ndarray") -> int:
+    import numpy as np
+
+    # one flat index per house within the route's bounding box; a visited
+    # bitmap of that box could be quadratic in size for a diagonal route
+    height = int(y.max() - y.min()) + 1
+    return len(np.unique((x - x.min()) * height + (y - y.min())))
+
+
 def solution1(raw_data: str) -> int:
+    import numpy as np
+
     data: str = parse(raw_data)
-    # print("{data=}")
-    current = [0, 0]
-    houses = [[current[0], current[1]]]
-    # {'>': [1,0], '^': [0,1], '<': [-1,0], 'v':[0,-1]}
-    for d in data:
-        # print(f"checking {d=}")
-        if d == ">":
-            current[0] += 1
-        elif d == "^":
-            current[1] += 1
-        elif d == "<":
-            current[0] -= 1
-        elif d == "v":
-            current[1] -= 1
-        else:
-            print("incorrect")
-        # print(f"{current=} {houses=}")
-        if current not in houses:
-            houses.append([current[0], current[1]])
-    # print(f"{houses=}")
-    return len(houses)
+    moves = np.frombuffer(data.encode(), dtype=np.uint8)
+    return count_distinct(*houses(moves))
 
 
 def solution2(raw_data: str) -> int:
+    import numpy as np
+
     data: str = parse(raw_data)
-    # print("{data=}")
-    santa = [0, 0]
-    robot_santa = [0, 0]
-    houses = [[santa[0], santa[1]]]
-    # {'>': [1,0], '^': [0,1], '<': [-1,0], 'v':[0,-1]}
-    for i, d in enumerate(data):
-        if i % 2 == 0:
-            if d == ">":
-                santa[0] += 1
-            elif d == "^":
-                santa[1] += 1
-            elif d == "<":
-                santa[0] -= 1
-            elif d == "v":
-                santa[1] -= 1
-            else:
-                print("incorrect")
-            if santa not in houses:
-                houses.append([santa[0], santa[1]])
-        else:
-            if d == ">":
-                robot_santa[0] += 1
-            elif d == "^":
-                robot_santa[1] += 1
-            elif d == "<":
-                robot_santa[0] -= 1
-            elif d == "v":
-                robot_santa[1] -= 1
-            else:
-                print("incorrect")
-            if robot_santa not in houses:
-                houses.append([robot_santa[0], robot_santa[1]])
-    # print(f"{houses=}")
-    return len(houses)
+    moves = np.frombuffer(data.encode(), dtype=np.uint8)
+    # Santa takes the even moves, Robo-Santa the odd ones
+    santa_x, santa_y = houses(moves[0::2])
+    robot_x, robot_y = houses(moves[1::2])
+    return count_distinct(
+        np.concatenate((santa_x, robot_x)), np.concatenate((santa_y, robot_y))
+    )
 
 
-if __name__ == "__main__":
+def run_with_tests():
     # Tests for solution1
     test_cases_solution1 = [
         (">", 2),
@@ -102,3 +94,7 @@ if __name__ == "__main__":
         ), f"Test case {i+1} failed: expected {expected}, got {result}"
 
     print("All tests for solution2 passed!")
+
+
+if __name__ == "__main__":
+    run_with_tests()
@@ -4,6 +4,9 @@ import sys
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
+from common import report_progress
+
+SEARCH_LIMIT = 9999999
 
 
 def parse(raw_data: str) -> str:
@@ -14,7 +17,9 @@ def parse(raw_data: str) -> str:
 def solution1(raw_data: str) -> int:
     data: str = parse(raw_data)
     result = -1
-    for i in range(9999999):
+    for i in range(SEARCH_LIMIT):
+        if not i & 0xFFFF:
+            report_progress(i, SEARCH_LIMIT)
         s = f"{data}{i}"
         # print(f"\rchecking: {s}", end="")
         res = hashlib.md5(s.encode()).hexdigest()
@@ -28,7 +33,9 @@ def solution1(raw_data: str) -> int:
 def solution2(raw_data: str) -> int:
     data: str = parse(raw_data)
     result = -1
-    for i in range(9999999):
+    for i in range(SEARCH_LIMIT):
+        if not i & 0xFFFF:
+            report_progress(i, SEARCH_LIMIT)
         s = f"{data}{i}"
         # print(f"\rchecking: {s}", end="")
         res = hashlib.md5(s.encode()).hexdigest()
@@ -39,32 +46,27 @@ def solution2(raw_data: str) -> int:
     return result
 
 
-def run_with_tests():
-    # Tests for solution1
-    test_cases_solution1 = [
-        ("abcdef", 609043),
-        ("pqrstuv", 1048970),
-    ]
+# (input, expected part 1, expected part 2)
+tests = [
+    ("abcdef", 609043, 6742839),
+    ("pqrstuv", 1048970, 5714438),
+]
+
 
-    for i, (input_data, expected) in enumerate(test_cases_solution1):
+def run_with_tests():
+    for i, (input_data, expected1, expected2) in enumerate(tests):
         result = solution1(input_data)
         assert (
-            result == expected
-        ), f"Test case {i+1} failed: expected {expected}, got {result}"
+            result == expected1
+        ), f"Test case {i+1} failed: expected {expected1}, got {result}"
 
     print("All tests for solution1 passed!")
 
-    # Tests for solution2
-    test_cases_solution2 = [
-        ("abcdef", 6742839),
-        ("pqrstuv", 5714438),
-    ]
-
-    for i, (input_data, expected) in enumerate(test_cases_solution2):
+    for i, (input_data, expected1, expected2) in enumerate(tests):
         result = solution2(input_data)
         assert (
-            result == expected
-        ), f"Test case {i+1} failed: expected {expected}, got {result}"
+            result == expected2
+        ), f"Test case {i+1} failed: expected {expected2}, got {result}"
 
     print("All tests for solution2 passed!")
 
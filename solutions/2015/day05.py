@@ -1,12 +1,30 @@
 import os
+import random
+import string
 import sys
+from typing import Iterator
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
+from common import read_lines
+
+SCALE_SIZES = [1_000, 10_000, 100_000, 500_000]
+EXPECTED_COMPLEXITY = 1
 
 
 def parse(raw_data: str) -> list[str]:
-    return raw_data.split("\n")
+    return [line for line in raw_data.split("\n") if line]
+
+
+def parse_stream(path: str) -> Iterator[str]:
+    return (line for line in read_lines(path) if line)
+
+
+def generate_input(size: int, seed: int = 0) -> str:
+    """`size` random 16-letter lowercase strings, one per line."""
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+    return "\n".join("".join(rng.choices(letters, k=16)) for _ in range(size))
 
 
 def is_nice_string(s: str) -> bool:
@@ -43,11 +61,11 @@ def is_nice_string2(s: str) -> bool:
 
 
 def solution1(data: list[str]) -> int:
-    return sum(list(map(is_nice_string, data)))
+    return sum(map(is_nice_string, data))
 
 
 def solution2(data: str) -> int:
-    return sum(list(map(is_nice_string2, data)))
+    return sum(map(is_nice_string2, data))
 
 
 def test_is_nice_string2():
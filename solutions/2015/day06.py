@@ -1,33 +1,86 @@
 import os
+import random
+import re
 import sys
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
+from common import Grid
 
+SCALE_SIZES = [100, 1_000, 10_000, 100_000]
 
-def parse(raw_data: str) -> str:
-    data = raw_data.split("\n")
-    for s in data:
-        ...
-        #  list(map(int,re.findall(r'\b\d{3}\b', c[0]))
 
-    return raw_data
+def generate_input(size: int, seed: int = 0) -> str:
+    """`size` turn on/turn off/toggle instructions over the 1000x1000 grid."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        action = rng.choice(["turn on", "turn off", "toggle"])
+        x1, x2 = sorted(rng.randrange(1000) for _ in range(2))
+        y1, y2 = sorted(rng.randrange(1000) for _ in range(2))
+        lines.append(f"{action} {x1},{y1} through {x2},{y2}")
+    return "\n".join(lines)
 
 
-def solution1(raw_data: str) -> int: ...
+INSTRUCTION_RE = re.compile(
+    r"(turn on|turn off|toggle) (\d+),(\d+) through (\d+),(\d+)"
+)
+Instruction = tuple[str, int, int, int, int]
 
 
-def solution2(raw_data: str) -> int: ...
+def parse(raw_data: str) -> list[Instruction]:
+    return [
+        (action, int(x1), int(y1), int(x2), int(y2))
+        for action, x1, y1, x2, y2 in INSTRUCTION_RE.findall(raw_data)
+    ]
+
+
+def solution1(data: list[Instruction]) -> int:
+    # `#` is a lit light; toggling flips a cell between `#` and `.`
+    lights = Grid.full(1000, 1000, ".")
+    on, off = ord("#"), ord(".")
+    for action, x1, y1, x2, y2 in data:
+        block = lights.cells[x1 : x2 + 1, y1 : y2 + 1]
+        if action == "turn on":
+            block[...] = on
+        elif action == "turn off":
+            block[...] = off
+        else:
+            block ^= on ^ off
+    return lights.count("#")
+
+
+def solution2(data: list[Instruction]) -> int:
+    import numpy as np
+
+    brightness = np.zeros((1000, 1000), dtype=np.int32)
+    for action, x1, y1, x2, y2 in data:
+        block = brightness[x1 : x2 + 1, y1 : y2 + 1]
+        if action == "turn on":
+            block += 1
+        elif action == "turn off":
+            np.maximum(block - 1, 0, out=block)
+        else:
+            block += 2
+    return int(brightness.sum())
 
 
 def run_with_tests():
     # Tests for solution1
     test_cases_solution1 = [
         ("", 0),
+        ("turn on 0,0 through 999,999", 1_000_000),
+        ("toggle 0,0 through 999,0", 1_000),
+        (
+            "turn on 0,0 through 999,999\n"
+            "toggle 0,0 through 999,0\n"
+            "turn off 499,499 through 500,500",
+            998_996,
+        ),
     ]
 
     for i, (input_data, expected) in enumerate(test_cases_solution1):
-        result = solution1(input_data)
+        result = solution1(parse(input_data))
         assert (
             result == expected
         ), f"Test case {i+1} failed: expected {expected}, got {result}"
@@ -37,10 +90,13 @@ def run_with_tests():
     # Tests for solution2
     test_cases_solution2 = [
         ("", 0),
+        ("turn on 0,0 through 0,0", 1),
+        ("toggle 0,0 through 999,999", 2_000_000),
+        ("turn off 0,0 through 0,0\nturn on 0,0 through 1,0", 2),
     ]
 
     for i, (input_data, expected) in enumerate(test_cases_solution2):
-        result = solution2(input_data)
+        result = solution2(parse(input_data))
         assert (
             result == expected
         ), f"Test case {i+1} failed: expected {expected}, got {result}"
@@ -1,11 +1,53 @@
 import os
+import random
+import string
 import sys
 
-from common import setup_logging
+from common import report_progress, setup_logging
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
-logger = setup_logging()
+logger = setup_logging(name=__name__)
+
+SCALE_SIZES = [100, 1_000, 10_000, 50_000]
+EXPECTED_COMPLEXITY = 1
+
+
+def wire_name(i: int) -> str:
+    # two letters minimum, so generated names never collide with the output `a`
+    name = ""
+    i += 26
+    while i:
+        i, r = divmod(i, 26)
+        name = string.ascii_lowercase[r] + name
+    return name
+
+
+def generate_input(size: int, seed: int = 0) -> str:
+    """
+    A `size`-wire acyclic circuit in shuffled order: a few signal constants, then
+    gates that only read earlier wires, with the last wire routed into `a`.
+    """
+    rng = random.Random(seed)
+    lines = []
+    wires = []
+    for i in range(size):
+        out = wire_name(i)
+        if i < 2 or rng.random() < 0.05:
+            lines.append(f"{rng.randrange(65536)} -> {out}")
+        else:
+            x, y = rng.sample(wires, 2)
+            gate = rng.choice(["AND", "OR", "LSHIFT", "RSHIFT", "NOT"])
+            if gate == "NOT":
+                lines.append(f"NOT {x} -> {out}")
+            elif gate in ("LSHIFT", "RSHIFT"):
+                lines.append(f"{x} {gate} {rng.randint(1, 15)} -> {out}")
+            else:
+                lines.append(f"{x} {gate} {y} -> {out}")
+        wires.append(out)
+    lines.append(f"{wires[-1]} -> a")
+    rng.shuffle(lines)
+    return "\n".join(lines)
 
 
 def parse(raw_data: str) -> list[str]:
@@ -19,7 +61,7 @@ def parse_instructions(instructions: list[str]) -> dict[str, str]:
         # Split at " -> "
         parts = line.strip().split(" -> ")
         if len(parts) != 2:
-            logger.warning(f"Skipping invalid instruction: {line}")
+            logger.warning("Skipping invalid instruction: %s", line)
             continue
         operation = parts[0].strip()  # Operation before arrow
         output = parts[1].strip()  # Output after arrow
@@ -30,96 +72,98 @@ def parse_instructions(instructions: list[str]) -> dict[str, str]:
     return {key: val for key, val in sorted(wires.items())}
 
 
-def solution1(data):
-    logger.info(f"{type(data)}: {data[1]}")
-    instructions = parse_instructions(data)
-
-    gates: dict[str, int] = {}
-    sk = sorted(instructions, key=lambda k: len(instructions[k]), reverse=False)
-
-    while True:
-        any_updated = False
-
-        for k in sk:
-            if k in gates:
-                logger.info(f"{k} found in gates, skipping.")
+GATES = {
+    "AND": lambda x, y: x & y,
+    "OR": lambda x, y: x | y,
+    "LSHIFT": lambda x, y: (x << y) & 65535,
+    "RSHIFT": lambda x, y: x >> y,
+}
+
+
+def evaluate(instructions: dict[str, str]) -> dict[str, int]:
+    """
+    Signal on every wire. Each wire is resolved depth first with an explicit
+    stack (generated circuits are thousands of gates deep), so every gate is
+    computed exactly once.
+    """
+    tokens = {wire: operation.split() for wire, operation in instructions.items()}
+    signals: dict[str, int] = {}
+    expanded: set[str] = set()
+
+    def value(token: str) -> int:
+        return int(token) if token.isdigit() else signals[token]
+
+    for done, root in enumerate(tokens):
+        if done % 4096 == 0:
+            report_progress(done, len(tokens))
+        stack = [root]
+        while stack:
+            wire = stack[-1]
+            if wire in signals:
+                stack.pop()
                 continue
-
-            v = instructions[k]
-
-            # Handle direct numeric assignments
-            if len(v) == 1 and v[0].isnumeric():
-                gates[k] = int(v[0])
-                any_updated = True
-
-            # Handle NOT operations
-            elif len(v) == 2 and "NOT" in v:
-                op = v[-1]
-                if op.isalpha() and op in gates:
-                    gates[k] = ~gates[op] & 65535
-                    any_updated = True
-
-            # Handle binary operations
-            elif len(v) == 3:
-                op1, op2 = v[0], v[-1]
-                op1_value = (
-                    gates[op1]
-                    if op1.isalpha() and op1 in gates
-                    else int(op1) if op1.isnumeric() else None
-                )
-                op2_value = (
-                    gates[op2]
-                    if op2.isalpha() and op2 in gates
-                    else int(op2) if op2.isnumeric() else None
-                )
-
-                if "AND" in v and op1_value is not None and op2_value is not None:
-                    gates[k] = op1_value & op2_value
-                    any_updated = True
-                elif "OR" in v and op1_value is not None and op2_value is not None:
-                    gates[k] = op1_value | op2_value
-                    any_updated = True
-                elif "LSHIFT" in v and op1_value is not None:
-                    gates[k] = op1_value << op2_value
-                    any_updated = True
-                elif "RSHIFT" in v and op1_value is not None:
-                    gates[k] = op1_value >> op2_value
-                    any_updated = True
-
-            # Log if no operator was found
+            expr = tokens[wire]
+            inputs = [t for t in expr if t.islower() and t not in signals]
+            if inputs:
+                # back on top with inputs still unknown: one of them needs `wire`
+                if wire in expanded:
+                    raise ValueError(f"wire {wire} feeds back into itself")
+                expanded.add(wire)
+                stack.extend(inputs)
+                continue
+            if len(expr) == 1:
+                signals[wire] = value(expr[0])
+            elif len(expr) == 2:  # NOT x
+                signals[wire] = ~value(expr[1]) & 65535
             else:
-                logger.info(f"No Operator found: {v}")
+                signals[wire] = GATES[expr[1]](value(expr[0]), value(expr[2]))
+            stack.pop()
+    return signals
 
-        # Break the loop if no gates were updated
-        if not any_updated:
-            break
 
-    logger.info(gates)
-    return gates["a"]
+def solution1(data: list[str]) -> int:
+    signals = evaluate(parse_instructions(data))
+    logger.debug("signals: %s", signals)
+    return signals["a"]
 
 
 def solution2(data: str) -> int:
     return 0
 
 
-def test_solutions():
-    # Tests for solution1
-    test_cases_solution1 = [
-        (
-            """123 -> x
+EXAMPLE = """123 -> x
 456 -> y
 x AND y -> d
 x OR y -> e
 x LSHIFT 2 -> f
 y RSHIFT 2 -> g
 NOT x -> h
-NOT y -> i""",
-            0,
-        ),
+NOT y -> i"""
+
+
+def test_evaluate():
+    signals = evaluate(parse_instructions(parse(EXAMPLE)))
+    assert signals == {
+        "d": 72,
+        "e": 507,
+        "f": 492,
+        "g": 114,
+        "h": 65412,
+        "i": 65079,
+        "x": 123,
+        "y": 456,
+    }
+
+
+def test_solutions():
+    # Tests for solution1
+    test_cases_solution1 = [
+        (EXAMPLE + "\nd -> a", 72),
+        (EXAMPLE + "\ne OR f -> a", 507 | 492),
     ]
 
     for i, (input_data, expected) in enumerate(test_cases_solution1):
-        result = solution1(input_data)
+        result = solution1(parse(input_data))
         assert (
             result == expected
         ), f"Test case {i+1} failed: expected {expected}, got {result}"
@@ -138,3 +182,11 @@ NOT y -> i""",
         ), f"Test case {i+1} failed: expected {expected}, got {result}"
 
     logger.info("All tests for solution2 passed!")
+
+
+def test_evaluate_rejects_loops():
+    try:
+        evaluate({"a": "b", "b": "NOT a"})
+    except ValueError:
+        return
+    raise AssertionError("a looped circuit was evaluated")
@@ -1,10 +1,25 @@
 import os
+import random
 import sys
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
 
 
+SCALE_SIZES = {
+    1: [10_000, 100_000, 1_000_000],
+    # part 2 walks every click, ~500 per rotation
+    2: [1_000, 4_000, 16_000, 64_000],
+}
+EXPECTED_COMPLEXITY = 1
+
+
+def generate_input(size: int, seed: int = 0) -> str:
+    """`size` rotations like `L68` / `R48` with distances between 1 and 999."""
+    rng = random.Random(seed)
+    return "\n".join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(size))
+
+
 def parse(raw_data: str) -> list[int]:
     """We have inputs as `L23` or `R12` separated by `\n`
     We convert it to list of integers with `-` if L and `+` if R.
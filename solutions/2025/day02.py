@@ -1,8 +1,30 @@
 import os
+import random
 import sys
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
+from common import report_progress
+
+
+SCALE_SIZES = [10_000, 100_000, 1_000_000]
+EXPECTED_COMPLEXITY = 1
+
+
+def generate_input(size: int, seed: int = 0) -> str:
+    """
+    Comma-separated `start-end` ID ranges covering about `size` IDs in total,
+    spread over 2- to 10-digit numbers like the real input.
+    """
+    rng = random.Random(seed)
+    count = max(1, min(40, size // 100))
+    width = max(1, size // count)
+    ranges = []
+    for _ in range(count):
+        digits = rng.randint(2, 10)
+        start = rng.randint(10 ** (digits - 1), 10**digits - 1)
+        ranges.append(f"{start}-{start + width - 1}")
+    return ",".join(ranges)
 
 
 def parse(raw_data: str) -> list[str]:
@@ -36,7 +58,8 @@ def check_multiple_invalid(num: int) -> bool:
 
 def check_invalid2(range_string: list[str]) -> int:
     invalid = 0
-    for rangee in range_string:
+    for done, rangee in enumerate(range_string):
+        report_progress(done, len(range_string))
         start, end = map(int, rangee.split("-"))
         # print(rangee, list(filter(check_multiple_invalid, range(start, end + 1))))
         invalid += sum(list(filter(check_multiple_invalid, range(start, end + 1))))
@@ -44,7 +67,11 @@ def check_invalid2(range_string: list[str]) -> int:
 
 
 def solution1(data: list[str]) -> int:
-    return sum(map(check_invalid1, data))
+    invalid = 0
+    for done, range_string in enumerate(data):
+        report_progress(done, len(data))
+        invalid += check_invalid1(range_string)
+    return invalid
 
 
 def solution2(data: list[str]) -> int:
@@ -1,4 +1,5 @@
 import os
+import random
 import sys
 from itertools import combinations
 
@@ -6,7 +7,19 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..
 sys.path.insert(0, project_root)
 from common import setup_logging
 
-logger = setup_logging()
+logger = setup_logging(name=__name__)
+
+
+SCALE_SIZES = [100, 1_000, 10_000, 100_000]
+EXPECTED_COMPLEXITY = 1
+# old_find_max tries all 4950 digit pairs of a bank
+VARIANT_SIZES = [100, 200, 400, 800]
+
+
+def generate_input(size: int, seed: int = 0) -> str:
+    """`size` battery banks of 100 digits from 1 to 9."""
+    rng = random.Random(seed)
+    return "\n".join("".join(rng.choices("123456789", k=100)) for _ in range(size))
 
 
 def parse(raw_data: str) -> list[str]:
@@ -48,6 +61,10 @@ def solution1(data: list[str]) -> int:
     return sum(list(map(find_max, data)))
 
 
+def solution1_combinations(data: list[str]) -> int:
+    return sum(map(old_find_max, data))
+
+
 def solution2(data: str) -> int:
     if isinstance(data, str):
         banks = parse(data)  # returns list[str]
@@ -62,6 +79,17 @@ def solution2(data: str) -> int:
     return total
 
 
+# part 2 has no combinations variant: C(100, 12) picks per bank is out of reach
+variants = {
+    1: {"combinations": solution1_combinations, "monotonic_stack": solution1},
+}
+
+test_data: str = """987654321111111
+811111111111119
+234234234234278
+818181911112111"""
+
+
 def test_find_max():
     test_cases = [
         ("987654321111111", 98),
@@ -95,10 +123,7 @@ def test_find_max_with_digits():
 def test_solutions():
     # Tests for solution1
     test_cases_solution1 = [
-        (
-            """987654321111111\n811111111111119\n234234234234278\n818181911112111""",
-            357,
-        ),
+        (test_data, 357),
     ]
 
     for i, (input_data, expected) in enumerate(test_cases_solution1):
@@ -111,10 +136,7 @@ def test_solutions():
 
     # Tests for solution2
     test_cases_solution2 = [
-        (
-            "987654321111111\n811111111111119\n234234234234278\n818181911112111",
-            3121910778619,
-        ),
+        (test_data, 3121910778619),
     ]
 
     for i, (input_data, expected) in enumerate(test_cases_solution2):
@@ -1,79 +1,118 @@
-import copy
 import logging
 import os
+import random
 import sys
+from math import isqrt
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
-from common import setup_logging
-
-logger = setup_logging(level=logging.INFO)
-logger.info(f"{project_root=}")
-
-
-def parse(raw_data: str) -> list[list[str]]:
-    logger.info("parse called, ")
-    return [list(row) for row in raw_data.split()]
-
-
-directions = [(i, j) for j in range(-1, 2) for i in range(-1, 2) if (i, j) != (0, 0)]
-# directions =  [(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
-
-
-def fill_roll(total: int, data: list[list[str]]):
-    rows = len(data)
-    cols = len(data[0])
-    # convert previous 'x' removed rolls to '.'
-    for r in range(rows):
-        for c in range(cols):
-            if data[r][c] == "x":
-                data[r][c] = "."
-    new_data = copy.deepcopy(data)
-    for r in range(rows):
-        for c in range(cols):
-            if data[r][c] != "@":
-                continue
-            neighbours = 0
-            for dx, dy in directions:
-                nr, nc = r + dx, c + dy
-                if 0 <= nr < rows and 0 <= nc < cols:
-                    if data[nr][nc] == "@":
-                        neighbours += 1
-            if neighbours < 4:
-                new_data[r][c] = "x"
-                total += 1
-    return total, new_data
-
-
-def solution1(data: list[list[str]]) -> int:
-    logger.info(type(data), data)
-    r, c = len(data[0]), len(data)
-    total: int = 0
-    total, data = fill_roll(total, data)
-    logger.info(f"{total=}")
-    return total
+from common import Grid, Stencil, neighbour_counts, setup_logging
+
+logger = setup_logging(level=logging.INFO, name=__name__)
+logger.debug("project_root=%s", project_root)
+
+
+# sizes are grid cells
+SCALE_SIZES = {
+    1: [40_000, 160_000, 640_000, 2_560_000],
+    2: [40_000, 160_000, 640_000, 2_560_000],
+}
+EXPECTED_COMPLEXITY = {1: 1, 2: 1}
+# the sweeps reference re-scans the whole grid every round
+VARIANT_SIZES = [10_000, 40_000, 160_000]
+
+
+def generate_input(size: int, seed: int = 0) -> str:
+    """A square roll map of about `size` cells, two thirds of them `@`."""
+    rng = random.Random(seed)
+    side = max(1, isqrt(size))
+    return "\n".join("".join(rng.choices("@@.", k=side)) for _ in range(side))
+
 
+def parse(raw_data: str) -> Grid:
+    logger.debug("parse called")
+    return Grid.from_bytes(raw_data)
 
-def solution2(data: list[list[str]]) -> int:
-    total = 0
-    while True:
-        before_total = total
-        total, data = fill_roll(total, data)
-        logger.info(f"{total=}")
-        # number removed this iteration
-        removed_this_iter = total - before_total
-        if removed_this_iter == 0:
-            break
+
+def parse_stream(path: str) -> Grid:
+    return Grid.from_file(path)
+
+
+def forklift(data: Grid) -> Stencil:
+    """
+    Rolls as a cellular automaton: a roll with fewer than four rolls among
+    its eight neighbours is accessible and gets removed; nothing is added.
+    """
+    return Stencil(data.mask("@"), survive=range(4, 9), birth=())
+
+
+def solution1(data: Grid) -> int:
+    logger.debug("%d x %d grid", data.rows, data.cols)
+    total = forklift(data).step()
+    logger.debug("total=%d", total)
     return total
 
 
+def peel(data: Grid) -> list[int]:
+    """
+    Rolls removed per round, k-core style: neighbour counts are computed once,
+    then each round removes its frontier and decrements only the neighbours
+    of those rolls; the ones that drop below four make the next frontier.
+    Every roll joins a frontier at most once, so the work is linear.
+    """
+    import numpy as np
+
+    # a border of empty cells keeps every neighbour index inside the array
+    padded = data.padded(".")
+    rolls = padded.mask("@")
+    degree = neighbour_counts(rolls).astype(np.int8).ravel()
+    rolls = rolls.ravel()
+    offsets = np.array(padded.offsets())
+
+    removed: list[int] = []
+    frontier = np.flatnonzero(rolls & (degree < 4))
+    while len(frontier):
+        removed.append(len(frontier))
+        rolls[frontier] = False
+        neighbours = (frontier[:, None] + offsets).ravel()
+        np.subtract.at(degree, neighbours, 1)
+        # a roll next to several removed ones shows up once per removal
+        frontier = np.unique(neighbours[rolls[neighbours] & (degree[neighbours] < 4)])
+    return removed
+
+
+def solution2(data: Grid) -> int:
+    removed = peel(data)
+    logger.debug("removed per round: %s", removed)
+    return sum(removed)
+
+
+def solution2_sweeps(data: Grid) -> int:
+    """Reference for part 2: re-applies the rule to the whole grid each round."""
+    return sum(forklift(data).run())
+
+
+variants = {
+    2: {"sweeps": solution2_sweeps, "peeling": solution2},
+}
+
+test_data: str = """\
+..@@.@@@@.
+@@@.@.@.@@
+@@@@@.@.@@
+@.@@@@..@.
+@@.@@@@.@@
+.@@@@@@@.@
+.@.@.@.@@@
+@.@@@.@@@@
+.@@@@@@@@.
+@.@.@@@.@."""
+
+
 def test_solutions():
     # Tests for solution1
     test_cases_solution1 = [
-        (
-            "..@@.@@@@.\n@@@.@.@.@@\n@@@@@.@.@@\n@.@@@@..@.\n@@.@@@@.@@\n.@@@@@@@.@\n.@.@.@.@@@\n@.@@@.@@@@\n.@@@@@@@@.\n@.@.@@@.@.",
-            13,
-        ),
+        (test_data, 13),
     ]
 
     for i, (input_data, expected) in enumerate(test_cases_solution1):
@@ -86,10 +125,7 @@ def test_solutions():
 
     # Tests for solution2
     test_cases_solution2 = [
-        (
-            "..@@.@@@@.\n@@@.@.@.@@\n@@@@@.@.@@\n@.@@@@..@.\n@@.@@@@.@@\n.@@@@@@@.@\n.@.@.@.@@@\n@.@@@.@@@@\n.@@@@@@@@.\n@.@.@@@.@.",
-            43,
-        ),
+        (test_data, 43),
     ]
 
     for i, (input_data, expected) in enumerate(test_cases_solution2):
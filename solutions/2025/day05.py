@@ -1,14 +1,33 @@
 import logging
 import os
+import random
 import sys
 
-import pytest
-
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
 from common import flatten, setup_logging
 
-logger = setup_logging(logging.INFO)
+logger = setup_logging(logging.INFO, __name__)
+
+
+SCALE_SIZES = {
+    # part 1 checks every ingredient against every range
+    1: [250, 500, 1_000, 2_000],
+    2: [10_000, 100_000, 1_000_000],
+}
+EXPECTED_COMPLEXITY = {1: 2, 2: 1}
+
+
+def generate_input(size: int, seed: int = 0) -> str:
+    """`size` fresh-ID ranges (some overlapping), a blank line, `size` IDs."""
+    rng = random.Random(seed)
+    span = 10**14
+    ranges = []
+    for _ in range(size):
+        low = rng.randrange(span)
+        ranges.append(f"{low}-{low + rng.randrange(span // size)}")
+    ids = (str(rng.randrange(span)) for _ in range(size))
+    return "\n".join(ranges) + "\n\n" + "\n".join(ids)
 
 
 def parse(raw_data: str) -> tuple[list[str], list[int]]:
@@ -77,18 +96,13 @@ test_data: str = """3-5
 32"""
 
 
-@pytest.fixture
-def input_data() -> str:
-    return test_data
-
-
-@pytest.mark.parametrize(
-    "expected, solution",
-    [
+def test_solutions():
+    test_cases = [
         (3, solution1),
         (14, solution2),
-    ],
-)
-def test_solutions(input_data, expected, solution):
-    result = solution(parse(input_data))
-    assert result == expected, f"Expected {expected}, got {result}"
+    ]
+    for expected, solution in test_cases:
+        result = solution(parse(test_data))
+        assert (
+            result == expected
+        ), f"{solution.__name__}: expected {expected}, got {result}"
@@ -1,15 +1,34 @@
 import logging
 import os
+import random
 import sys
 from functools import reduce
 
-import pytest
-
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
-from common import setup_logging
+from common import setup_logging, span
+
+logger = setup_logging(logging.WARNING, __name__)
+
+
+SCALE_SIZES = [100, 1_000, 10_000, 100_000]
+EXPECTED_COMPLEXITY = 1
 
-logger = setup_logging(logging.WARNING)
+
+def generate_input(size: int, seed: int = 0) -> str:
+    """
+    A worksheet of `size` problems side by side: four rows of numbers, then the
+    operator row. Numbers within a problem share a digit count, so the columns
+    also read as whole numbers for part 2.
+    """
+    rng = random.Random(seed)
+    rows: list[list[str]] = [[] for _ in range(5)]
+    for _ in range(size):
+        width = rng.randint(1, 4)
+        for row in rows[:4]:
+            row.append(str(rng.randint(10 ** (width - 1), 10**width - 1)))
+        rows[4].append(rng.choice("+*").ljust(width))
+    return "\n".join(" ".join(row) for row in rows)
 
 
 def parse(raw_data: str) -> list[str]:
@@ -18,24 +37,28 @@ def parse(raw_data: str) -> list[str]:
 
 def solution1(data: list[str]) -> int:
     nums: list[list[int]] = []
-    for line in data:
-        if line == data[-1]:
-            break
-        clean = line.split()
-        clean = list(map(int, clean))
-        nums.append(clean)
-    logger.info(f"{nums=}")
+    with span("split rows into numbers"):
+        for line in data:
+            if line == data[-1]:
+                break
+            clean = line.split()
+            clean = list(map(int, clean))
+            nums.append(clean)
+    logger.info("nums=%s", nums)
     operators: list[str] = data[-1].split()
-    logger.info(f"{operators=}")
+    logger.info("operators=%s", operators)
     total: int = 0
-    for i in range(len(operators)):
-        op = operators[i]
-        target = [x[i] for x in nums]
-        if op == "+":
-            total += sum(target)
-        elif op == "*":
-            total += reduce(lambda x, y: x * y, target)
-        logger.info(f"{total=}")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    with span("apply operators"):
+        for i in range(len(operators)):
+            op = operators[i]
+            target = [x[i] for x in nums]
+            if op == "+":
+                total += sum(target)
+            elif op == "*":
+                total += reduce(lambda x, y: x * y, target)
+            if debug:
+                logger.debug("total=%d", total)
     return total
 
 
@@ -50,8 +73,11 @@ def get_problem_groups(data: list[str]) -> list[dict[str, list[str]]]:
 
     # 2. Identify indices of empty columns (separators)
     # zip(*padded_data) transposes rows to columns
-    cols = list(zip(*padded_data))
-    empty_col_indices = [i for i, col in enumerate(cols) if all(c == " " for c in col)]
+    with span("transpose"):
+        cols = list(zip(*padded_data))
+        empty_col_indices = [
+            i for i, col in enumerate(cols) if all(c == " " for c in col)
+        ]
 
     # Add start (0) and end (max_len) to indices to help slicing
     # We want ranges between separators
@@ -120,28 +146,34 @@ def get_right_to_left(rows: list[str]) -> list[int]:
 
 
 def solution2(data: list[str]) -> int:
-    problem_groups = get_problem_groups(data)
+    with span("split blocks"):
+        problem_groups = get_problem_groups(data)
 
     total_sum = 0
-
-    logger.info(f"Found {len(problem_groups)} problem blocks.")
-    logger.info(f"{problem_groups=}")
-
-    for group in problem_groups:
-        for operator, rows in group.items():
-            # rows are passed to get_right_to_left
-            # e.g., rows = [' 64', ' 23', '314'] (Rightmost block)
-            results = get_right_to_left(rows)
-
-            logger.info(f"Operator: {operator}, Rows: {rows}, Operands: {results}")
-
-            if operator == "+":
-                total_sum += sum(results)
-            elif operator == "*":
-                product = 1
-                for num in results:
-                    product *= num
-                total_sum += product
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    logger.info("Found %d problem blocks.", len(problem_groups))
+    logger.info("problem_groups=%s", problem_groups)
+
+    with span("read right-to-left"):
+        for group in problem_groups:
+            for operator, rows in group.items():
+                # rows are passed to get_right_to_left
+                # e.g., rows = [' 64', ' 23', '314'] (Rightmost block)
+                results = get_right_to_left(rows)
+
+                if debug:
+                    logger.debug(
+                        "Operator: %s, Rows: %s, Operands: %s", operator, rows, results
+                    )
+
+                if operator == "+":
+                    total_sum += sum(results)
+                elif operator == "*":
+                    product = 1
+                    for num in results:
+                        product *= num
+                    total_sum += product
 
     return total_sum
 
@@ -153,41 +185,33 @@ test_data: str = """\
 *   +   *   +  """
 
 
-@pytest.fixture
-def input_data() -> str:
-    return test_data
-
-
-@pytest.mark.parametrize(
-    "expected, solution",
-    [
+def test_solutions():
+    test_cases = [
         # (4277556, solution1),
         (3263827, solution2),
-    ],
-)
-def test_solutions(input_data, expected, solution):
-    result = solution(parse(input_data))
-    assert result == expected, f"Expected {expected}, got {result}"
+    ]
+    for expected, solution in test_cases:
+        result = solution(parse(test_data))
+        assert (
+            result == expected
+        ), f"{solution.__name__}: expected {expected}, got {result}"
 
 
-@pytest.mark.parametrize(
-    "input_list, expected_output",
-    [
+def test_get_right_to_left():
+    test_cases = [
         (["64 ", "23 ", "314"], [4, 431, 623]),
         ([" 51", "387", "215"], [175, 581, 32]),
         (["328", "64 ", "98 "], [8, 248, 369]),
         (["123", " 45", "  6"], [356, 24, 1]),
         (["15", "23", " 4"], [534, 12]),
         (["97  ", "511 ", "743 ", "3239"], [9, 133, 7142, 9573]),
-    ],
-)
-def test_get_right_to_left(input_list, expected_output):
-    assert get_right_to_left(input_list) == expected_output
+    ]
+    for input_list, expected_output in test_cases:
+        assert get_right_to_left(input_list) == expected_output
 
 
-@pytest.mark.parametrize(
-    "input_lines, expected_length, expected_first_op, expected_first_rows",
-    [
+def test_get_problem_groups():
+    test_cases = [
         # Case 1: Single block (no spaces)
         (["12", "34", "+ "], 1, "+", ["12", "34"]),
         # Case 2: Two blocks separated by one space
@@ -200,19 +224,21 @@ def test_get_right_to_left(input_list, expected_output):
             "+",
             ["1", "3"],  # "3" becomes "3 " after padding, then sliced to "3"
         ),
-    ],
-)
-def test_get_problem_groups(
-    input_lines, expected_length, expected_first_op, expected_first_rows
-):
-    groups = get_problem_groups(input_lines)
-
-    # Check we found the right number of blocks
-    assert len(groups) == expected_length
-
-    # Check the first block's content
-    first_group = groups[0]
-    # The key should be the operator
-    assert expected_first_op in first_group
-    # The value should be the rows of numbers
-    assert first_group[expected_first_op] == expected_first_rows
+    ]
+    for (
+        input_lines,
+        expected_length,
+        expected_first_op,
+        expected_first_rows,
+    ) in test_cases:
+        groups = get_problem_groups(input_lines)
+
+        # Check we found the right number of blocks
+        assert len(groups) == expected_length
+
+        # Check the first block's content
+        first_group = groups[0]
+        # The key should be the operator
+        assert expected_first_op in first_group
+        # The value should be the rows of numbers
+        assert first_group[expected_first_op] == expected_first_rows
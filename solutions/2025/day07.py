@@ -1,94 +1,100 @@
 import logging
 import os
+import random
 import sys
-from collections import deque
-from functools import cache
-
-import pytest
+from math import isqrt
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
-from common import setup_logging
+from common import Grid, setup_logging
 
-logger = setup_logging(logging.WARN)
+logger = setup_logging(logging.WARNING, __name__)
 
 
-def parse(raw_data: str) -> list[list[str]]:
-    return [list(x) for x in raw_data.split("\n")]
+# sizes are grid cells; generated manifolds are at most 400 rows tall
+SCALE_SIZES = [10_000, 100_000, 1_000_000]
+EXPECTED_COMPLEXITY = 1
 
 
-def find_S_position(grid: list[list[str]]) -> tuple[int, int]:
-    rows, cols = len(grid), len(grid[0])
-    loc: tuple[int, int] = (-1, -1)
-    for r in range(rows):
+def generate_input(size: int, seed: int = 0) -> str:
+    """
+    A manifold of about `size` cells with `S` centred on the top row and
+    splitters scattered over every other row below it.
+    """
+    rng = random.Random(seed)
+    rows = max(2, min(isqrt(size), 400)) // 2 * 2
+    cols = max(3, size // rows)
+    grid = [["."] * cols for _ in range(rows)]
+    grid[0][cols // 2] = "S"
+    for r in range(2, rows, 2):
         for c in range(cols):
-            if grid[r][c] == "S":
-                loc = (r, c)
-    logger.info(f"`S` position for grid found at: {loc}")
+            if rng.random() < 0.15:
+                grid[r][c] = "^"
+    return "\n".join("".join(row) for row in grid)
+
+
+def parse(raw_data: str) -> Grid:
+    return Grid.from_bytes(raw_data)
+
+
+def parse_stream(path: str) -> Grid:
+    return Grid.from_file(path)
+
+
+def find_S_position(grid: Grid) -> tuple[int, int]:
+    loc = grid.find("S")
+    logger.info("`S` position for grid found at: %s", loc)
     return loc
 
 
-def solution1(data: list[list[str]]) -> int:
-    start_loc: tuple[int, int] = find_S_position(data)
-    # initialize dequeue for bfs.
-    queue: deque = deque([(start_loc[0] + 1, start_loc[1])])
-    splitters_loc = set()
-    while queue:
-        r, c = queue.popleft()
-        # current
-        curr_r = r
-        while curr_r < len(data):
-            # check if column is inbounds
-            if not (0 <= c < len(data[0])):
-                break
-            cell = data[curr_r][c]
-            if cell == "^":
-                # we got a splitter
-                if (curr_r, c) not in splitters_loc:
-                    splitters_loc.add((curr_r, c))
-                    # beam split
-                    queue.append((curr_r, c - 1))
-                    queue.append((curr_r, c + 1))
-                break  # beam will always stop at splitter
-            # if its '.', we keep moving down
-            curr_r += 1
-    total: int = len(splitters_loc)
-    logger.info(f"Solution1 result: {total}")
+def solution1(data: Grid) -> int:
+    import numpy as np
+
+    start_r, start_c = find_S_position(data)
+    # beams entering each row from above, swept down one row at a time
+    beams = np.zeros(data.cols, dtype=bool)
+    beams[start_c] = True
+    total: int = 0
+    for row in data[start_r + 1 :]:
+        splitters = row == ord("^")
+        # a beam leaving a splitter sideways starts in the same row, so a run
+        # of adjacent splitters is hit as a whole once any of them is hit
+        starts = splitters & ~np.concatenate(([False], splitters[:-1]))
+        run_ids = np.cumsum(starts) * splitters
+        hit_runs = np.unique(run_ids[beams & splitters])
+        hit = splitters & np.isin(run_ids, hit_runs)
+        total += int(hit.sum())
+        # beams stop at splitters and continue on both sides of each hit run
+        sideways = np.zeros_like(hit)
+        sideways[:-1] |= hit[1:]
+        sideways[1:] |= hit[:-1]
+        beams = (beams | sideways) & ~splitters
+    logger.info("Solution1 result: %d", total)
     return total
 
 
-def solution2(data: list[list[str]]) -> int:
-    rows, cols = len(data), len(data[0])
-    start_loc: tuple[int, int] = find_S_position(data)
-    logger.info(f"{start_loc=}")
-
-    @cache
-    def get_timelines(r, c):
-        # Base Case 1: Out of bounds (Hit side wall)
-        # A timeline that goes out of bounds is considered a complete timeline that exited.
-        logger.info(f"get_timelines called for: {r},{c}")
-        if not (0 <= c < cols):
-            return 1
-        # Base Case 2: Hit bottom
-        if r == rows:
-            return 1
-        # Check the cell type at the current position
-        cell: str = data[r][c]
-        if cell == ".":
-            # empty space, continue straight down
-            return get_timelines(r + 1, c)
-        elif cell == "^":
-            # found Splitter, timeline splits into 2 paths
-            return get_timelines(r + 1, c - 1) + get_timelines(r + 1, c + 1)
-        # 'S' is only the starting point
-        elif cell == "S":
-            return get_timelines(r + 1, c)
-        return 0
-
-    # The result is the number of timelines starting just below 'S'
-    # The start is effectively at (start_r + 1, start_c)
-    result: int = get_timelines(start_loc[0] + 1, start_loc[1])
-    logger.info(f"Solution2 : {result=}")
+def solution2(data: Grid) -> int:
+    import numpy as np
+
+    start_r, start_c = find_S_position(data)
+    logger.info("start_loc=%s", (start_r, start_c))
+    # timelines entering each column of the next row; object dtype keeps
+    # Python ints, as the counts double at every splitter and outgrow int64
+    timelines = np.zeros(data.cols, dtype=object)
+    timelines[start_c] = 1
+    # A timeline that goes out of bounds is considered a complete timeline that exited.
+    exited = 0
+    for row in data[start_r + 1 :]:
+        split = np.where(row == ord("^"), timelines, 0)
+        # empty space (and `S`) continue straight down, anything else absorbs
+        timelines = np.where((row == ord(".")) | (row == ord("S")), timelines, 0)
+        # found Splitter, timeline splits into 2 paths on the next row
+        timelines[:-1] += split[1:]
+        timelines[1:] += split[:-1]
+        exited += split[0] + split[-1]
+    # timelines that reached the bottom are complete too
+    result: int = int(exited + timelines.sum())
+    logger.info("Solution2 : result=%d", result)
     return result
 
 
@@ -110,18 +116,13 @@ test_data: str = """.......S.......
 ..............."""
 
 
-@pytest.fixture
-def input_data() -> str:
-    return test_data
-
-
-@pytest.mark.parametrize(
-    "expected, solution",
-    [
+def test_solutions():
+    test_cases = [
         (21, solution1),
         (40, solution2),
-    ],
-)
-def test_solutions(input_data, expected, solution):
-    result = solution(parse(input_data))
-    assert result == expected, f"Expected {expected}, got {result}"
+    ]
+    for expected, solution in test_cases:
+        result = solution(parse(test_data))
+        assert (
+            result == expected
+        ), f"{solution.__name__}: expected {expected}, got {result}"
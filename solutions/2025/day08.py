@@ -1,16 +1,37 @@
 import logging
 import os
+import random
 import sys
-from collections import defaultdict
+from itertools import islice
 from math import prod
-
-import pytest
+from operator import itemgetter
+from typing import Iterable
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
-from common import setup_logging
+from common import DisjointSet, PointIndex, setup_logging
+
+logger = setup_logging(logging.INFO, __name__)
+
+
+# part 1 only meets near neighbours; part 2 generates every pair shorter than
+# the last connection, which grows a little faster than n with the outliers
+SCALE_SIZES = {
+    1: [10_000, 40_000, 160_000],
+    2: [2_000, 8_000, 32_000],
+}
+EXPECTED_COMPLEXITY = {1: 1, 2: 1.5}
+# the all-pairs reference builds every edge, so it stays in the thousands
+VARIANT_SIZES = [250, 500, 1_000]
 
-logger = setup_logging(logging.INFO)
+
+def generate_input(size: int, seed: int = 0) -> str:
+    """`size` junction boxes as `X,Y,Z` lines with coordinates below 100000."""
+    rng = random.Random(seed)
+    return "\n".join(
+        f"{rng.randrange(100_000)},{rng.randrange(100_000)},{rng.randrange(100_000)}"
+        for _ in range(size)
+    )
 
 
 def parse(raw_data: str) -> list[str]:
@@ -24,156 +45,69 @@ def squared_distance_between_two_points(p1: list[int], p2: list[int]) -> int:
     return dist
 
 
-def find_set(parent, v):
-    if v == parent[v]:
-        return v
-    parent[v] = find_set(parent, parent[v])
-    return parent[v]
+def parse_points(data: list[str]) -> list[tuple[int, int, int]]:
+    return [tuple(map(int, line.split(","))) for line in data]
 
 
-def union_sets(parent, a, b):
-    a = find_set(parent, a)
-    b = find_set(parent, b)
-    if a != b:
-        parent[b] = a
+def sorted_edges(points: list[tuple[int, int, int]]) -> list[tuple[int, int, int]]:
+    """Every pair of boxes as (squared_distance, i, j), shortest first."""
+    n = len(points)
+    edges = [
+        (squared_distance_between_two_points(points[i], points[j]), i, j)
+        for i in range(n)
+        for j in range(i + 1, n)
+    ]
+    # stable, so equal distances keep (i, j) order without comparing tuples
+    edges.sort(key=itemgetter(0))
+    return edges
+
+
+def largest_circuits(points: list[tuple[int, int, int]], edges: Iterable) -> int:
+    """Wires the first edges (shortest first); multiplies the 3 largest circuits."""
+    # Union Find: https://cp-algorithms.com/data_structures/disjoint_set_union.html
+    circuits = DisjointSet(len(points))
+    WIRE_COUNT: int = 10 if len(points) < 21 else 1000
+    wires = list(islice(edges, WIRE_COUNT))
+    circuits.union_many([i for _, i, _ in wires], [j for _, _, j in wires])
+    return prod(circuits.component_sizes()[:3])
 
 
-def union_by_rank(parent, rank, x, y):
-    px, py = find_set(parent, x), find_set(parent, y)
-    if px == py:
-        return False  # already in same circuit
-    if rank[px] < rank[py]:
-        px, py = py, px
-    parent[py] = px
-    if rank[px] == rank[py]:
-        rank[px] += 1
-    return True
+def last_connection(points: list[tuple[int, int, int]], edges: Iterable) -> int:
+    """Wires edges shortest first until one circuit remains."""
+    circuits = DisjointSet(len(points))
+    for _, i, j in edges:
+        if circuits.union(i, j) and circuits.components == 1:
+            # this edge completed the single circuit; the answer multiplies
+            # the X coordinates of its two boxes
+            return points[i][0] * points[j][0]
+    return 0
 
 
 def solution1(data: list[str]) -> int:
-    # data here is cleaned data from parse func above
-    # Distance between 2 points in 3 dimensions:
-    points = []
-    for line in data:
-        x, y, z = map(int, line.split(","))
-        points.append((x, y, z))
-    # print(f"{points=}")
-
-    distances = []
-    for i in range(len(points)):
-        for j in range(i + 1, len(points)):
-            p1 = points[i]
-            p2 = points[j]
-            distances.append((squared_distance_between_two_points(p1, p2), p1, p2))
-    # distances => [distance, p1, p2] => [distance: int, [x1,x2,x3]: p1, [y1,y2,y3]:p2]
-    # print(f"{distances[2]=}")
-
-    # Now we use Union Find with : union, find_set: https://cp-algorithms.com/data_structures/disjoint_set_union.html
-
-    # Make Set:
-    # parent = {i: i for i in points}
-    parent = {i: i for i in points}
-    # print(f"{parent}")
+    points = parse_points(data)
+    # pairs come out of the index shortest first, and only as many as are wired
+    return largest_circuits(points, PointIndex(points).closest_pairs())
 
-    WIRE_COUNT: int = 10 if len(points) < 21 else 1000
 
-    for d, p1, p2 in sorted(distances)[:WIRE_COUNT]:
-        union_sets(parent, p1, p2)
-    # print(f"{parent=}")
+def solution1_all_pairs(data: list[str]) -> int:
+    points = parse_points(data)
+    return largest_circuits(points, sorted_edges(points))
 
-    sizes = defaultdict(int)
 
-    for p in points:
-        # print(f"{p=}")
-        sizes[find_set(parent, p)] += 1
-    sizes_val_sorted = sorted(sizes.values(), reverse=True)
-    # print(f"{sizes_val_sorted=}")
-    return prod(sizes_val_sorted[:3])
+def solution2(data: list[str]) -> int:
+    points = parse_points(data)
+    return last_connection(points, PointIndex(points).closest_pairs())
 
 
-def solution2(data: list[str]) -> int:
-    # 1. Parse points (store as a list of tuples)
-    points = []
-    for line in data:
-        x, y, z = map(int, line.split(","))
-        points.append((x, y, z))
+def solution2_all_pairs(data: list[str]) -> int:
+    points = parse_points(data)
+    return last_connection(points, sorted_edges(points))
 
-    n = len(points)
 
-    # 2. Initialize DSU structure
-    parent = list(range(n))
-    size = [1] * n  # Used for union by size optimization
-
-    # Helper function for Find with path compression (internal)
-    def find_set(v):
-        if v == parent[v]:
-            return v
-        parent[v] = find_set(parent[v])
-        return parent[v]
-
-    # Helper function for Union by Size (internal)
-    # Returns True if a union occurred, False otherwise
-    def union_sets(a, b):
-        root_a = find_set(a)
-        root_b = find_set(b)
-
-        if root_a != root_b:
-            # Union by Size: attach smaller tree to root of larger tree
-            if size[root_a] < size[root_b]:
-                root_a, root_b = root_b, root_a
-
-            parent[root_b] = root_a
-            size[root_a] += size[root_b]
-            return True  # Successful union
-        return False
-
-    # 3. Calculate all pairwise distances (edges)
-    distances = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            p1 = points[i]
-            p2 = points[j]
-            # Store (squared_distance, index_i, index_j)
-            distances.append((squared_distance_between_two_points(p1, p2), i, j))
-
-    # 4. Sort edges by distance
-    distances.sort(key=lambda x: x[0])
-
-    # 5. Process edges until only one circuit remains
-
-    # Total successful connections needed is N - 1
-    successful_connections_needed = n - 1
-    connections_made = 0
-
-    # Variables to store the indices of the last connected pair
-    last_i, last_j = None, None
-
-    for dist, i, j in distances:
-        if connections_made >= successful_connections_needed:
-            break
-
-        # Attempt to unite the circuits of i and j
-        if union_sets(i, j):
-            connections_made += 1
-            last_i, last_j = (
-                i,
-                j,
-            )  # This edge is the 'last' successful connection so far
-
-    # 6. Calculate the final result
-
-    # The last edge (last_i, last_j) is the one that completed the MST (N-1 connections).
-    # We need the X-coordinates of points[last_i] and points[last_j].
-    # Points are stored as (X, Y, Z), so X is at index 0.
-
-    if last_i is not None and last_j is not None:
-        x_coord_i = points[last_i][0]
-        x_coord_j = points[last_j][0]
-        result = x_coord_i * x_coord_j
-        return result
-    else:
-        # This case should not happen if N > 0
-        return 0
+variants = {
+    1: {"all_pairs": solution1_all_pairs, "spatial_index": solution1},
+    2: {"all_pairs": solution2_all_pairs, "spatial_index": solution2},
+}
 
 
 test_data: str = """162,817,812
@@ -203,26 +137,22 @@ def get_sample_input() -> str:
     return test_data
 
 
-@pytest.fixture
-def input_data() -> str:
-    return test_data
-
-
-@pytest.mark.parametrize(
-    "expected, solution",
-    [
+def test_solutions():
+    test_cases = [
         (40, solution1),
+        (40, solution1_all_pairs),
         (25272, solution2),
-    ],
-)
-def test_solutions(input_data, expected, solution):
-    result = solution(parse(input_data))
-    assert result == expected, f"Expected {expected}, got {result}"
+        (25272, solution2_all_pairs),
+    ]
+    for expected, solution in test_cases:
+        result = solution(parse(test_data))
+        assert (
+            result == expected
+        ), f"{solution.__name__}: expected {expected}, got {result}"
 
 
-@pytest.mark.parametrize(
-    "p1, p2, exp",
-    [
+def test_distance_between_two_points():
+    test_cases = [
         # Test with typical points in 3D space
         ([162, 817, 812], [57, 618, 57], 620651),
         # Test with two identical points (should return 0)
@@ -239,8 +169,12 @@ def test_solutions(input_data, expected, solution):
         ([10, 20, 30], [40, 50, 60], 2700),
         # Extreme values
         ([1e9, 1e9, 1e9], [2e9, 2e9, 2e9], 3e18),
-    ],
-)
-def test_distance_between_two_points(p1, p2, exp):
-    result = squared_distance_between_two_points(p1, p2)
-    assert result == exp, f"Expected {exp}, got {result}"
+    ]
+    for p1, p2, exp in test_cases:
+        result = squared_distance_between_two_points(p1, p2)
+        assert result == exp, f"Expected {exp}, got {result}"
+
+
+def test_closest_pairs_match_all_pairs():
+    points = parse_points(parse(generate_input(300, seed=1)))
+    assert list(PointIndex(points).closest_pairs()) == sorted_edges(points)
@@ -1,17 +1,46 @@
 import logging
 import os
+import random
 import sys
 from copy import deepcopy
 from functools import cache
 from typing import Hashable, List, Tuple  # Using typing for clarity
 
-import pytest
-
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.insert(0, project_root)
 from common import setup_logging
 
-logger = setup_logging(logging.INFO)
+logger = setup_logging(logging.INFO, __name__)
+
+
+SCALE_SIZES = {
+    1: [500, 1_000, 2_000, 4_000],
+    # part 2 checks every edge for every candidate pair
+    2: [24, 48, 96, 192],
+}
+EXPECTED_COMPLEXITY = {1: 2, 2: 3}
+
+
+def generate_input(size: int, seed: int = 0) -> str:
+    """
+    A rectilinear "skyline" polygon with about `size` red tiles as vertices:
+    a flat bottom edge and a column of random height every few tiles.
+    """
+    rng = random.Random(seed)
+    columns = max(1, (size - 2) // 2)
+    xs = [1]
+    for _ in range(columns):
+        xs.append(xs[-1] + rng.randint(2, 1000))
+    points = [(xs[0], 1)]
+    height = None
+    for left, right in zip(xs, xs[1:]):
+        new_height = rng.randint(2, 100_000)
+        while new_height == height:
+            new_height = rng.randint(2, 100_000)
+        height = new_height
+        points += [(left, height), (right, height)]
+    points.append((xs[-1], 1))
+    return "\n".join(f"{x},{y}" for x, y in points)
 
 
 def parse(raw_data: str) -> list[list[int]]:
@@ -187,19 +216,14 @@ def get_test_data() -> str:
     return test_data
 
 
-@pytest.fixture
-def input_data() -> str:
-    return test_data
-
-
-@pytest.mark.parametrize(
-    "expected, solution",
-    [
+def test_solutions():
+    test_cases = [
         (50, solution1),
         # (0, solution2),
         (24, solution2),
-    ],
-)
-def test_solutions(input_data, expected, solution):
-    result = solution(parse(input_data))
-    assert result == expected, f"Expected {expected}, got {result}"
+    ]
+    for expected, solution in test_cases:
+        result = solution(parse(test_data))
+        assert (
+            result == expected
+        ), f"{solution.__name__}: expected {expected}, got {result}"
@@ -1,17 +1,16 @@
-import importlib
+from registry import registry
 
 
 def import_function(module_name, func_name):
     """
     Import a function from a specified module.
 
-    :param module_name: The dot-separated path to the Python module
+    :param module_name: The dot-separated path to the Python module,
+        e.g. "solutions.2015.day01"
     :param func_name: The name of the function to import
     :return: The specified function
     """
-    import importlib
-
-    # Import the module
-    module = importlib.import_module(module_name)
+    _, year, day = module_name.split(".")
+    module = registry.load(int(year), int(day.removeprefix("day")))
     # Retrieve the function from the module
     return getattr(module, func_name)
@@ -0,0 +1,196 @@
+"""
+Cold-start report: runs a main.py command under `python -X importtime` and
+shows which imports its startup time goes to, checked against a fixed budget.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# total import time of a plain `main.py` run, in milliseconds
+STARTUP_BUDGET_MS = 150.0
+# only worth paying for in runs that use them (tests, numpy-backed days)
+HEAVY_MODULES = ("pytest", "numpy")
+# imported by the commands that need them, never by a plain run
+TOOLING_MODULES = (
+    "benchmarks.history",
+    "benchmarks.suite",
+    "profilers",
+    "runner",
+    "startup",
+    "supervisor",
+)
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    parent: Optional[str] = None
+
+
+def parse_importtime(stderr: str) -> List[ImportTime]:
+    """
+    Parses `-X importtime` lines. Children are printed before the module that
+    imported them, one indentation level deeper, so each row's parent is the
+    next row with a smaller depth.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append(ImportTime(name.strip(), int(self_us), int(cumulative_us), depth))
+
+    pending: List[ImportTime] = []
+    for row in rows:
+        while pending and pending[-1].depth > row.depth:
+            pending.pop().parent = row.module
+        pending.append(row)
+    return rows
+
+
+def measure_startup(
+    argv: Sequence[str], runs: int = 3
+) -> Tuple[List[ImportTime], float]:
+    """Import breakdown of `main.py argv` and its best wall time over `runs`."""
+    command = [sys.executable, os.path.join(ROOT, "main.py"), *argv]
+    wall = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, capture_output=True)
+        wall = min(wall, time.perf_counter() - start)
+    traced = subprocess.run(
+        [sys.executable, "-X", "importtime", *command[1:]],
+        capture_output=True,
+        text=True,
+    )
+    return parse_importtime(traced.stderr), wall
+
+
+def split_interpreter(rows: List[ImportTime]) -> Tuple[List[ImportTime], float]:
+    """
+    Splits off what the interpreter imports before main.py runs (everything up
+    to `site`, including .pth hooks of installed packages); returns the rest
+    and the interpreter's share in milliseconds.
+    """
+    for i, row in enumerate(rows):
+        if row.depth == 0 and row.module == "site":
+            before = sum(r.cumulative_us for r in rows[: i + 1] if r.depth == 0)
+            return rows[i + 1 :], before / 1000
+    return rows, 0.0
+
+
+def _first_party(module: str) -> bool:
+    top = module.split(".")[0]
+    return top in ("solutions", "benchmarks") or os.path.exists(
+        os.path.join(ROOT, f"{top}.py")
+    )
+
+
+def print_startup_report(
+    argv: Sequence[str], top: int = 10, budget_ms: float = STARTUP_BUDGET_MS
+) -> int:
+    """Prints the report; returns 1 when import time is over `budget_ms`."""
+    rows, wall = measure_startup(argv)
+    rows, interpreter_ms = split_interpreter(rows)
+    total_ms = sum(r.cumulative_us for r in rows if r.depth == 0) / 1000
+    print(f"Startup of `main.py {' '.join(argv)}`")
+    print(
+        f"Wall time {wall * 1000:.1f} ms, imports {total_ms:.1f} ms "
+        f"(plus {interpreter_ms:.1f} ms interpreter startup, not budgeted)"
+    )
+
+    ours = sorted(
+        (r for r in rows if _first_party(r.module)), key=lambda r: -r.cumulative_us
+    )
+    print("\nProject modules     Self (ms) | Cumulative (ms)")
+    for r in ours[:top]:
+        print(f"{r.module:<20}{r.self_us / 1000:9.1f} | {r.cumulative_us / 1000:9.1f}")
+
+    print("\nMost expensive imports (self time)")
+    for r in sorted(rows, key=lambda r: -r.self_us)[:top]:
+        via = f"  (via {r.parent})" if r.parent else ""
+        print(f"{r.module:<40}{r.self_us / 1000:9.1f} ms{via}")
+
+    heavy = [r for r in rows if r.module in HEAVY_MODULES]
+    for r in heavy:
+        print(
+            f"\nNote: {r.module} imported by {r.parent or 'main.py'} "
+            f"({r.cumulative_us / 1000:.1f} ms)"
+        )
+
+    if total_ms > budget_ms:
+        print(f"\nOVER BUDGET: imports {total_ms:.1f} ms > {budget_ms:g} ms")
+        return 1
+    print(f"\nWithin budget ({budget_ms:g} ms)")
+    return 0
+
+
+def _imported_by(code: str) -> List[str]:
+    traced = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+    assert traced.returncode == 0, traced.stderr[-2000:]
+    return [r.module for r in parse_importtime(traced.stderr)]
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:        10 |         10 |   _io\n"
+        "import time:        20 |         20 |   marshal\n"
+        "import time:       100 |        130 | zipimport\n"
+        "import time:         5 |          5 | site\n"
+    )
+    rows = parse_importtime(stderr)
+    assert [(r.module, r.depth, r.parent) for r in rows] == [
+        ("_io", 1, "zipimport"),
+        ("marshal", 1, "zipimport"),
+        ("zipimport", 0, None),
+        ("site", 0, None),
+    ]
+    assert rows[2].self_us == 100 and rows[2].cumulative_us == 130
+
+
+def test_split_interpreter():
+    rows = parse_importtime(
+        "import time:        10 |         10 |   encodings\n"
+        "import time:        40 |         50 | site\n"
+        "import time:       300 |        300 | main\n"
+    )
+    rest, interpreter_ms = split_interpreter(rows)
+    assert [r.module for r in rest] == ["main"]
+    assert interpreter_ms == 0.05
+
+
+def test_main_does_not_import_heavy_modules():
+    modules = _imported_by("import main")
+    assert not set(HEAVY_MODULES) & set(modules)
+
+
+def test_plain_run_skips_tooling():
+    # what `main.py YEAR DAY PART` loads before it reaches the solution
+    modules = set(_imported_by("import main"))
+    assert not set(TOOLING_MODULES) & modules
+    assert not {"sqlite3", "subprocess", "cProfile", "statistics"} & modules
+
+
+def test_solutions_do_not_import_heavy_modules():
+    # numpy-backed days import it in the functions that solve, not at import
+    modules = _imported_by(
+        "from registry import registry\n"
+        "for year, day in registry.days():\n"
+        "    registry.load(year, day)\n"
+    )
+    assert not set(HEAVY_MODULES) & set(modules)
@@ -0,0 +1,288 @@
+import errno
+import math
+import mmap
+import os
+import pickle
+import select
+import signal
+import struct
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple
+
+import common
+from profilers import format_bytes
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+@dataclass
+class RunOutcome:
+    result: Any = None
+    elapsed: float = 0.0
+    error: Optional[str] = None
+    exit_code: Optional[int] = None
+    # the child was stopped by a limit or signal rather than raising
+    killed: bool = False
+    progress: Optional[Tuple[float, float]] = None
+    peak_rss: Optional[int] = None
+
+    def telemetry(self) -> str:
+        """One line for a failed run: what happened, when, and how far it got."""
+        if not self.killed:
+            return self.error or ""
+        parts = [f"{self.error} after {self.elapsed:.2f}s"]
+        if self.progress is not None:
+            done, total = self.progress
+            if total:
+                parts.append(f"progress {done:,.0f}/{total:,.0f} ({done / total:.1%})")
+            else:
+                parts.append(f"progress {done:,.0f}")
+        if self.peak_rss:
+            parts.append(f"peak RSS {format_bytes(self.peak_rss)}")
+        return " | ".join(parts)
+
+
+class RunFailed(Exception):
+    """Raised by callers that treat a failed supervised run as an error."""
+
+    def __init__(self, outcome: RunOutcome):
+        super().__init__(outcome.telemetry())
+        self.outcome = outcome
+
+
+def _address_space() -> int:
+    """Virtual size of this process in bytes, 0 if unknown."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def _apply_limits(timeout: Optional[float], max_mem: Optional[int]) -> None:
+    if resource is None:
+        return
+    if timeout is not None:
+        # backstop for the parent's wall-clock kill; CPU time restarts at fork
+        cpu = math.ceil(timeout) + 1
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+    if max_mem is not None:
+        # counted on top of what the forked child already maps (numpy alone
+        # reserves hundreds of MB of address space it never touches)
+        limit = _address_space() + max_mem * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _out_of_memory(e: BaseException) -> bool:
+    """
+    Whether `e` is how exhausting RLIMIT_AS can surface: besides MemoryError,
+    imports fail to map extension modules, mmap and os calls fail with ENOMEM
+    and threads cannot map their stacks.
+    """
+    if isinstance(e, (MemoryError, ImportError)):
+        return True
+    if isinstance(e, OSError) and e.errno == errno.ENOMEM:
+        return True
+    message = str(e).lower()
+    return any(word in message for word in ("memory", "mmap", "can't start new thread"))
+
+
+def _child(fn: Callable[[], Any], write_fd: int, progress: mmap.mmap, limits) -> None:
+    try:
+        _apply_limits(*limits)
+        common._progress_buffer = progress
+        payload = ("ok", fn())
+    except SystemExit as e:
+        payload = ("exit", e.code)
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}".splitlines()[0]
+        max_mem = limits[1]
+        if max_mem is not None and _out_of_memory(e):
+            payload = ("memory", error)
+        else:
+            payload = ("error", error)
+    try:
+        data = pickle.dumps(payload, pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        data = pickle.dumps(("error", f"unpicklable result: {e}"))
+    with os.fdopen(write_fd, "wb") as f:
+        f.write(data)
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+
+def run_limited(
+    fn: Callable[[], Any],
+    timeout: Optional[float] = None,
+    max_mem: Optional[int] = None,
+) -> RunOutcome:
+    """
+    Runs `fn()` in a forked child with a wall-clock `timeout` (seconds, also
+    enforced as an RLIMIT_CPU backstop) and `max_mem` MB of extra address space.
+    The result comes back pickled; a killed or crashed child yields an outcome
+    with `error` set plus elapsed time, peak RSS and the last value the solution
+    passed to `common.report_progress`.
+    """
+    # configure logging before forking, so the child writes records inline
+    # instead of starting a listener thread under its address-space limit;
+    # the parent's listener is stopped so that no other thread runs at fork
+    common.setup_logging()
+    progress = mmap.mmap(-1, 16)
+    read_fd, write_fd = os.pipe()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    start = time.perf_counter()
+    with common.log_listener_stopped():
+        pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            _child(fn, write_fd, progress, (timeout, max_mem))
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+
+    chunks, timed_out = [], False
+    deadline = None if timeout is None else start + timeout
+    with os.fdopen(read_fd, "rb") as f:
+        while True:
+            wait = None if deadline is None else deadline - time.perf_counter()
+            if wait is not None and wait <= 0:
+                timed_out = True
+                break
+            ready, _, _ = select.select([f], [], [], wait)
+            if not ready:
+                continue
+            chunk = os.read(f.fileno(), 1 << 16)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+    if timed_out:
+        os.kill(pid, signal.SIGKILL)
+    _, status, usage = os.wait4(pid, 0)
+    outcome = RunOutcome(elapsed=time.perf_counter() - start)
+    outcome.peak_rss = usage.ru_maxrss * 1024
+    done, total = struct.unpack_from("dd", progress, 0)
+    if done or total:
+        outcome.progress = (done, total)
+    progress.close()
+
+    outcome.killed = timed_out or os.WIFSIGNALED(status) or not chunks
+    if timed_out:
+        outcome.error = f"TIMEOUT (limit {timeout:g}s)"
+    elif os.WIFSIGNALED(status):
+        sig = os.WTERMSIG(status)
+        if sig == signal.SIGXCPU:
+            outcome.error = f"CPU LIMIT (limit {timeout:g}s)"
+        else:
+            outcome.error = f"KILLED by {signal.Signals(sig).name}"
+    elif not chunks:
+        outcome.error = f"CRASHED (exit status {os.waitstatus_to_exitcode(status)})"
+    else:
+        kind, value = pickle.loads(b"".join(chunks))
+        if kind == "ok":
+            outcome.result = value
+        elif kind == "exit":
+            outcome.exit_code = value if isinstance(value, int) else int(bool(value))
+        elif kind == "memory":
+            outcome.killed = True
+            outcome.error = f"MEMORY LIMIT (limit {max_mem} MB): {value}"
+        else:
+            outcome.error = value
+    return outcome
+
+
+def test_run_limited_result_and_error():
+    outcome = run_limited(lambda: sum(range(10)))
+    assert (outcome.result, outcome.error, outcome.killed) == (45, None, False)
+
+    outcome = run_limited(lambda: 1 // 0)
+    assert outcome.error.startswith("ZeroDivisionError")
+    assert not outcome.killed
+
+    outcome = run_limited(lambda: sys.exit(3))
+    assert (outcome.exit_code, outcome.error) == (3, None)
+
+
+def test_run_limited_timeout():
+    def spin():
+        common.report_progress(5, 10)
+        time.sleep(5)
+
+    outcome = run_limited(spin, timeout=0.2)
+    assert outcome.killed
+    assert outcome.error == "TIMEOUT (limit 0.2s)"
+    assert outcome.progress == (5, 10)
+    assert outcome.elapsed < 5
+
+
+def test_run_limited_memory_limit():
+    if resource is None:
+        return
+    outcome = run_limited(lambda: bytearray(512 * 1024 * 1024), max_mem=32)
+    assert outcome.killed
+    assert outcome.error.startswith("MEMORY LIMIT (limit 32 MB)")
+
+
+def test_run_limited_import_under_memory_limit():
+    if resource is None or "numpy" in sys.modules:
+        return  # a loaded numpy would be re-used rather than mapped again
+
+    def load_numpy():
+        import numpy
+
+        return numpy.__name__
+
+    outcome = run_limited(load_numpy, max_mem=5)
+    assert outcome.killed
+    assert outcome.error.startswith("MEMORY LIMIT (limit 5 MB): ImportError")
+    assert "peak RSS" in outcome.telemetry()
+
+
+def test_run_limited_memory_errors_by_kind():
+    def fail(error):
+        def run():
+            raise error
+
+        return run
+
+    for error in (
+        RuntimeError("can't start new thread"),
+        OSError(errno.ENOMEM, "Cannot allocate memory"),
+        ValueError("mmap length is greater than file size"),
+        ImportError(""),
+    ):
+        outcome = run_limited(fail(error), max_mem=64)
+        assert outcome.killed, error
+        assert outcome.error.startswith("MEMORY LIMIT (limit 64 MB): "), error
+        # without a memory limit they stay ordinary errors
+        outcome = run_limited(fail(error))
+        assert not outcome.killed
+        assert outcome.error.startswith(type(error).__name__)
+
+    outcome = run_limited(fail(OSError(errno.ENOENT, "missing")), max_mem=64)
+    assert not outcome.killed
+    assert outcome.error.startswith("FileNotFoundError")
+
+
+def test_run_limited_forks_without_other_threads():
+    import threading
+    import warnings
+
+    common.setup_logging()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        outcome = run_limited(
+            lambda: common.setup_logging(name=__name__) and threading.active_count(),
+            max_mem=1,
+        )
+    # the log listener is stopped around fork() and running again afterwards;
+    # the child logs inline, so logging under a tight limit starts no thread
+    assert outcome.result == 1, outcome.error
+    assert threading.active_count() == 2
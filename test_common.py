@@ -0,0 +1,74 @@
+"""Tests for common.py helpers too large to embed in the module itself."""
+
+import logging
+import queue
+
+import numpy as np
+import pytest
+
+from common import DisjointSet, Grid, Stencil, _DeferredQueueHandler, neighbour_counts
+
+
+def test_grid_padded_offsets_and_mask():
+    grid = Grid.from_bytes(b"@.@\r\n.@.\r\n")
+    assert (grid.shape, str(grid)) == ((2, 3), "@.@\n.@.")
+    assert grid.mask("@").tolist() == [[True, False, True], [False, True, False]]
+    assert grid.count("@.") == 6
+    assert grid.find_all("@").tolist() == [[0, 0], [0, 2], [1, 1]]
+    assert grid.neighbour_counts("@").tolist() == [[1, 3, 1], [2, 2, 2]]
+
+    padded = grid.padded("#")
+    assert str(padded) == "#####\n#@.@#\n#.@.#\n#####"
+    centre = padded.index(2, 2)
+    around = [chr(padded.ravel()[centre + step]) for step in padded.offsets()]
+    assert sorted(around) == sorted("@.@..###")
+    assert sorted(padded.offsets(diagonal=False)) == [-5, -1, 1, 5]
+
+    with pytest.raises(ValueError):
+        Grid.from_bytes(b"ab\nc\n")
+
+
+def test_stencil_life_and_peeling():
+    blinker = np.zeros((5, 5), dtype=bool)
+    blinker[2, 1:4] = True
+    life = Stencil(blinker)
+    assert life.step() == 4 and blinker[1:4, 2].all() and blinker.sum() == 3
+    block = np.zeros((4, 4), dtype=bool)
+    block[1:3, 1:3] = True
+    assert Stencil(block).run() == []  # a still life stops at once
+
+    state = np.random.default_rng(0).random((37, 23)) < 0.4
+    whole, blocked = Stencil(state.copy()), Stencil(state.copy())
+    blocked.BLOCK_ROWS = 5  # steps straddle block boundaries
+    assert whole.counts().tolist() == neighbour_counts(state).tolist()
+    assert whole.run(max_steps=10) == blocked.run(max_steps=10)
+    assert (whole.state == blocked.state).all()
+
+    peel = Stencil(state.copy(), survive=range(4, 9), birth=())
+    assert sum(peel.run()) == state.sum() - peel.state.sum()
+    assert (peel.counts()[peel.state] >= 4).all()
+
+
+def test_disjoint_set_union_many():
+    ds = DisjointSet(8)
+    # (2, 0) closes a cycle and (6, 6) is a self-loop: neither merges
+    assert ds.union_many([0, 1, 2, 0, 4, 6], [1, 2, 0, 3, 5, 6]) == [0, 1, 3, 4]
+    assert ds.component_sizes() == [4, 2, 1, 1] and ds.components == 4
+    assert ds.connected(3, 2) and not ds.connected(3, 4)
+    assert ds.union_many(np.array([5, 7, 0, 1]), np.array([7, 6, 4, 2])) == [0, 1, 2]
+    assert ds.component_sizes() == [8]
+
+    n = 200_000
+    chain = DisjointSet(n)
+    assert len(chain.union_many(range(1, n), range(n - 1))) == n - 1
+    assert chain.find(0) == chain.find(n - 1)
+
+
+def test_log_records_are_formatted_by_the_listener():
+    handler = _DeferredQueueHandler(queue.SimpleQueue())
+    record = logging.LogRecord("aoc", logging.INFO, __file__, 1, "n=%d", (5,), None)
+    handler.handle(record)
+    queued = handler.queue.get_nowait()
+    # queued untouched: no message formatted in the thread that logged
+    assert queued is record and (queued.msg, queued.args) == ("n=%d", (5,))
+    assert not hasattr(queued, "message")